@@ -3,13 +3,39 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-import re
+import plotly.io as pio
+import os
+import io
+import hashlib
+import sys
+import time
+import json
+import inspect
+import logging
+import functools
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from collections import Counter
+from collections import Counter, OrderedDict
 import warnings
 from plotly.subplots import make_subplots
 warnings.filterwarnings("ignore")
 
+# Views of the shared catalog must never write through to it; pandas 3 always copies on write
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+from analytics import (
+    CATALOG_PATH, SCORING_PROFILES, DEFAULT_SCORING_PROFILE, QUALITY_TIERS, SIMILAR_TITLES, SPARSE_AVAILABLE,
+    CatalogQuery, default_query, get_backend, load_catalog, process_catalog, build_catalog, freeze_catalog,
+    scored_catalog, view_frame, view_rows, aggregate_catalog_overview, ingest_overview,
+    list_value_counts, catalog_memory_report, load_warmup_presets, warmup_queries, precompute_queries,
+    load_similarity, lookup_similar
+)
+
+# Filter and aggregation engine, chosen with DASHBOARD_BACKEND (pandas or duckdb)
+BACKEND = get_backend()
+
 # ----------------------------
 # Enhanced Color Palettes Definition
 # ----------------------------
@@ -55,6 +81,31 @@ VIBRANT_PALETTES = {
 
 NETFLIX_RED = '#E50914'
 
+# Process-wide LRU cache of chart aggregations, shared by every session
+RESULT_CACHE_MAX_ENTRIES = 4096
+RESULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Render only the selected dashboard section; set DASHBOARD_LAZY_SECTIONS=0 for classic tabs
+LAZY_SECTIONS = os.environ.get('DASHBOARD_LAZY_SECTIONS', '1') != '0'
+
+# Time every stage of each rerun with DASHBOARD_PROFILE=1 or ?profile=1 in the URL
+PROFILE_ENABLED = os.environ.get('DASHBOARD_PROFILE', '0') == '1'
+
+# With DASHBOARD_WARMUP=1, precompute the default view and popular presets in a
+# background thread once the catalog is loaded. Its worker processes each load
+# the full catalog, so every server process starts only a couple of them
+WARMUP_ENABLED = os.environ.get('DASHBOARD_WARMUP', '0') == '1'
+WARMUP_WORKERS = int(os.environ.get('DASHBOARD_WARMUP_WORKERS', '2'))
+
+# Columns listed for the titles matching the sidebar search
+SEARCH_COLUMNS = ['title', 'director', 'type', 'release_year', 'rating', 'country', 'content_score']
+
+# Countries drawn in the co-production network, strongest partners first
+NETWORK_COUNTRIES = 20
+
+# Titles of the current view offered in the Similar Titles picker
+SIMILAR_TITLE_OPTIONS = 1000
+
 # ----------------------------
 # Page config & Netflix-Themed CSS
 # ----------------------------
@@ -350,6 +401,28 @@ div[data-testid="stSidebar"] .stRadio label {
     transform: translateY(-1px);
 }
 
+/* Section Navigator (lazy sections) */
+.st-key-dashboard_section [role="radiogroup"] {
+    gap: 6px;
+    background: #1a1a1a;
+    padding: 0.75rem;
+    border-radius: 12px;
+    border: 1px solid #333333;
+}
+
+.st-key-dashboard_section [role="radiogroup"] label {
+    background-color: #2a2a2a;
+    border-radius: 10px;
+    padding: 0.75rem 1.5rem;
+    border: 1px solid #333333;
+    font-weight: 700;
+}
+
+.st-key-dashboard_section [role="radiogroup"] label:has(input:checked) {
+    background: linear-gradient(135deg, #E50914 0%, #B81D24 100%);
+    border-color: #E50914;
+}
+
 /* Data Table */
 .dataframe {
     background: #1a1a1a;
@@ -605,14 +678,88 @@ hr {
 """, unsafe_allow_html=True)
 
 # ----------------------------
-# Helper Functions
+# Rerun Profiling
 # ----------------------------
-def safe_extract_number(s):
-    if pd.isna(s):
-        return np.nan
-    m = re.search(r"(\d+\.?\d*)", str(s))
-    return float(m.group(1)) if m else np.nan
+# Stage timings are collected per script thread, one list per rerun
+_rerun_profile = threading.local()
+
+def make_logger(name, fmt):
+    """INFO logger writing formatted records to stderr, set up once per process"""
+    logger = logging.getLogger(name)
+    # Streamlit re-executes the script on every rerun; only the first run adds the handler
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter(fmt))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+profile_logger = make_logger('dashboard.profile', '%(message)s')
+
+def start_rerun_profile(enabled):
+    """Begin collecting stage timings for this rerun, or switch collection off"""
+    _rerun_profile.stages = [] if enabled else None
+    _rerun_profile.started = time.perf_counter()
+
+@contextmanager
+def profile_stage(name, rows=None):
+    """Time a named stage; the yielded record can be annotated with rows or cache state"""
+    record = {'stage': name, 'rows': rows}
+    stages = getattr(_rerun_profile, 'stages', None)
+    if stages is None:
+        yield record
+        return
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record['offset_ms'] = (start - _rerun_profile.started) * 1000
+        record['ms'] = (time.perf_counter() - start) * 1000
+        stages.append(record)
+
+def profiled(kind):
+    """Time a figure builder as '<kind>:<title>' with the number of rows it plots"""
+    def decorate(func):
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if getattr(_rerun_profile, 'stages', None) is None:
+                return func(*args, **kwargs)
+            arguments = signature.bind(*args, **kwargs).arguments
+            data = next(iter(arguments.values()))
+            rows = None if isinstance(data, go.Figure) else len(data)
+            with profile_stage(f"{kind}:{arguments.get('title') or func.__name__}", rows):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def render_chart(figure_id, signature, build):
+    """Send a chart to the browser; the finished figure is built once per filter set and shared"""
+    fig = cached_result(f'figure:{figure_id}', signature, build)
+    with profile_stage(f'render:{fig.layout.title.text or "chart"}'):
+        st.plotly_chart(fig, use_container_width=True)
+
+def finish_rerun_profile():
+    """Log the rerun's stage timings as one JSON line and return them, or None when off"""
+    stages = getattr(_rerun_profile, 'stages', None)
+    if stages is None:
+        return None
+    total_ms = (time.perf_counter() - _rerun_profile.started) * 1000
+    stages = sorted(stages, key=lambda record: record['offset_ms'])
+    profile_logger.info(json.dumps({
+        'event': 'dashboard_rerun',
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'total_ms': round(total_ms, 3),
+        'stages': [{key: round(value, 3) if isinstance(value, float) else value
+                    for key, value in record.items()} for record in stages]
+    }, default=int))
+    return total_ms, stages
 
+# ----------------------------
+# Helper Functions
+# ----------------------------
 def create_metric_card(label, value, change=None, icon="📊"):
     """Create Netflix-style metric card"""
     if change is not None:
@@ -633,84 +780,67 @@ def create_metric_card(label, value, change=None, icon="📊"):
     </div>
     """
 
+# Netflix styling, merged onto Plotly's default template once at import;
+# each figure then only sets its title, size and legend visibility
+NETFLIX_FONT = "'Netflix Sans', 'Helvetica Neue', Helvetica, Arial, sans-serif"
+NETFLIX_AXIS = dict(
+    gridcolor='rgba(80, 80, 80, 0.3)',
+    gridwidth=1,
+    zerolinecolor='rgba(80, 80, 80, 0.3)',
+    linecolor='rgba(229, 9, 20, 0.5)',
+    tickfont=dict(color='white', size=11),
+    title_font=dict(color='white', size=13, weight='bold'),
+    showgrid=True,
+    ticks="outside",
+    tickcolor='#E50914',
+    linewidth=2
+)
+pio.templates['netflix'] = pio.templates.merge_templates('plotly', go.layout.Template(layout=dict(
+    plot_bgcolor='rgba(26, 26, 26, 0.7)',
+    paper_bgcolor='rgba(26, 26, 26, 0.7)',
+    font=dict(family=NETFLIX_FONT, color='white', size=12),
+    title=dict(
+        font=dict(family=NETFLIX_FONT, size=20, color='white', weight='bold'),
+        x=0.5,
+        y=0.95,
+        xanchor='center'
+    ),
+    hovermode='closest',
+    hoverlabel=dict(
+        bgcolor='#E50914',
+        font_size=12,
+        font_family="'Netflix Sans', sans-serif",
+        font_color='white'
+    ),
+    autosize=True,
+    legend=dict(
+        bgcolor='rgba(26, 26, 26, 0.9)',
+        bordercolor='#E50914',
+        borderwidth=2,
+        font=dict(color='white', size=11),
+        orientation="h",
+        yanchor="bottom",
+        y=1.02,
+        xanchor="right",
+        x=1
+    ),
+    xaxis=NETFLIX_AXIS,
+    yaxis=NETFLIX_AXIS
+)))
+
+@profiled('theme')
 def apply_vibrant_theme(fig, title=None, height=None, showlegend=True):
     """Apply vibrant theme to plotly chart"""
     fig.update_layout(
-        plot_bgcolor='rgba(26, 26, 26, 0.7)',
-        paper_bgcolor='rgba(26, 26, 26, 0.7)',
-        font=dict(
-            family="'Netflix Sans', 'Helvetica Neue', Helvetica, Arial, sans-serif",
-            color='white',
-            size=12
-        ),
-        title=dict(
-            text=title,
-            font=dict(
-                family="'Netflix Sans', 'Helvetica Neue', Helvetica, Arial, sans-serif",
-                size=20,
-                color='white',
-                weight='bold'
-            ),
-            x=0.5,
-            y=0.95,
-            xanchor='center'
-        ) if title else None,
-        hovermode='closest',
-        hoverlabel=dict(
-            bgcolor='#E50914',
-            font_size=12,
-            font_family="'Netflix Sans', sans-serif",
-            font_color='white'
-        ),
+        template='netflix',
+        **({'title_text': title} if title else {}),
         margin=dict(l=50, r=50, t=100 if title else 50, b=80),
         height=height or 450,
-        autosize=True,
         showlegend=showlegend
     )
-    
-    if showlegend:
-        fig.update_layout(
-            legend=dict(
-                bgcolor='rgba(26, 26, 26, 0.9)',
-                bordercolor='#E50914',
-                borderwidth=2,
-                font=dict(color='white', size=11),
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
-        )
-    
-    fig.update_xaxes(
-        gridcolor='rgba(80, 80, 80, 0.3)',
-        gridwidth=1,
-        zerolinecolor='rgba(80, 80, 80, 0.3)',
-        linecolor='rgba(229, 9, 20, 0.5)',
-        tickfont=dict(color='white', size=11),
-        title_font=dict(color='white', size=13, weight='bold'),
-        showgrid=True,
-        ticks="outside",
-        tickcolor='#E50914',
-        linewidth=2
-    )
-    
-    fig.update_yaxes(
-        gridcolor='rgba(80, 80, 80, 0.3)',
-        gridwidth=1,
-        zerolinecolor='rgba(80, 80, 80, 0.3)',
-        linecolor='rgba(229, 9, 20, 0.5)',
-        tickfont=dict(color='white', size=11),
-        title_font=dict(color='white', size=13, weight='bold'),
-        showgrid=True,
-        ticks="outside",
-        tickcolor='#E50914',
-        linewidth=2
-    )
-    
     return fig
 
+@profiled('figure')
 def create_vibrant_bar_chart(df, x_col, y_col, title, palette='vibrant', height=400, showlegend=False):
     """Create vibrant bar chart with visible data"""
     colors = VIBRANT_PALETTES.get(palette, VIBRANT_PALETTES['vibrant'])
@@ -730,6 +860,7 @@ def create_vibrant_bar_chart(df, x_col, y_col, title, palette='vibrant', height=
     
     return apply_vibrant_theme(fig, title, height, showlegend=showlegend)
 
+@profiled('figure')
 def create_vibrant_line_chart(df, x_col, y_col, title, palette='neon_gradient', height=400, showlegend=False):
     """Create vibrant line chart"""
     colors = VIBRANT_PALETTES.get(palette, VIBRANT_PALETTES['neon_gradient'])
@@ -745,6 +876,7 @@ def create_vibrant_line_chart(df, x_col, y_col, title, palette='neon_gradient',
     
     return apply_vibrant_theme(fig, title, height, showlegend=showlegend)
 
+@profiled('figure')
 def create_vibrant_pie_chart(labels, values, title, palette='rainbow', height=400):
     """Create vibrant pie chart with visible labels"""
     colors = VIBRANT_PALETTES.get(palette, VIBRANT_PALETTES['rainbow'])
@@ -785,17 +917,25 @@ def create_vibrant_pie_chart(labels, values, title, palette='rainbow', height=40
     
     return fig
 
-def create_vibrant_histogram(df, x_col, title, palette='jewel_bright', height=400, showlegend=False):
-    """Create vibrant histogram"""
+@profiled('figure')
+def create_vibrant_histogram(bins, x_label, title, palette='jewel_bright', height=400, showlegend=False):
+    """Create vibrant histogram from server-side bins (bin_start, bin_end, count)"""
     colors = VIBRANT_PALETTES.get(palette, VIBRANT_PALETTES['jewel_bright'])
     
-    fig = px.histogram(df, x=x_col, nbins=20, title=title)
+    # Only one bar per bin is serialized, however many titles were binned
+    fig = go.Figure(go.Bar(
+        x=(bins['bin_start'] + bins['bin_end']) / 2,
+        y=bins['count'],
+        width=bins['bin_end'] - bins['bin_start'],
+        customdata=bins[['bin_start', 'bin_end']]
+    ))
+    fig.update_layout(bargap=0, xaxis_title=x_label, yaxis_title='count')
     
     fig.update_traces(
         marker_color=colors[0],
         marker_line_color='white',
         marker_line_width=1.5,
-        hovertemplate='<b>Range: %{x}</b><br>Count: %{y}<extra></extra>',
+        hovertemplate='<b>Range: %{customdata[0]:g}-%{customdata[1]:g}</b><br>Count: %{y}<extra></extra>',
         texttemplate='%{y}',
         textposition='inside',
         textfont=dict(color='white', size=10, weight='bold')
@@ -803,6 +943,48 @@ def create_vibrant_histogram(df, x_col, title, palette='jewel_bright', height=40
     
     return apply_vibrant_theme(fig, title, height, showlegend=showlegend)
 
+@profiled('figure')
+def create_network_chart(pairs, title, palette='ocean_waves', height=600, max_countries=NETWORK_COUNTRIES):
+    """Create circular network chart from (country_a, country_b, titles) edges"""
+    colors = VIBRANT_PALETTES.get(palette, VIBRANT_PALETTES['ocean_waves'])
+    
+    # Each country's total co-produced titles ranks and sizes the nodes
+    strength = pd.concat([pairs.set_index('country_a')['titles'], pairs.set_index('country_b')['titles']])
+    strength = strength.groupby(level=0).sum().sort_values(ascending=False).head(max_countries)
+    edges = pairs[pairs['country_a'].isin(strength.index) & pairs['country_b'].isin(strength.index)]
+    angles = np.linspace(0, 2 * np.pi, len(strength), endpoint=False)
+    x = pd.Series(np.cos(angles), index=strength.index)
+    y = pd.Series(np.sin(angles), index=strength.index)
+    
+    fig = go.Figure()
+    # Edges are grouped into a few width classes, one line trace each
+    widths = np.ceil(edges['titles'] / edges['titles'].max() * 5).astype(int)
+    for width, group in edges.groupby(widths):
+        fig.add_trace(go.Scatter(
+            x=np.column_stack([x[group['country_a']], x[group['country_b']], np.full(len(group), np.nan)]).ravel(),
+            y=np.column_stack([y[group['country_a']], y[group['country_b']], np.full(len(group), np.nan)]).ravel(),
+            mode='lines',
+            line=dict(width=width * 1.5, color=colors[width % len(colors)]),
+            opacity=0.35 + width * 0.1,
+            hoverinfo='skip'
+        ))
+    fig.add_trace(go.Scatter(
+        x=x, y=y,
+        mode='markers+text',
+        text=strength.index,
+        textposition=['middle right' if value >= 0 else 'middle left' for value in x],
+        textfont=dict(color='white', size=11, weight='bold'),
+        marker=dict(size=12 + 30 * np.sqrt(strength / strength.max()), color=NETFLIX_RED,
+                    line=dict(width=2, color='white')),
+        customdata=strength.values,
+        hovertemplate='<b>%{text}</b><br>Co-produced titles: %{customdata}<extra></extra>'
+    ))
+    fig.update_xaxes(visible=False, range=[-1.6, 1.6])
+    fig.update_yaxes(visible=False, range=[-1.25, 1.25])
+    
+    return apply_vibrant_theme(fig, title, height, showlegend=False)
+
+@profiled('figure')
 def create_vibrant_area_chart(df, x_col, y_col, title, palette='fire', height=400, showlegend=False):
     """Create vibrant area chart"""
     colors = VIBRANT_PALETTES.get(palette, VIBRANT_PALETTES['fire'])
@@ -821,438 +1003,270 @@ def create_vibrant_area_chart(df, x_col, y_col, title, palette='fire', height=40
     
     return apply_vibrant_theme(fig, title, height, showlegend=showlegend)
 
-def calculate_content_score(row):
-    """Calculate Netflix-style content quality score"""
-    score = 0
-    
-    if not pd.isna(row.get('content_age')):
-        age_score = max(0, 100 - (row['content_age'] * 1.5))
-        score += age_score * 0.35
-    
-    if row['type'] == 'Movie' and not pd.isna(row.get('movie_minutes')):
-        duration = row['movie_minutes']
-        if 90 <= duration <= 120:
-            score += 40
-        elif 75 <= duration < 90 or 120 < duration <= 150:
-            score += 30
-        else:
-            score += 20
-    elif row['type'] == 'TV Show' and not pd.isna(row.get('tv_seasons')):
-        seasons = row['tv_seasons']
-        if 2 <= seasons <= 4:
-            score += 40
-        elif 1 == seasons or 5 <= seasons <= 6:
-            score += 30
-        else:
-            score += 20
-    
-    rating_scores = {
-        'TV-MA': 35, 'TV-14': 30, 'R': 30,
-        'TV-PG': 25, 'PG-13': 25, 'PG': 20
-    }
-    score += rating_scores.get(str(row.get('rating', '')), 15)
-    
-    return min(100, max(0, int(score)))
-
 # ----------------------------
 # Load and Preprocess Data - ONLY netflix_cleaned.csv
 # ----------------------------
-@st.cache_data
+@st.cache_resource(show_spinner="Loading catalog...")
+def shared_catalog(path):
+    """Processed catalog and indexes held once per process and shared read-only by every session"""
+    return freeze_catalog(load_catalog(path))
+
+@st.cache_resource(show_spinner="Processing uploaded catalog...")
+def shared_uploaded_catalog(fingerprint, _data):
+    """Shared catalog for an uploaded CSV, keyed by the hash of its bytes"""
+    return freeze_catalog(build_catalog(process_catalog(pd.read_csv(io.BytesIO(_data))), fingerprint))
+
+@st.cache_resource(show_spinner="Building similar-titles index...")
+def shared_similarity(fingerprint, _catalog):
+    """Similarity features and any precomputed neighbour table, built once per process"""
+    return load_similarity(_catalog, CATALOG_PATH)
+
+@st.cache_resource(show_spinner="Rescoring catalog...", max_entries=len(SCORING_PROFILES))
+def shared_scored_catalog(fingerprint, profile, rules, _catalog):
+    """Frame, filter index and cube rescored with a non-default profile, shared by every session"""
+    # Kept apart from the chart result LRU: most of its memory is the base catalog's
+    return freeze_catalog(scored_catalog(_catalog, profile))
+
 def load_and_process_data():
     try:
-        df = pd.read_csv("netflix_cleaned.csv")
-        st.success("✅ Successfully loaded netflix_cleaned.csv")
+        catalog = shared_catalog(CATALOG_PATH)
+        if WARMUP_ENABLED:
+            start_warmup(CATALOG_PATH, catalog['fingerprint'], catalog)
+        if catalog['from_cache']:
+            st.success(f"✅ Loaded processed {CATALOG_PATH} from cache")
+        elif catalog.get('ingest'):
+            # Streaming already totalled the catalog under the default profile; no rescan for the overview
+            store_result('catalog_overview', (catalog['fingerprint'], DEFAULT_SCORING_PROFILE),
+                         ingest_overview(catalog['ingest']))
+            st.success(f"✅ Streamed {catalog['ingest']['rows']:,} titles of {CATALOG_PATH} "
+                       f"in {catalog['ingest']['chunks']:,} chunks")
+        else:
+            st.success(f"✅ Successfully loaded {CATALOG_PATH}")
+        return catalog
     except FileNotFoundError:
-        st.error("❌ 'netflix_cleaned.csv' file not found. Please ensure the file is in the same directory.")
+        st.error(f"❌ '{CATALOG_PATH}' file not found. Please ensure the file is in the same directory.")
         uploaded_file = st.file_uploader("📂 Upload Netflix CSV file", type=["csv"])
-        if uploaded_file is not None:
-            df = pd.read_csv(uploaded_file)
-        else:
+        if uploaded_file is None:
             st.stop()
-    
-    df.columns = [c.strip().lower().replace(' ', '_') for c in df.columns]
-    
-    column_mapping = {
-        'type': ['type', 'content_type', 'show_type'],
-        'title': ['title', 'name', 'show_title'],
-        'release_year': ['release_year', 'year', 'release_date'],
-        'rating': ['rating', 'content_rating', 'age_rating'],
-        'duration': ['duration', 'run_time', 'length'],
-        'country': ['country', 'countries', 'country_of_origin'],
-        'listed_in': ['listed_in', 'genres', 'genre', 'category'],
-        'date_added': ['date_added', 'added_date', 'netflix_added_date'],
-        'director': ['director', 'directors']
-    }
-    
-    for standard_name, possible_names in column_mapping.items():
-        for possible in possible_names:
-            if possible in df.columns:
-                df.rename(columns={possible: standard_name}, inplace=True)
-                break
-    
-    expected = ['type', 'title', 'release_year', 'rating', 'duration', 'country', 'listed_in']
-    for col in expected:
-        if col not in df.columns:
-            df[col] = np.nan
-    
-    df['type'] = df['type'].fillna("Unknown").astype(str).str.strip()
-    df['title'] = df['title'].fillna("").astype(str).str.strip()
-    
-    df['type'] = df['type'].replace({
-        'Movie': 'Movie',
-        'movie': 'Movie',
-        'MOVIE': 'Movie',
-        'TV Show': 'TV Show',
-        'TV show': 'TV Show',
-        'TV SHOW': 'TV Show',
-        'Tv Show': 'TV Show',
-        'Series': 'TV Show',
-        'TV Series': 'TV Show'
-    })
-    
-    df['date_added'] = pd.to_datetime(df['date_added'], errors='coerce', dayfirst=False)
-    df['release_year'] = pd.to_numeric(df['release_year'], errors='coerce')
-    df['duration_num'] = df['duration'].apply(safe_extract_number)
-    
-    def extract_seasons(duration_text):
-        if pd.isna(duration_text):
-            return np.nan
-        text = str(duration_text).lower()
-        if 'season' in text:
-            return safe_extract_number(text)
-        return np.nan
-    
-    def extract_minutes(duration_text):
-        if pd.isna(duration_text):
-            return np.nan
-        text = str(duration_text).lower()
-        if 'min' in text:
-            return safe_extract_number(text)
-        return np.nan
-    
-    df['movie_minutes'] = df['duration'].apply(extract_minutes)
-    df['tv_seasons'] = df['duration'].apply(extract_seasons)
-    
-    df['genre_list'] = df['listed_in'].fillna("").apply(
-        lambda x: [g.strip() for g in str(x).split(",") if g.strip()])
-    
-    df['country_list'] = df['country'].fillna("").apply(
-        lambda x: [c.strip() for c in str(x).split(",") if c.strip()])
-    
-    df['year_added'] = df['date_added'].dt.year
-    df['month_added'] = df['date_added'].dt.month
-    df['quarter_added'] = df['date_added'].dt.quarter
-    df['content_age'] = datetime.now().year - df['release_year']
-    df['decade'] = (df['release_year'] // 10) * 10
-    
-    df['content_score'] = df.apply(calculate_content_score, axis=1)
-    
-    df['quality_category'] = pd.cut(df['content_score'], 
-                                    bins=[0, 40, 70, 85, 100],
-                                    labels=['Basic', 'Standard', 'Premium', 'Ultra'])
-    
-    month_names = ['January', 'February', 'March', 'April', 'May', 'June',
-                   'July', 'August', 'September', 'October', 'November', 'December']
-    df['month_name'] = df['month_added'].apply(lambda x: month_names[int(x)-1] if not pd.isna(x) and 1 <= x <= 12 else 'Unknown')
-    
-    return df
+        data = uploaded_file.getvalue()
+        return shared_uploaded_catalog(hashlib.sha256(data).hexdigest()[:16], data)
 
 # ----------------------------
-# Main App
+# Shared Result Cache
 # ----------------------------
-def main():
-    df = load_and_process_data()
-    
-    # Calculate global metrics for display
-    total_titles_all = len(df)
-    movies_all = (df['type'] == 'Movie').sum()
-    tv_shows_all = (df['type'] == 'TV Show').sum()
-    unique_countries_all = df['country_list'].explode().nunique()
-    avg_content_score = df['content_score'].mean()
-    
-    # Netflix Header
-    st.markdown(f"""
-    <div class="header-container">
-        <h1 class="header-title">🎬 NETFLIX CONTENT ANALYTICS</h1>
-        <p class="header-sub">Interactive Dashboard | Comprehensive Content Analysis</p>
-        <div style="display: flex; flex-wrap: wrap; gap: 1rem; margin-top: 2rem;">
-            <span class="metric-badge">📊 {total_titles_all:,} TOTAL TITLES</span>
-            <span class="metric-badge">🎥 {movies_all:,} MOVIES</span>
-            <span class="metric-badge">📺 {tv_shows_all:,} TV SHOWS</span>
-            <span class="metric-badge">🌍 {unique_countries_all:,} COUNTRIES</span>
-            <span class="metric-badge">⭐ {avg_content_score:.0f}/100 AVG SCORE</span>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Sidebar Filters
-    with st.sidebar:
-        st.markdown('<div class="filter-header">🔍 FILTER CONTENT</div>', unsafe_allow_html=True)
-        
-        type_options = ['All'] + sorted(df['type'].dropna().unique().tolist())
-        selected_type = st.multiselect(
-            "Content Type",
-            options=type_options[1:],
-            default=['Movie', 'TV Show'] if 'Movie' in type_options and 'TV Show' in type_options else type_options[1:3]
-        )
-        
-        min_year = int(df['release_year'].min()) if not df['release_year'].isna().all() else 1900
-        max_year = int(df['release_year'].max()) if not df['release_year'].isna().all() else datetime.now().year
-        year_range = st.slider(
-            "Release Year Range",
-            min_year, max_year,
-            (max(min_year, 2000), max_year)
-        )
-        
-        quality_options = ['All', 'Ultra (85-100)', 'Premium (70-85)', 'Standard (40-70)', 'Basic (0-40)']
-        selected_quality = st.selectbox("Quality Tier", options=quality_options, index=0)
-        
-        # FIX FOR RATING ERROR - SIMPLIFIED SOLUTION
-        # Get the actual ratings available in the data
-        available_ratings = sorted(df['rating'].dropna().unique().tolist())
-        
-        # Don't set any default ratings - let user choose from what's available
-        selected_rating = st.multiselect(
-            "Content Rating",
-            options=available_ratings,
-            default=[]  # NO DEFAULT VALUES - EMPTY LIST
-        )
+@st.cache_resource
+def get_result_cache():
+    """Process-wide LRU of chart aggregations shared by every session"""
+    return {'entries': OrderedDict(), 'bytes': 0, 'hits': 0, 'misses': 0,
+            'evictions': 0, 'lock': threading.Lock()}
+
+def figure_data_size(value):
+    """Approximate bytes of figure properties: array nbytes, or a list's length times its first item"""
+    if isinstance(value, dict):
+        return sum(figure_data_size(v) for v in value.values())
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        return value.nbytes
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return sys.getsizeof(value) + (len(value) * figure_data_size(value[0]) if len(value) else 0)
+    return sys.getsizeof(value)
+
+def result_size(result):
+    """Approximate memory held by a cached aggregation or figure"""
+    if isinstance(result, go.Figure):
+        # Each figure holds its trace data and its own copy of the template; serializing them would cost a render
+        parts = [trace.to_plotly_json() for trace in result.data] + [result.layout.to_plotly_json()]
+        return sum(figure_data_size(part) for part in parts)
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return int(np.sum(result.memory_usage(deep=True)))
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, dict):
+        return sys.getsizeof(result) + sum(result_size(v) for v in result.values())
+    return sys.getsizeof(result)
+
+def cached_result(chart_id, signature, compute):
+    """Return a cached aggregation, computing and storing it on a miss"""
+    cache = get_result_cache()
+    key = (chart_id, signature)
+    with cache['lock']:
+        if key in cache['entries']:
+            cache['entries'].move_to_end(key)
+            cache['hits'] += 1
+            return cache['entries'][key][0]
+        cache['misses'] += 1
+    
+    return store_result(chart_id, signature, compute())
+
+def store_result(chart_id, signature, result):
+    """Add an aggregation to the shared result cache, evicting the least recently used"""
+    cache = get_result_cache()
+    key = (chart_id, signature)
+    size = result_size(result)
+    if size > RESULT_CACHE_MAX_BYTES:
+        return result
+    
+    with cache['lock']:
+        if key not in cache['entries']:
+            cache['entries'][key] = (result, size)
+            cache['bytes'] += size
+        while (len(cache['entries']) > RESULT_CACHE_MAX_ENTRIES
+               or cache['bytes'] > RESULT_CACHE_MAX_BYTES):
+            _, (_, evicted_size) = cache['entries'].popitem(last=False)
+            cache['bytes'] -= evicted_size
+            cache['evictions'] += 1
+    return result
+
+def result_cache_stats():
+    """Entry count, memory and hit/miss counters of the shared result cache"""
+    cache = get_result_cache()
+    with cache['lock']:
+        return {key: cache[key] for key in ('hits', 'misses', 'evictions', 'bytes')} | {
+            'entries': len(cache['entries'])}
+
+warmup_logger = make_logger('dashboard.warmup', '%(asctime)s %(name)s %(message)s')
+
+def warm_result_cache(path, fingerprint, catalog):
+    """Fill the shared result cache with the startup views, storing each view as it finishes"""
+    started = time.perf_counter()
+    try:
+        queries = warmup_queries(catalog, load_warmup_presets())
+        warmup_logger.info(f"warm-up: {len(queries)} views x {len(BACKEND['aggregations'])} charts")
+        for done, (query, results, seconds) in enumerate(precompute_queries(path, queries, WARMUP_WORKERS), 1):
+            for chart_id, result in results.items():
+                store_result(chart_id, query.signature(fingerprint), result)
+            warmup_logger.info(f"warm-up: {done}/{len(queries)} in {time.perf_counter() - started:.1f}s "
+                               f"({seconds * 1000:.0f} ms) {query}")
+    except Exception:
+        # A failed warm-up only means colder caches; the dashboard still serves
+        warmup_logger.exception("warm-up failed")
+        return
+    stats = result_cache_stats()
+    warmup_logger.info(f"warm-up: done in {time.perf_counter() - started:.1f}s, {stats['entries']:,} cached "
+                       f"results, {stats['bytes'] / 1024 / 1024:.1f} MB")
+
+@st.cache_resource(show_spinner=False)
+def start_warmup(path, fingerprint, _catalog):
+    """Start the warm-up in a background thread, once per process and catalog"""
+    # Sessions keep rendering meanwhile; views not yet warmed are computed on demand
+    thread = threading.Thread(target=warm_result_cache, args=(path, fingerprint, _catalog),
+                              name='dashboard-warmup', daemon=True)
+    thread.start()
+    return thread
+
+def chart_data(chart_id, view, signature):
+    """Aggregation for one chart, served from the shared result cache"""
+    with profile_stage(f'aggregate:{chart_id}') as record:
+        record['cached'] = True
         
-        try:
-            all_genres = sorted(set([g for sublist in df['genre_list'] for g in sublist]))
-            
-            # Don't set any default genres
-            selected_genres = st.multiselect(
-                "Genres",
-                options=all_genres,
-                default=[],  # NO DEFAULT VALUES - EMPTY LIST
-                max_selections=5
-            )
-        except:
-            selected_genres = []
+        def compute():
+            record['cached'] = False
+            result = BACKEND['aggregations'][chart_id](view)
+            record['rows'] = view_rows(view)
+            return result
         
-        try:
-            top_countries = df['country_list'].explode().value_counts().head(20).index.tolist()
-            
-            # Don't set any default countries
-            selected_countries = st.multiselect(
-                "Countries",
-                options=top_countries,
-                default=[]  # NO DEFAULT VALUES - EMPTY LIST
-            )
-        except:
-            selected_countries = []
-    
-    # Apply Filters
-    filtered_df = df.copy()
-    
-    if selected_type and 'All' not in selected_type:
-        filtered_df = filtered_df[filtered_df['type'].isin(selected_type)]
-    
-    filtered_df = filtered_df[
-        (filtered_df['release_year'] >= year_range[0]) & 
-        (filtered_df['release_year'] <= year_range[1])
-    ]
-    
-    if selected_quality != 'All':
-        quality_map = {
-            'Ultra (85-100)': (85, 100),
-            'Premium (70-85)': (70, 85),
-            'Standard (40-70)': (40, 70),
-            'Basic (0-40)': (0, 40)
-        }
-        if selected_quality in quality_map:
-            min_score, max_score = quality_map[selected_quality]
-            filtered_df = filtered_df[
-                (filtered_df['content_score'] >= min_score) & 
-                (filtered_df['content_score'] <= max_score)
-            ]
-    
-    if selected_rating:  # Only apply rating filter if user selected something
-        filtered_df = filtered_df[filtered_df['rating'].isin(selected_rating)]
-    
-    if selected_genres:
-        filtered_df = filtered_df[
-            filtered_df['genre_list'].apply(
-                lambda x: any(genre in x for genre in selected_genres) if x else False
-            )
-        ]
-    
-    if selected_countries:
-        filtered_df = filtered_df[
-            filtered_df['country_list'].apply(
-                lambda x: any(country in x for country in selected_countries) if x else False
-            )
-        ]
-    
-    # KPI Metrics
-    st.markdown("""
-    <div class="section-header">
-        <h3 class="section-title">📊 CONTENT OVERVIEW</h3>
-        <p class="section-subtitle">Key metrics for filtered content</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2, col3, col4, col5 = st.columns(5)
+        return cached_result(chart_id, signature, compute)
+
+# ----------------------------
+# Dashboard Sections
+# ----------------------------
+def render_trends_section(view, signature, overview):
+    """Render the Trends & Growth charts"""
+    st.markdown("### 📈 Content Trends & Growth Analysis")
     
+    # Chart 1: Yearly Content Additions - Area Chart
+    col1, col2 = st.columns(2)
     with col1:
-        total_titles = len(filtered_df)
-        pct_of_total = (total_titles / total_titles_all * 100) if total_titles_all > 0 else 0
-        st.markdown(create_metric_card("Titles in View", f"{total_titles:,}", change=pct_of_total, icon="🎬"), unsafe_allow_html=True)
+        st.markdown("#### 📈 Yearly Content Additions")
+        yearly_additions = chart_data('yearly_additions', view, signature)
+        if not yearly_additions.empty and len(yearly_additions) > 1:
+            render_chart('yearly_additions', signature, lambda: create_vibrant_area_chart(
+                yearly_additions,
+                'year_added',
+                'count',
+                "Content Additions by Year",
+                palette='fire',
+                height=450,
+                showlegend=False
+            ))
+        else:
+            st.info("Insufficient date data")
+        st.markdown('</div>', unsafe_allow_html=True)
     
+    # Chart 2: Monthly Patterns - Bar Chart
     with col2:
-        movies = (filtered_df['type'] == 'Movie').sum()
-        movies_pct = (movies / total_titles * 100) if total_titles > 0 else 0
-        st.markdown(create_metric_card("Movies", f"{movies:,}", change=movies_pct, icon="🎥"), unsafe_allow_html=True)
-    
-    with col3:
-        tv_shows = (filtered_df['type'] == 'TV Show').sum()
-        tv_pct = (tv_shows / total_titles * 100) if total_titles > 0 else 0
-        st.markdown(create_metric_card("TV Shows", f"{tv_shows:,}", change=tv_pct, icon="📺"), unsafe_allow_html=True)
-    
-    with col4:
-        avg_score = filtered_df['content_score'].mean()
-        avg_score_all = df['content_score'].mean()
-        change = ((avg_score - avg_score_all) / avg_score_all * 100) if avg_score_all > 0 else 0
-        st.markdown(create_metric_card("Avg Quality Score", f"{avg_score:.0f}/100", change=change, icon="⭐"), unsafe_allow_html=True)
-    
-    with col5:
-        unique_countries = filtered_df['country_list'].explode().nunique()
-        unique_countries_all = df['country_list'].explode().nunique()
-        change = ((unique_countries - unique_countries_all) / unique_countries_all * 100) if unique_countries_all > 0 else 0
-        st.markdown(create_metric_card("Countries", f"{unique_countries}", change=change, icon="🌍"), unsafe_allow_html=True)
-    
-    st.info(f"**Showing {len(filtered_df):,} titles** ({len(filtered_df)/len(df)*100:.1f}% of total library)")
-    
-    # Calculate metrics needed for each tab
-    # Tab 2: TV Show metrics
-    tv_shows_df = filtered_df[filtered_df['type'] == 'TV Show']
-    total_tv_shows = len(tv_shows_df)
-    avg_seasons = tv_shows_df['tv_seasons'].mean() if not tv_shows_df.empty else 0
-    max_seasons = tv_shows_df['tv_seasons'].max() if not tv_shows_df.empty else 0
-    tv_percentage = (total_tv_shows / total_titles * 100) if total_titles > 0 else 0
-    
-    # Tab 4: Quality metrics
-    quality_scores = filtered_df['content_score'].dropna()
-    quality_range = quality_scores.max() - quality_scores.min()
-    avg_quality = quality_scores.mean()
-    min_quality = quality_scores.min()
-    max_quality = quality_scores.max()
+        st.markdown("#### 📅 Monthly Addition Patterns")
+        monthly_counts = chart_data('monthly_counts', view, signature)
+        if monthly_counts.sum() > 0:
+            monthly_df = pd.DataFrame({'month': range(1, 13)})
+            monthly_df['count'] = monthly_df['month'].map(monthly_counts).fillna(0)
+            monthly_df['month_name'] = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+            
+            render_chart('monthly_counts', signature, lambda: create_vibrant_bar_chart(
+                monthly_df,
+                'month_name',
+                'count',
+                "Content Additions by Month",
+                palette='cyberpunk',
+                height=450,
+                showlegend=False
+            ))
+        else:
+            st.info("No monthly data")
+        st.markdown('</div>', unsafe_allow_html=True)
     
-    # Tab 4: Content Type metrics
-    total_movies = movies
-    total_tv_shows_global = tv_shows
-    movie_percentage = (total_movies / total_titles * 100) if total_titles > 0 else 0
-    tv_percentage_global = (total_tv_shows_global / total_titles * 100) if total_titles > 0 else 0
+    # Chart 3: Release Trends by Decade - Line Chart
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("#### 🗓️ Release Trends by Decade")
+        decade_counts = chart_data('decade_counts', view, signature)
+        if not decade_counts.empty:
+            decade_df = pd.DataFrame({
+                'decade': decade_counts.index.astype(str),
+                'count': decade_counts.values
+            })
+            render_chart('decade_counts', signature, lambda: create_vibrant_line_chart(
+                decade_df,
+                'decade',
+                'count',
+                "Content Release by Decade",
+                palette='electric',
+                height=450,
+                showlegend=False
+            ))
+        else:
+            st.info("No decade data")
+        st.markdown('</div>', unsafe_allow_html=True)
     
-    # 15 VIBRANT CHARTS IN TABS
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "📈 TRENDS & GROWTH", 
-        "🎭 GENRE & CONTENT", 
-        "🌍 GEOGRAPHY", 
-        "⚡ QUALITY & RATINGS"
-    ])
+    # Chart 4: Quarterly Additions - Bar Chart
+    with col2:
+        st.markdown("#### 📊 Quarterly Content Additions")
+        quarterly_counts = chart_data('quarterly_counts', view, signature)
+        if not quarterly_counts.empty:
+            render_chart('quarterly_counts', signature, lambda: create_vibrant_bar_chart(
+                quarterly_counts,
+                'quarter_added',
+                'count',
+                "Content Additions by Quarter",
+                palette='jewel_bright',
+                height=450,
+                showlegend=False
+            ))
+        else:
+            st.info("No quarterly data")
+        st.markdown('</div>', unsafe_allow_html=True)
     
-    with tab1:
-        st.markdown("### 📈 Content Trends & Growth Analysis")
-        
-        # Chart 1: Yearly Content Additions - Area Chart
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("#### 📈 Yearly Content Additions")
-            yearly_additions = filtered_df.groupby('year_added').size().reset_index(name='count').sort_values('year_added')
-            if not yearly_additions.empty and len(yearly_additions) > 1:
-                fig1 = create_vibrant_area_chart(
-                    yearly_additions,
-                    'year_added',
-                    'count',
-                    "Content Additions by Year",
-                    palette='fire',
-                    height=450,
-                    showlegend=False
-                )
-                st.plotly_chart(fig1, use_container_width=True)
-            else:
-                st.info("Insufficient date data")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Chart 2: Monthly Patterns - Bar Chart
-        with col2:
-            st.markdown("#### 📅 Monthly Addition Patterns")
-            if filtered_df['month_added'].notna().any():
-                monthly_counts = filtered_df['month_added'].value_counts().sort_index()
-                monthly_df = pd.DataFrame({'month': range(1, 13)})
-                monthly_df['count'] = monthly_df['month'].map(monthly_counts).fillna(0)
-                monthly_df['month_name'] = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                                          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-                
-                fig2 = create_vibrant_bar_chart(
-                    monthly_df,
-                    'month_name',
-                    'count',
-                    "Content Additions by Month",
-                    palette='cyberpunk',
-                    height=450,
-                    showlegend=False
-                )
-                st.plotly_chart(fig2, use_container_width=True)
-            else:
-                st.info("No monthly data")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Chart 3: Release Trends by Decade - Line Chart
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("#### 🗓️ Release Trends by Decade")
-            decade_counts = filtered_df['decade'].value_counts().sort_index()
-            if not decade_counts.empty:
-                decade_df = pd.DataFrame({
-                    'decade': decade_counts.index.astype(str),
-                    'count': decade_counts.values
-                })
-                fig3 = create_vibrant_line_chart(
-                    decade_df,
-                    'decade',
-                    'count',
-                    "Content Release by Decade",
-                    palette='electric',
-                    height=450,
-                    showlegend=False
-                )
-                st.plotly_chart(fig3, use_container_width=True)
-            else:
-                st.info("No decade data")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Chart 4: Quarterly Additions - Bar Chart
-        with col2:
-            st.markdown("#### 📊 Quarterly Content Additions")
-            quarterly_counts = filtered_df.groupby('quarter_added').size().reset_index(name='count')
-            if not quarterly_counts.empty:
-                fig4 = create_vibrant_bar_chart(
-                    quarterly_counts,
-                    'quarter_added',
-                    'count',
-                    "Content Additions by Quarter",
-                    palette='jewel_bright',
-                    height=450,
-                    showlegend=False
-                )
-                st.plotly_chart(fig4, use_container_width=True)
-            else:
-                st.info("No quarterly data")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Chart 5: Growth by Content Type - Line Chart 
-        st.markdown("#### 📈 Growth by Content Type")
-        type_year_growth = filtered_df.groupby(['year_added', 'type']).size().reset_index(name='count')
-        if not type_year_growth.empty:
+    # Chart 5: Growth by Content Type - Line Chart 
+    st.markdown("#### 📈 Growth by Content Type")
+    type_year_growth = chart_data('type_year_growth', view, signature)
+    if not type_year_growth.empty:
+        def build_type_growth_chart():
             fig5 = px.line(type_year_growth, x='year_added', y='count', color='type', 
                           title="Content Growth by Type Over Years")
-            
+        
             # Apply different vibrant colors to each line - RED for Movies, GREEN for TV Shows
             content_colors = VIBRANT_PALETTES['content_type']
-            
+        
             # Map colors to content types
             color_map = {}
             unique_types = type_year_growth['type'].unique()
@@ -1262,7 +1276,7 @@ def main():
                 else:
                     # Fallback to rainbow colors if more than 2 types
                     color_map[content_type] = VIBRANT_PALETTES['rainbow'][i % len(VIBRANT_PALETTES['rainbow'])]
-            
+        
             for i, trace in enumerate(fig5.data):
                 trace_name = trace.name
                 if trace_name in color_map:
@@ -1274,7 +1288,7 @@ def main():
                 marker_symbols = ['circle', 'square', 'diamond', 'triangle-up', 'pentagon']
                 trace.marker.symbol = marker_symbols[i % len(marker_symbols)]
                 trace.marker.size = 12
-            
+        
             # Make legend more prominent
             fig5.update_layout(
                 legend=dict(
@@ -1290,153 +1304,160 @@ def main():
                     x=1
                 )
             )
-            
-            fig5 = apply_vibrant_theme(fig5, "Content Growth by Type", 450, showlegend=True)
-            st.plotly_chart(fig5, use_container_width=True)
-            
-            # Add color explanation
-            col_exp1, col_exp2 = st.columns(2)
-            with col_exp1:
-                st.markdown("""
-                <div style="background: rgba(255, 0, 0, 0.1); padding: 0.75rem; border-radius: 8px; border-left: 4px solid #FF0000; margin-top: 1rem;">
-                    <p style="margin: 0; color: #ffffff; font-weight: bold;">🎥 <span style="color: #FF0000;">Red Line</span>: Movies</p>
-                </div>
-                """, unsafe_allow_html=True)
-            with col_exp2:
-                st.markdown("""
-                <div style="background: rgba(0, 255, 0, 0.1); padding: 0.75rem; border-radius: 8px; border-left: 4px solid #00FF00; margin-top: 1rem;">
-                    <p style="margin: 0; color: #ffffff; font-weight: bold;">📺 <span style="color: #00FF00;">Green Line</span>: TV Shows</p>
-                </div>
-                """, unsafe_allow_html=True)
-        else:
-            st.info("No type-year data")
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with tab2:
-        st.markdown("### 🎭 Genre & Content Analysis")
         
-        # TV SHOWS METRICS SECTION
-        st.markdown("""
-        <div class="section-header" style="margin-top: 0; margin-bottom: 2rem;">
-            <h3 class="section-title" style="font-size: 1.8rem;">📺 TV SHOWS METRICS</h3>
-            <p class="section-subtitle">Detailed statistics for TV shows in the library</p>
-        </div>
-        """, unsafe_allow_html=True)
+            return apply_vibrant_theme(fig5, "Content Growth by Type", 450, showlegend=True)
         
-        col_tv1, col_tv2, col_tv3 = st.columns(3)
+        render_chart('type_year_growth', signature, build_type_growth_chart)
         
-        with col_tv1:
-            st.markdown(f"""
-            <div class="kpi-card" style="height: 160px; background: linear-gradient(145deg, rgba(229,9,20,0.1) 0%, rgba(184,29,36,0.1) 100%); border: 2px solid #E50914;">
-                <div class="kpi-content">
-                    <div class="kpi-label" style="color: #E50914; font-size: 0.9rem; font-weight: 800;">TOTAL TV SHOWS</div>
-                    <div class="kpi-value" style="color: white; font-size: 2.5rem; margin: 0.5rem 0;">{total_tv_shows:,}</div>
-                    <div style="font-size: 1rem; color: #b3b3b3; margin-top: 0.5rem;">
-                        {tv_percentage:.1f}% of filtered content
-                    </div>
-                </div>
-                <div class="kpi-icon" style="opacity: 0.3;">📺</div>
+        # Add color explanation
+        col_exp1, col_exp2 = st.columns(2)
+        with col_exp1:
+            st.markdown("""
+            <div style="background: rgba(255, 0, 0, 0.1); padding: 0.75rem; border-radius: 8px; border-left: 4px solid #FF0000; margin-top: 1rem;">
+                <p style="margin: 0; color: #ffffff; font-weight: bold;">🎥 <span style="color: #FF0000;">Red Line</span>: Movies</p>
             </div>
             """, unsafe_allow_html=True)
-        
-        with col_tv2:
-            st.markdown(f"""
-            <div class="kpi-card" style="height: 160px; background: linear-gradient(145deg, rgba(229,9,20,0.1) 0%, rgba(184,29,36,0.1) 100%); border: 2px solid #E50914;">
-                <div class="kpi-content">
-                    <div class="kpi-label" style="color: #E50914; font-size: 0.9rem; font-weight: 800;">AVERAGE SEASONS</div>
-                    <div class="kpi-value" style="color: white; font-size: 2.5rem; margin: 0.5rem 0;">{avg_seasons:.1f}</div>
-                    <div style="font-size: 1rem; color: #b3b3b3; margin-top: 0.5rem;">
-                        Per TV show
-                    </div>
-                </div>
-                <div class="kpi-icon" style="opacity: 0.3;">📊</div>
+        with col_exp2:
+            st.markdown("""
+            <div style="background: rgba(0, 255, 0, 0.1); padding: 0.75rem; border-radius: 8px; border-left: 4px solid #00FF00; margin-top: 1rem;">
+                <p style="margin: 0; color: #ffffff; font-weight: bold;">📺 <span style="color: #00FF00;">Green Line</span>: TV Shows</p>
             </div>
             """, unsafe_allow_html=True)
-        
-        with col_tv3:
-            st.markdown(f"""
-            <div class="kpi-card" style="height: 160px; background: linear-gradient(145deg, rgba(229,9,20,0.1) 0%, rgba(184,29,36,0.1) 100%); border: 2px solid #E50914;">
-                <div class="kpi-content">
-                    <div class="kpi-label" style="color: #E50914; font-size: 0.9rem; font-weight: 800;">MAXIMUM SEASONS</div>
-                    <div class="kpi-value" style="color: white; font-size: 2.5rem; margin: 0.5rem 0;">{max_seasons:.0f}</div>
-                    <div style="font-size: 1rem; color: #b3b3b3; margin-top: 0.5rem;">
-                        Longest running series
-                    </div>
+    else:
+        st.info("No type-year data")
+    st.markdown('</div>', unsafe_allow_html=True)
+
+def render_genre_section(view, signature, overview):
+    """Render the Genre & Content metrics and charts"""
+    tv_metrics = chart_data('tv_metrics', view, signature)
+    total_tv_shows = tv_metrics['total_tv_shows']
+    avg_seasons = tv_metrics['avg_seasons']
+    max_seasons = tv_metrics['max_seasons']
+    total_titles = overview['total_titles']
+    tv_percentage = (total_tv_shows / total_titles * 100) if total_titles > 0 else 0
+    
+    st.markdown("### 🎭 Genre & Content Analysis")
+    
+    # TV SHOWS METRICS SECTION
+    st.markdown("""
+    <div class="section-header" style="margin-top: 0; margin-bottom: 2rem;">
+        <h3 class="section-title" style="font-size: 1.8rem;">📺 TV SHOWS METRICS</h3>
+        <p class="section-subtitle">Detailed statistics for TV shows in the library</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col_tv1, col_tv2, col_tv3 = st.columns(3)
+    
+    with col_tv1:
+        st.markdown(f"""
+        <div class="kpi-card" style="height: 160px; background: linear-gradient(145deg, rgba(229,9,20,0.1) 0%, rgba(184,29,36,0.1) 100%); border: 2px solid #E50914;">
+            <div class="kpi-content">
+                <div class="kpi-label" style="color: #E50914; font-size: 0.9rem; font-weight: 800;">TOTAL TV SHOWS</div>
+                <div class="kpi-value" style="color: white; font-size: 2.5rem; margin: 0.5rem 0;">{total_tv_shows:,}</div>
+                <div style="font-size: 1rem; color: #b3b3b3; margin-top: 0.5rem;">
+                    {tv_percentage:.1f}% of filtered content
                 </div>
-                <div class="kpi-icon" style="opacity: 0.3;">🏆</div>
             </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("<br><br>", unsafe_allow_html=True)
-        
-        # Chart 6: Top 15 Genres - Horizontal Bar Chart
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("#### 🏆 Top 15 Genres")
-            try:
-                genre_counts = filtered_df['genre_list'].explode().value_counts().head(15)
-                if not genre_counts.empty:
-                    genre_df = pd.DataFrame({
-                        'genre': genre_counts.index,
-                        'count': genre_counts.values
-                    })
-                    
-                    fig6 = px.bar(genre_df, y='genre', x='count', orientation='h',
-                                 title="Top 15 Genres by Content Count")
-                    
-                    # Apply vibrant rainbow colors
-                    colors = VIBRANT_PALETTES['rainbow']
-                    fig6.update_traces(
-                        marker_color=[colors[i % len(colors)] for i in range(len(genre_df))],
-                        hovertemplate='<b>%{y}</b><br>Count: %{x}<extra></extra>',
-                        marker_line_color='white',
-                        marker_line_width=1.5,
-                        texttemplate='%{x}',
-                        textposition='outside',
-                        textfont=dict(color='white', size=11, weight='bold')
+            <div class="kpi-icon" style="opacity: 0.3;">📺</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col_tv2:
+        st.markdown(f"""
+        <div class="kpi-card" style="height: 160px; background: linear-gradient(145deg, rgba(229,9,20,0.1) 0%, rgba(184,29,36,0.1) 100%); border: 2px solid #E50914;">
+            <div class="kpi-content">
+                <div class="kpi-label" style="color: #E50914; font-size: 0.9rem; font-weight: 800;">AVERAGE SEASONS</div>
+                <div class="kpi-value" style="color: white; font-size: 2.5rem; margin: 0.5rem 0;">{avg_seasons:.1f}</div>
+                <div style="font-size: 1rem; color: #b3b3b3; margin-top: 0.5rem;">
+                    Per TV show
+                </div>
+            </div>
+            <div class="kpi-icon" style="opacity: 0.3;">📊</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col_tv3:
+        st.markdown(f"""
+        <div class="kpi-card" style="height: 160px; background: linear-gradient(145deg, rgba(229,9,20,0.1) 0%, rgba(184,29,36,0.1) 100%); border: 2px solid #E50914;">
+            <div class="kpi-content">
+                <div class="kpi-label" style="color: #E50914; font-size: 0.9rem; font-weight: 800;">MAXIMUM SEASONS</div>
+                <div class="kpi-value" style="color: white; font-size: 2.5rem; margin: 0.5rem 0;">{max_seasons:.0f}</div>
+                <div style="font-size: 1rem; color: #b3b3b3; margin-top: 0.5rem;">
+                    Longest running series
+                </div>
+            </div>
+            <div class="kpi-icon" style="opacity: 0.3;">🏆</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<br><br>", unsafe_allow_html=True)
+    
+    # Chart 6: Top 15 Genres - Horizontal Bar Chart
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("#### 🏆 Top 15 Genres")
+        try:
+            genre_counts = chart_data('genre_counts', view, signature)
+            if not genre_counts.empty:
+                genre_df = pd.DataFrame({
+                    'genre': genre_counts.index,
+                    'count': genre_counts.values
+                })
+                
+                def build_genre_chart():
+                    fig6 = px.bar(genre_df, y='genre', x='count', orientation='h',
+                                 title="Top 15 Genres by Content Count")
+                
+                    # Apply vibrant rainbow colors
+                    colors = VIBRANT_PALETTES['rainbow']
+                    fig6.update_traces(
+                        marker_color=[colors[i % len(colors)] for i in range(len(genre_df))],
+                        hovertemplate='<b>%{y}</b><br>Count: %{x}<extra></extra>',
+                        marker_line_color='white',
+                        marker_line_width=1.5,
+                        texttemplate='%{x}',
+                        textposition='outside',
+                        textfont=dict(color='white', size=11, weight='bold')
                     )
-                    
-                    fig6 = apply_vibrant_theme(fig6, "Top 15 Genres", 500, showlegend=False)
-                    st.plotly_chart(fig6, use_container_width=True)
-                else:
-                    st.info("No genre data")
-            except:
-                st.info("Error processing genre data")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Chart 7: Movie Duration Distribution - Histogram
-        with col2:
-            st.markdown("#### 🎥 Movie Duration Distribution")
-            movies_df = filtered_df[filtered_df['type'] == 'Movie'].dropna(subset=['movie_minutes'])
-            if not movies_df.empty:
-                fig7 = create_vibrant_histogram(
-                    movies_df,
-                    'movie_minutes',
-                    "Movie Duration Distribution",
-                    palette='electric',
-                    height=500,
-                    showlegend=False
-                )
-                st.plotly_chart(fig7, use_container_width=True)
+                
+                    return apply_vibrant_theme(fig6, "Top 15 Genres", 500, showlegend=False)
+                
+                render_chart('genre_counts', signature, build_genre_chart)
             else:
-                st.info("No movie duration data")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Chart 8: TV Seasons Distribution - Bar Chart WITH VIBRANT COLORS 
-        st.markdown("#### 📺 TV Seasons Distribution")
-        tv_df = filtered_df[filtered_df['type'] == 'TV Show'].dropna(subset=['tv_seasons'])
-        if not tv_df.empty:
-            season_counts = tv_df['tv_seasons'].value_counts().reset_index()
-            season_counts.columns = ['seasons', 'count']
-            season_counts = season_counts.sort_values('seasons')
-            
-            # Create the bar chart
+                st.info("No genre data")
+        except:
+            st.info("Error processing genre data")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Chart 7: Movie Duration Distribution - Histogram
+    with col2:
+        st.markdown("#### 🎥 Movie Duration Distribution")
+        minute_bins = chart_data('movie_minutes_histogram', view, signature)
+        if not minute_bins.empty:
+            render_chart('movie_minutes_histogram', signature, lambda: create_vibrant_histogram(
+                minute_bins,
+                'movie_minutes',
+                "Movie Duration Distribution",
+                palette='electric',
+                height=500,
+                showlegend=False
+            ))
+        else:
+            st.info("No movie duration data")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Chart 8: TV Seasons Distribution - Bar Chart WITH VIBRANT COLORS 
+    st.markdown("#### 📺 TV Seasons Distribution")
+    season_counts = chart_data('season_counts', view, signature)
+    if not season_counts.empty:
+        # Create the bar chart
+        def build_season_chart():
             fig8 = px.bar(season_counts, x='seasons', y='count', 
                          title="TV Show Seasons Distribution")
-            
+        
             # Apply TV SEASONS specific vibrant colors - each bar different color
             tv_season_colors = VIBRANT_PALETTES['tv_seasons']
-            
+        
             fig8.update_traces(
                 marker_color=[tv_season_colors[i % len(tv_season_colors)] for i in range(len(season_counts))],
                 hovertemplate='<b>%{x} seasons</b><br>Count: %{y}<extra></extra>',
@@ -1446,31 +1467,34 @@ def main():
                 textposition='outside',
                 textfont=dict(color='white', size=12, weight='bold')
             )
-            
-            fig8 = apply_vibrant_theme(fig8, "TV Show Seasons Distribution", 450, showlegend=False)
-            st.plotly_chart(fig8, use_container_width=True)
-        else:
-            st.info("No TV seasons data")
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with tab3:
-        st.markdown("### 🌍 Geographic Analysis")
         
-        # Chart 10: Top Content Producing Countries - Bar Chart
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("#### 🌐 Top 20 Content Countries")
-            try:
-                country_counts = filtered_df['country_list'].explode().value_counts().head(20)
-                if not country_counts.empty:
-                    country_df = pd.DataFrame({
-                        'country': country_counts.index,
-                        'count': country_counts.values
-                    })
-                    
+            return apply_vibrant_theme(fig8, "TV Show Seasons Distribution", 450, showlegend=False)
+        
+        render_chart('season_counts', signature, build_season_chart)
+    else:
+        st.info("No TV seasons data")
+    st.markdown('</div>', unsafe_allow_html=True)
+
+def render_geography_section(view, signature, overview):
+    """Render the Geography charts"""
+    st.markdown("### 🌍 Geographic Analysis")
+    
+    # Chart 10: Top Content Producing Countries - Bar Chart
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("#### 🌐 Top 20 Content Countries")
+        try:
+            country_counts = chart_data('country_counts', view, signature)
+            if not country_counts.empty:
+                country_df = pd.DataFrame({
+                    'country': country_counts.index,
+                    'count': country_counts.values
+                })
+                
+                def build_country_chart():
                     fig10 = px.bar(country_df, y='country', x='count', orientation='h',
                                   title="Top 20 Countries by Content Count")
-                    
+                
                     # Apply ocean waves colors
                     colors = VIBRANT_PALETTES['ocean_waves']
                     fig10.update_traces(
@@ -1482,35 +1506,34 @@ def main():
                         textposition='outside',
                         textfont=dict(color='white', size=11, weight='bold')
                     )
-                    
-                    fig10 = apply_vibrant_theme(fig10, "Top 20 Countries by Content", 500, showlegend=False)
-                    st.plotly_chart(fig10, use_container_width=True)
-                else:
-                    st.info("No country data")
-            except:
-                st.info("Error processing country data")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Chart 11: Content by Region Treemap
-        with col2:
-            st.markdown("#### 🗺️ Content by Region & Type")
-            try:
-                exploded_df = filtered_df.explode('country_list')
-                top_10_countries = exploded_df['country_list'].value_counts().head(10).index.tolist()
-                treemap_df = exploded_df[exploded_df['country_list'].isin(top_10_countries)]
                 
-                if not treemap_df.empty:
-                    country_type_counts = treemap_df.groupby(['country_list', 'type']).size().reset_index(name='count')
-                    
+                    return apply_vibrant_theme(fig10, "Top 20 Countries by Content", 500, showlegend=False)
+                
+                render_chart('country_counts', signature, build_country_chart)
+            else:
+                st.info("No country data")
+        except:
+            st.info("Error processing country data")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Chart 11: Content by Region Treemap
+    with col2:
+        st.markdown("#### 🗺️ Content by Region & Type")
+        try:
+            country_type_counts = chart_data('country_type_counts', view, signature)
+            
+            if not country_type_counts.empty:
+                
+                def build_country_type_chart():
                     fig11 = px.treemap(
                         country_type_counts,
                         path=['country_list', 'type'],
                         values='count',
                         color='count',
                         color_continuous_scale='Rainbow',
-                        
-                    )
                     
+                    )
+                
                     fig11.update_traces(
                         texttemplate='<b>%{label}</b><br>Count: %{value}',
                         textposition='middle center',
@@ -1518,7 +1541,7 @@ def main():
                         hovertemplate='<b>%{label}</b><br>Count: %{value}<extra></extra>',
                         marker=dict(line=dict(width=2, color='white'))
                     )
-                    
+                
                     fig11.update_layout(
                         plot_bgcolor='rgba(26, 26, 26, 0.7)',
                         paper_bgcolor='rgba(26, 26, 26, 0.7)',
@@ -1526,225 +1549,525 @@ def main():
                         margin=dict(t=100, b=50, l=50, r=50),
                         showlegend=False
                     )
-                    
-                    st.plotly_chart(fig11, use_container_width=True)
-                else:
-                    st.info("Insufficient country data")
-            except:
-                st.info("Could not generate treemap")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Chart 12: Content Quality by Country - Bar Chart
-        st.markdown("#### ⭐ Content Quality by Country")
-        try:
-            exploded_df = filtered_df.explode('country_list')
-            top_countries = exploded_df['country_list'].value_counts().head(15).index.tolist()
-            country_quality = exploded_df[exploded_df['country_list'].isin(top_countries)]
-            
-            if not country_quality.empty:
-                quality_by_country = country_quality.groupby('country_list')['content_score'].mean().reset_index()
-                quality_by_country = quality_by_country.sort_values('content_score', ascending=False).head(10)
+                    return fig11
                 
-                fig12 = create_vibrant_bar_chart(
-                    quality_by_country,
-                    'country_list',
-                    'content_score',
-                    "Average Content Score by Top 10 Countries",
-                    palette='neon_gradient',
-                    height=450,
-                    showlegend=False
-                )
-                st.plotly_chart(fig12, use_container_width=True)
+                render_chart('country_type_counts', signature, build_country_type_chart)
             else:
-                st.info("Insufficient quality data")
+                st.info("Insufficient country data")
         except:
-            st.info("Could not generate quality chart")
+            st.info("Could not generate treemap")
         st.markdown('</div>', unsafe_allow_html=True)
     
-    with tab4:
-        st.markdown("### ⚡ Quality & Ratings Analysis")
-        
-        # SECTION 1: Quality Range metrics
-        st.markdown("""
-        <div class="section-header" style="margin-top: 0; margin-bottom: 2rem;">
-            <h3 class="section-title" style="font-size: 1.8rem;">⭐ QUALITY ANALYSIS</h3>
-            <p class="section-subtitle">Content quality metrics and scoring range</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        col_qual1, col_qual2 = st.columns(2)
+    # Chart 12: Content Quality by Country - Bar Chart
+    st.markdown("#### ⭐ Content Quality by Country")
+    try:
+        quality_by_country = chart_data('quality_by_country', view, signature)
         
-        with col_qual1:
-            st.markdown(f"""
-            <div class="kpi-card" style="height: 160px; background: linear-gradient(145deg, rgba(255,215,0,0.1) 0%, rgba(255,165,0,0.1) 100%); border: 2px solid #FFD700;">
-                <div class="kpi-content">
-                    <div class="kpi-label" style="color: #FFD700; font-size: 0.9rem; font-weight: 800;">QUALITY RANGE</div>
-                    <div class="kpi-value" style="color: white; font-size: 2.5rem; margin: 0.5rem 0;">{quality_range:.1f} points</div>
-                    <div style="font-size: 1rem; color: #1DB954; margin-top: 0.5rem; font-weight: 600;">
-                        {avg_quality:.1f} average quality score
-                    </div>
-                </div>
-                <div class="kpi-icon" style="opacity: 0.3; color: #FFD700;">⭐</div>
-            </div>
-            """, unsafe_allow_html=True)
+        if not quality_by_country.empty:
+            render_chart('quality_by_country', signature, lambda: create_vibrant_bar_chart(
+                quality_by_country,
+                'country_list',
+                'content_score',
+                "Average Content Score by Top 10 Countries",
+                palette='neon_gradient',
+                height=450,
+                showlegend=False
+            ))
+        else:
+            st.info("Insufficient quality data")
+    except:
+        st.info("Could not generate quality chart")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Chart 13: Co-production Network
+    st.markdown("#### 🤝 Co-production Network")
+    if 'coproduction_pairs' not in BACKEND['aggregations']:
+        st.info("Install scipy to see which countries co-produce titles")
+        return
+    try:
+        coproduction_pairs = chart_data('coproduction_pairs', view, signature)
         
-        with col_qual2:
-            st.markdown(f"""
-            <div class="kpi-card" style="height: 160px; background: linear-gradient(145deg, rgba(255,215,0,0.1) 0%, rgba(255,165,0,0.1) 100%); border: 2px solid #FFD700;">
-                <div class="kpi-content">
-                    <div class="kpi-label" style="color: #FFD700; font-size: 0.9rem; font-weight: 800;">QUALITY SCORE RANGE</div>
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-top: 0.5rem;">
-                        <div style="text-align: center; flex: 1;">
-                            <div style="color: #b3b3b3; font-size: 0.8rem; margin-bottom: 0.25rem;">Min</div>
-                            <div style="color: white; font-size: 1.8rem; font-weight: 900;">{min_quality:.0f}</div>
-                        </div>
-                        <div style="text-align: center; flex: 1;">
-                            <div style="color: #b3b3b3; font-size: 0.8rem; margin-bottom: 0.25rem;">Avg</div>
-                            <div style="color: white; font-size: 1.8rem; font-weight: 900;">{avg_quality:.1f}</div>
-                        </div>
-                        <div style="text-align: center; flex: 1;">
-                            <div style="color: #b3b3b3; font-size: 0.8rem; margin-bottom: 0.25rem;">Max</div>
-                            <div style="color: white; font-size: 1.8rem; font-weight: 900;">{max_quality:.0f}</div>
-                        </div>
-                    </div>
-                    <div style="height: 8px; background: rgba(255,255,255,0.1); border-radius: 4px; margin-top: 1rem; position: relative;">
-                        <div style="position: absolute; left: 0; top: 0; height: 100%; width: {(avg_quality - min_quality) / (max_quality - min_quality) * 100}%; 
-                             background: linear-gradient(90deg, #FFD700 0%, #FFA500 100%); border-radius: 4px;"></div>
-                    </div>
+        if not coproduction_pairs.empty:
+            col1, col2 = st.columns([3, 2])
+            with col1:
+                render_chart('coproduction_network', signature, lambda: create_network_chart(
+                    coproduction_pairs,
+                    f"Co-productions Between the Top {NETWORK_COUNTRIES} Partner Countries"
+                ))
+            with col2:
+                strongest = coproduction_pairs.head(15).assign(
+                    pair=lambda pairs: pairs['country_a'] + ' & ' + pairs['country_b'])
+                render_chart('coproduction_pairs', signature, lambda: create_vibrant_bar_chart(
+                    strongest,
+                    'pair',
+                    'titles',
+                    "Strongest Co-production Partners",
+                    palette='fire',
+                    height=600,
+                    showlegend=False
+                ))
+        else:
+            st.info("No multi-country titles in the current view")
+    except:
+        st.info("Could not generate co-production network")
+    st.markdown('</div>', unsafe_allow_html=True)
+
+def render_quality_section(view, signature, overview):
+    """Render the Quality & Ratings metrics and charts"""
+    quality_metrics = chart_data('quality_metrics', view, signature)
+    avg_quality = quality_metrics['avg_quality']
+    min_quality = quality_metrics['min_quality']
+    max_quality = quality_metrics['max_quality']
+    quality_range = max_quality - min_quality
+    
+    # Content Type metrics
+    total_titles = overview['total_titles']
+    total_movies = overview['movies']
+    total_tv_shows_global = overview['tv_shows']
+    movie_percentage = (total_movies / total_titles * 100) if total_titles > 0 else 0
+    tv_percentage_global = (total_tv_shows_global / total_titles * 100) if total_titles > 0 else 0
+    
+    st.markdown("### ⚡ Quality & Ratings Analysis")
+    
+    # SECTION 1: Quality Range metrics
+    st.markdown("""
+    <div class="section-header" style="margin-top: 0; margin-bottom: 2rem;">
+        <h3 class="section-title" style="font-size: 1.8rem;">⭐ QUALITY ANALYSIS</h3>
+        <p class="section-subtitle">Content quality metrics and scoring range</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col_qual1, col_qual2 = st.columns(2)
+    
+    with col_qual1:
+        st.markdown(f"""
+        <div class="kpi-card" style="height: 160px; background: linear-gradient(145deg, rgba(255,215,0,0.1) 0%, rgba(255,165,0,0.1) 100%); border: 2px solid #FFD700;">
+            <div class="kpi-content">
+                <div class="kpi-label" style="color: #FFD700; font-size: 0.9rem; font-weight: 800;">QUALITY RANGE</div>
+                <div class="kpi-value" style="color: white; font-size: 2.5rem; margin: 0.5rem 0;">{quality_range:.1f} points</div>
+                <div style="font-size: 1rem; color: #1DB954; margin-top: 0.5rem; font-weight: 600;">
+                    {avg_quality:.1f} average quality score
                 </div>
-                <div class="kpi-icon" style="opacity: 0.3; color: #FFD700;">📊</div>
             </div>
-            """, unsafe_allow_html=True)
-        
-        # SECTION 2: Movies vs TV Shows Distribution
-        st.markdown("""
-        <div class="section-header" style="margin-top: 2rem; margin-bottom: 2rem;">
-            <h3 class="section-title" style="font-size: 1.8rem;">🎬 CONTENT TYPE DISTRIBUTION</h3>
-            <p class="section-subtitle">Movies vs TV Shows breakdown in the library</p>
+            <div class="kpi-icon" style="opacity: 0.3; color: #FFD700;">⭐</div>
         </div>
         """, unsafe_allow_html=True)
-        
-        col_movie, col_tv = st.columns(2)
-        
-        with col_movie:
-            st.markdown(f"""
-            <div class="kpi-card" style="height: 180px; background: linear-gradient(145deg, rgba(255,0,0,0.15) 0%, rgba(184,29,36,0.15) 100%); border: 2px solid #FF0000;">
-                <div class="kpi-content">
-                    <div class="kpi-label" style="color: #FF0000; font-size: 1rem; font-weight: 800; display: flex; align-items: center; gap: 0.5rem;">
-                        <span>🎥</span> MOVIES
+    
+    with col_qual2:
+        st.markdown(f"""
+        <div class="kpi-card" style="height: 160px; background: linear-gradient(145deg, rgba(255,215,0,0.1) 0%, rgba(255,165,0,0.1) 100%); border: 2px solid #FFD700;">
+            <div class="kpi-content">
+                <div class="kpi-label" style="color: #FFD700; font-size: 0.9rem; font-weight: 800;">QUALITY SCORE RANGE</div>
+                <div style="display: flex; justify-content: space-between; align-items: center; margin-top: 0.5rem;">
+                    <div style="text-align: center; flex: 1;">
+                        <div style="color: #b3b3b3; font-size: 0.8rem; margin-bottom: 0.25rem;">Min</div>
+                        <div style="color: white; font-size: 1.8rem; font-weight: 900;">{min_quality:.0f}</div>
                     </div>
-                    <div class="kpi-value" style="color: white; font-size: 3rem; margin: 0.5rem 0;">{total_movies:,}</div>
-                    <div style="font-size: 1.2rem; color: #FF0000; margin-top: 0.5rem; font-weight: 700;">
-                        {movie_percentage:.1f}% of total
+                    <div style="text-align: center; flex: 1;">
+                        <div style="color: #b3b3b3; font-size: 0.8rem; margin-bottom: 0.25rem;">Avg</div>
+                        <div style="color: white; font-size: 1.8rem; font-weight: 900;">{avg_quality:.1f}</div>
                     </div>
-                    <div style="height: 6px; background: rgba(255,255,255,0.1); border-radius: 3px; margin-top: 0.75rem;">
-                        <div style="height: 100%; width: {movie_percentage}%; background: linear-gradient(90deg, #FF0000 0%, #B81D24 100%); border-radius: 3px;"></div>
+                    <div style="text-align: center; flex: 1;">
+                        <div style="color: #b3b3b3; font-size: 0.8rem; margin-bottom: 0.25rem;">Max</div>
+                        <div style="color: white; font-size: 1.8rem; font-weight: 900;">{max_quality:.0f}</div>
                     </div>
                 </div>
-                <div class="kpi-icon" style="opacity: 0.3; color: #FF0000; font-size: 3rem;">🎥</div>
+                <div style="height: 8px; background: rgba(255,255,255,0.1); border-radius: 4px; margin-top: 1rem; position: relative;">
+                    <div style="position: absolute; left: 0; top: 0; height: 100%; width: {(avg_quality - min_quality) / (max_quality - min_quality) * 100}%; 
+                         background: linear-gradient(90deg, #FFD700 0%, #FFA500 100%); border-radius: 4px;"></div>
+                </div>
             </div>
-            """, unsafe_allow_html=True)
-        
-        with col_tv:
-            st.markdown(f"""
-            <div class="kpi-card" style="height: 180px; background: linear-gradient(145deg, rgba(0,255,0,0.15) 0%, rgba(0,184,36,0.15) 100%); border: 2px solid #00FF00;">
-                <div class="kpi-content">
-                    <div class="kpi-label" style="color: #00FF00; font-size: 1rem; font-weight: 800; display: flex; align-items: center; gap: 0.5rem;">
-                        <span>📺</span> TV SHOWS
-                    </div>
-                    <div class="kpi-value" style="color: white; font-size: 3rem; margin: 0.5rem 0;">{total_tv_shows_global:,}</div>
-                    <div style="font-size: 1.2rem; color: #00FF00; margin-top: 0.5rem; font-weight: 700;">
-                        {tv_percentage_global:.1f}% of total
-                    </div>
-                    <div style="height: 6px; background: rgba(255,255,255,0.1); border-radius: 3px; margin-top: 0.75rem;">
-                        <div style="height: 100%; width: {tv_percentage_global}%; background: linear-gradient(90deg, #00FF00 0%, #00B824 100%); border-radius: 3px;"></div>
-                    </div>
+            <div class="kpi-icon" style="opacity: 0.3; color: #FFD700;">📊</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # SECTION 2: Movies vs TV Shows Distribution
+    st.markdown("""
+    <div class="section-header" style="margin-top: 2rem; margin-bottom: 2rem;">
+        <h3 class="section-title" style="font-size: 1.8rem;">🎬 CONTENT TYPE DISTRIBUTION</h3>
+        <p class="section-subtitle">Movies vs TV Shows breakdown in the library</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col_movie, col_tv = st.columns(2)
+    
+    with col_movie:
+        st.markdown(f"""
+        <div class="kpi-card" style="height: 180px; background: linear-gradient(145deg, rgba(255,0,0,0.15) 0%, rgba(184,29,36,0.15) 100%); border: 2px solid #FF0000;">
+            <div class="kpi-content">
+                <div class="kpi-label" style="color: #FF0000; font-size: 1rem; font-weight: 800; display: flex; align-items: center; gap: 0.5rem;">
+                    <span>🎥</span> MOVIES
+                </div>
+                <div class="kpi-value" style="color: white; font-size: 3rem; margin: 0.5rem 0;">{total_movies:,}</div>
+                <div style="font-size: 1.2rem; color: #FF0000; margin-top: 0.5rem; font-weight: 700;">
+                    {movie_percentage:.1f}% of total
+                </div>
+                <div style="height: 6px; background: rgba(255,255,255,0.1); border-radius: 3px; margin-top: 0.75rem;">
+                    <div style="height: 100%; width: {movie_percentage}%; background: linear-gradient(90deg, #FF0000 0%, #B81D24 100%); border-radius: 3px;"></div>
                 </div>
-                <div class="kpi-icon" style="opacity: 0.3; color: #00FF00; font-size: 3rem;">📺</div>
             </div>
-            """, unsafe_allow_html=True)
-        
-        # Add a summary row
+            <div class="kpi-icon" style="opacity: 0.3; color: #FF0000; font-size: 3rem;">🎥</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col_tv:
         st.markdown(f"""
-        <div style="background: linear-gradient(135deg, rgba(40,40,40,0.8) 0%, rgba(60,60,60,0.8) 100%); 
-                    padding: 1.5rem; border-radius: 12px; margin: 1.5rem 0; border: 1px solid #333333;">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <div style="flex: 1; text-align: center;">
-                    <div style="color: #b3b3b3; font-size: 0.9rem; margin-bottom: 0.25rem;">Total Content</div>
-                    <div style="color: white; font-size: 1.8rem; font-weight: 900;">{total_titles:,}</div>
+        <div class="kpi-card" style="height: 180px; background: linear-gradient(145deg, rgba(0,255,0,0.15) 0%, rgba(0,184,36,0.15) 100%); border: 2px solid #00FF00;">
+            <div class="kpi-content">
+                <div class="kpi-label" style="color: #00FF00; font-size: 1rem; font-weight: 800; display: flex; align-items: center; gap: 0.5rem;">
+                    <span>📺</span> TV SHOWS
                 </div>
-                <div style="flex: 1; text-align: center; border-left: 1px solid #333333; border-right: 1px solid #333333;">
-                    <div style="color: #b3b3b3; font-size: 0.9rem; margin-bottom: 0.25rem;">Movies Ratio</div>
-                    <div style="color: white; font-size: 1.8rem; font-weight: 900;">{movie_percentage:.1f}%</div>
+                <div class="kpi-value" style="color: white; font-size: 3rem; margin: 0.5rem 0;">{total_tv_shows_global:,}</div>
+                <div style="font-size: 1.2rem; color: #00FF00; margin-top: 0.5rem; font-weight: 700;">
+                    {tv_percentage_global:.1f}% of total
                 </div>
-                <div style="flex: 1; text-align: center;">
-                    <div style="color: #b3b3b3; font-size: 0.9rem; margin-bottom: 0.25rem;">TV Shows Ratio</div>
-                    <div style="color: white; font-size: 1.8rem; font-weight: 900;">{tv_percentage_global:.1f}%</div>
+                <div style="height: 6px; background: rgba(255,255,255,0.1); border-radius: 3px; margin-top: 0.75rem;">
+                    <div style="height: 100%; width: {tv_percentage_global}%; background: linear-gradient(90deg, #00FF00 0%, #00B824 100%); border-radius: 3px;"></div>
                 </div>
             </div>
+            <div class="kpi-icon" style="opacity: 0.3; color: #00FF00; font-size: 3rem;">📺</div>
         </div>
         """, unsafe_allow_html=True)
+    
+    # Add a summary row
+    st.markdown(f"""
+    <div style="background: linear-gradient(135deg, rgba(40,40,40,0.8) 0%, rgba(60,60,60,0.8) 100%); 
+                padding: 1.5rem; border-radius: 12px; margin: 1.5rem 0; border: 1px solid #333333;">
+        <div style="display: flex; justify-content: space-between; align-items: center;">
+            <div style="flex: 1; text-align: center;">
+                <div style="color: #b3b3b3; font-size: 0.9rem; margin-bottom: 0.25rem;">Total Content</div>
+                <div style="color: white; font-size: 1.8rem; font-weight: 900;">{total_titles:,}</div>
+            </div>
+            <div style="flex: 1; text-align: center; border-left: 1px solid #333333; border-right: 1px solid #333333;">
+                <div style="color: #b3b3b3; font-size: 0.9rem; margin-bottom: 0.25rem;">Movies Ratio</div>
+                <div style="color: white; font-size: 1.8rem; font-weight: 900;">{movie_percentage:.1f}%</div>
+            </div>
+            <div style="flex: 1; text-align: center;">
+                <div style="color: #b3b3b3; font-size: 0.9rem; margin-bottom: 0.25rem;">TV Shows Ratio</div>
+                <div style="color: white; font-size: 1.8rem; font-weight: 900;">{tv_percentage_global:.1f}%</div>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("<br><br>", unsafe_allow_html=True)
+    
+    # Chart 13: Ratings Distribution - Pie Chart
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("#### 📋 Ratings Distribution")
+        rating_counts = chart_data('rating_counts', view, signature)
+        if not rating_counts.empty:
+            render_chart('rating_counts', signature, lambda: create_vibrant_pie_chart(
+                rating_counts.index.tolist(),
+                rating_counts.values.tolist(),
+                "Top 10 Content Ratings Distribution",
+                palette='electric',
+                height=450
+            ))
+        else:
+            st.info("No rating data")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Chart 14: Content Quality Distribution - Histogram
+    with col2:
+        st.markdown("#### ⭐ Content Quality Score Distribution")
+        if total_titles > 0:
+            render_chart('content_score_histogram', signature, lambda: create_vibrant_histogram(
+                chart_data('content_score_histogram', view, signature),
+                'content_score',
+                "Content Quality Score Distribution",
+                palette='fire',
+                height=450,
+                showlegend=False
+            ))
+            
+            # Show quality tier distribution
+            quality_tiers = chart_data('quality_tiers', view, signature)
+            for tier, count in quality_tiers.items():
+                percentage = (count / total_titles) * 100
+                st.progress(percentage/100, text=f"{tier}: {count:,} ({percentage:.1f}%)")
+        else:
+            st.info("No quality data")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Chart 15: Content Type Distribution - Pie Chart 
+    st.markdown("#### 🎬 Content Type Distribution (Visual)")
+    type_counts = chart_data('type_counts', view, signature)
+    if not type_counts.empty:
+        render_chart('type_counts', signature, lambda: create_vibrant_pie_chart(
+            type_counts.index.tolist(),
+            type_counts.values.tolist(),
+            "Movies vs TV Shows Distribution",
+            palette='jewel_bright',
+            height=450
+        ))
+    else:
+        st.info("No type data")
+    st.markdown('</div>', unsafe_allow_html=True)
+
+def render_similar_section(view, signature, overview):
+    """Render the More Like This recommendations for a title of the current view"""
+    st.markdown("### 🎯 More Like This")
+    if not SPARSE_AVAILABLE:
+        st.info("Install scipy to enable similar-title recommendations")
+        return
+    frame = view_frame(view)
+    if frame.empty:
+        st.info("No titles match the current filters")
+        return
+    
+    catalog = view['catalog']
+    similarity = shared_similarity(catalog['fingerprint'], catalog)
+    df = catalog['df']
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        row = st.selectbox(
+            "Title",
+            options=frame.index[:SIMILAR_TITLE_OPTIONS].tolist(),
+            format_func=lambda row: f"{df['title'].iloc[row]} ({df['type'].iloc[row]}, {df['release_year'].iloc[row]})",
+            help="Titles of the current view; use the search box to find a specific one"
+        )
+    with col2:
+        k = st.slider("Recommendations", 5, 25, SIMILAR_TITLES)
+    
+    with profile_stage('similar_titles'):
+        neighbors, scores = lookup_similar(similarity, row, k)
+    if not len(neighbors):
+        st.info("No title shares a genre, country, rating, type, director or duration band with this one")
+        return
+    columns = [col for col in ['title', 'director', 'type', 'release_year', 'rating', 'listed_in', 'country', 'duration']
+               if col in df.columns]
+    recommendations = df.iloc[neighbors][columns].assign(similarity=(scores.astype(float) * 100).round(1))
+    st.dataframe(recommendations, use_container_width=True, hide_index=True)
+    source = "precomputed neighbour table" if similarity['table'] is not None else "scored live"
+    st.caption(f"Weighted cosine similarity over genres, director, countries, rating, type and duration band · {source}")
+
+DASHBOARD_SECTIONS = {
+    "📈 TRENDS & GROWTH": render_trends_section,
+    "🎭 GENRE & CONTENT": render_genre_section,
+    "🌍 GEOGRAPHY": render_geography_section,
+    "⚡ QUALITY & RATINGS": render_quality_section,
+    "🎯 SIMILAR TITLES": render_similar_section
+}
+
+# ----------------------------
+# Main App
+# ----------------------------
+def main():
+    start_rerun_profile(PROFILE_ENABLED or st.query_params.get('profile') == '1')
+    with profile_stage('load') as record:
+        catalog = load_and_process_data()
+        record['rows'] = len(catalog['df'])
+    df = catalog['df']
+    genre_labels = catalog['genres']['labels']
+    country_labels = catalog['countries']['labels']
+    
+    # Sidebar Filters
+    with st.sidebar:
+        st.markdown('<div class="filter-header">🔍 FILTER CONTENT</div>', unsafe_allow_html=True)
         
-        st.markdown("<br><br>", unsafe_allow_html=True)
+        # Startup warm-up precomputes this same default view
+        defaults = default_query(df)
+        search_text = st.text_input(
+            "Search Titles & Directors",
+            placeholder="e.g. stranger things, spielberg",
+            help="Matches word prefixes, ignoring case and accents, and tolerates a typo in longer words"
+        )
         
-        # Chart 13: Ratings Distribution - Pie Chart
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("#### 📋 Ratings Distribution")
-            rating_counts = filtered_df['rating'].value_counts().head(10)
-            if not rating_counts.empty:
-                fig13 = create_vibrant_pie_chart(
-                    rating_counts.index.tolist(),
-                    rating_counts.values.tolist(),
-                    "Top 10 Content Ratings Distribution",
-                    palette='electric',
-                    height=450
-                )
-                st.plotly_chart(fig13, use_container_width=True)
-            else:
-                st.info("No rating data")
-            st.markdown('</div>', unsafe_allow_html=True)
+        type_options = ['All'] + sorted(df['type'].dropna().unique().tolist())
+        selected_type = st.multiselect(
+            "Content Type",
+            options=type_options[1:],
+            default=list(defaults.types)
+        )
         
-        # Chart 14: Content Quality Distribution - Histogram
-        with col2:
-            st.markdown("#### ⭐ Content Quality Score Distribution")
-            if not filtered_df.empty:
-                fig14 = create_vibrant_histogram(
-                    filtered_df,
-                    'content_score',
-                    "Content Quality Score Distribution",
-                    palette='fire',
-                    height=450,
-                    showlegend=False
-                )
-                st.plotly_chart(fig14, use_container_width=True)
-                
-                # Show quality tier distribution
-                if 'quality_category' in filtered_df.columns:
-                    quality_tiers = filtered_df['quality_category'].value_counts()
-                    for tier, count in quality_tiers.items():
-                        percentage = (count / len(filtered_df)) * 100
-                        st.progress(percentage/100, text=f"{tier}: {count:,} ({percentage:.1f}%)")
-            else:
-                st.info("No quality data")
-            st.markdown('</div>', unsafe_allow_html=True)
+        min_year = int(df['release_year'].min()) if not df['release_year'].isna().all() else 1900
+        max_year = int(df['release_year'].max()) if not df['release_year'].isna().all() else datetime.now().year
+        year_range = st.slider(
+            "Release Year Range",
+            min_year, max_year,
+            defaults.release_years
+        )
         
-        # Chart 15: Content Type Distribution - Pie Chart 
-        st.markdown("#### 🎬 Content Type Distribution (Visual)")
-        type_counts = filtered_df['type'].value_counts()
-        if not type_counts.empty:
-            fig15 = create_vibrant_pie_chart(
-                type_counts.index.tolist(),
-                type_counts.values.tolist(),
-                "Movies vs TV Shows Distribution",
-                palette='jewel_bright',
-                height=450
+        scoring_profile = st.selectbox(
+            "Scoring Profile",
+            options=list(SCORING_PROFILES),
+            index=list(SCORING_PROFILES).index(DEFAULT_SCORING_PROFILE)
+        )
+        
+        quality_options = ['All'] + list(QUALITY_TIERS)
+        selected_quality = st.selectbox("Quality Tier", options=quality_options, index=0)
+        
+        # FIX FOR RATING ERROR - SIMPLIFIED SOLUTION
+        # Get the actual ratings available in the data
+        available_ratings = sorted(df['rating'].dropna().unique().tolist())
+        
+        # Don't set any default ratings - let user choose from what's available
+        selected_rating = st.multiselect(
+            "Content Rating",
+            options=available_ratings,
+            default=[]  # NO DEFAULT VALUES - EMPTY LIST
+        )
+        
+        try:
+            all_genres = genre_labels.tolist()
+            
+            # Don't set any default genres
+            selected_genres = st.multiselect(
+                "Genres",
+                options=all_genres,
+                default=[],  # NO DEFAULT VALUES - EMPTY LIST
+                max_selections=5
             )
-            st.plotly_chart(fig15, use_container_width=True)
-        else:
-            st.info("No type data")
-        st.markdown('</div>', unsafe_allow_html=True)
+        except:
+            selected_genres = []
+        
+        try:
+            top_countries = cached_result(
+                'country_options', catalog['fingerprint'],
+                lambda: list_value_counts(catalog['countries_bridge'], country_labels).head(20).index.tolist())
+            
+            # Don't set any default countries
+            selected_countries = st.multiselect(
+                "Countries",
+                options=top_countries,
+                default=[]  # NO DEFAULT VALUES - EMPTY LIST
+            )
+        except:
+            selected_countries = []
+        
+        show_memory_report = st.checkbox("Show memory report", value=False)
+        
+        cache_stats = result_cache_stats()
+        st.caption(f"Result cache: {cache_stats['hits']:,} hits / {cache_stats['misses']:,} misses · "
+                   f"{cache_stats['entries']:,} entries · {cache_stats['bytes'] / 1024 / 1024:.1f} MB")
+    
+    # Apply Filters
+    query = CatalogQuery(
+        release_years=year_range,
+        types=selected_type if 'All' not in selected_type else (),
+        content_score=QUALITY_TIERS.get(selected_quality),
+        ratings=selected_rating,  # Only filters when the user selected something
+        genres=selected_genres,
+        countries=selected_countries,
+        search=search_text,
+        profile=scoring_profile
+    )
+    
+    # Rows are only filtered when an aggregation misses the shared result cache
+    profile_signature = (catalog['fingerprint'], scoring_profile)
+    with profile_stage('scoring_profile', len(df)):
+        scored = (scored_catalog(catalog, scoring_profile) if scoring_profile == DEFAULT_SCORING_PROFILE
+                  else shared_scored_catalog(catalog['fingerprint'], scoring_profile,
+                                             repr(SCORING_PROFILES[scoring_profile]), catalog))
+    view = BACKEND['make_view'](catalog, scored, query)
+    signature = query.signature(catalog['fingerprint'])
+    
+    # Calculate global metrics for display
+    catalog_overview = cached_result('catalog_overview', profile_signature,
+                                     lambda: aggregate_catalog_overview(view))
+    total_titles_all = catalog_overview['total_titles']
+    movies_all = catalog_overview['movies']
+    tv_shows_all = catalog_overview['tv_shows']
+    unique_countries_all = catalog_overview['unique_countries']
+    avg_content_score = catalog_overview['avg_score']
     
+    # Netflix Header
+    st.markdown(f"""
+    <div class="header-container">
+        <h1 class="header-title">🎬 NETFLIX CONTENT ANALYTICS</h1>
+        <p class="header-sub">Interactive Dashboard | Comprehensive Content Analysis</p>
+        <div style="display: flex; flex-wrap: wrap; gap: 1rem; margin-top: 2rem;">
+            <span class="metric-badge">📊 {total_titles_all:,} TOTAL TITLES</span>
+            <span class="metric-badge">🎥 {movies_all:,} MOVIES</span>
+            <span class="metric-badge">📺 {tv_shows_all:,} TV SHOWS</span>
+            <span class="metric-badge">🌍 {unique_countries_all:,} COUNTRIES</span>
+            <span class="metric-badge">⭐ {avg_content_score:.0f}/100 AVG SCORE</span>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # KPI Metrics
+    st.markdown("""
+    <div class="section-header">
+        <h3 class="section-title">📊 CONTENT OVERVIEW</h3>
+        <p class="section-subtitle">Key metrics for filtered content</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    overview = chart_data('overview', view, signature)
+    
+    with col1:
+        total_titles = overview['total_titles']
+        pct_of_total = (total_titles / total_titles_all * 100) if total_titles_all > 0 else 0
+        st.markdown(create_metric_card("Titles in View", f"{total_titles:,}", change=pct_of_total, icon="🎬"), unsafe_allow_html=True)
+    
+    with col2:
+        movies = overview['movies']
+        movies_pct = (movies / total_titles * 100) if total_titles > 0 else 0
+        st.markdown(create_metric_card("Movies", f"{movies:,}", change=movies_pct, icon="🎥"), unsafe_allow_html=True)
+    
+    with col3:
+        tv_shows = overview['tv_shows']
+        tv_pct = (tv_shows / total_titles * 100) if total_titles > 0 else 0
+        st.markdown(create_metric_card("TV Shows", f"{tv_shows:,}", change=tv_pct, icon="📺"), unsafe_allow_html=True)
+    
+    with col4:
+        avg_score = overview['avg_score']
+        avg_score_all = avg_content_score
+        change = ((avg_score - avg_score_all) / avg_score_all * 100) if avg_score_all > 0 else 0
+        st.markdown(create_metric_card("Avg Quality Score", f"{avg_score:.0f}/100", change=change, icon="⭐"), unsafe_allow_html=True)
+    
+    with col5:
+        unique_countries = overview['unique_countries']
+        change = ((unique_countries - unique_countries_all) / unique_countries_all * 100) if unique_countries_all > 0 else 0
+        st.markdown(create_metric_card("Countries", f"{unique_countries}", change=change, icon="🌍"), unsafe_allow_html=True)
+    
+    st.info(f"**Showing {total_titles:,} titles** ({total_titles/total_titles_all*100:.1f}% of total library)")
+    
+    if query.search:
+        with st.expander(f"🔎 Titles matching \"{search_text.strip()}\"", expanded=True):
+            matches = view_frame(view)
+            st.dataframe(matches[[col for col in SEARCH_COLUMNS if col in matches.columns]].head(200),
+                         use_container_width=True, hide_index=True)
+    
+    # 15 VIBRANT CHARTS IN SECTIONS
+    if LAZY_SECTIONS:
+        # Only the selected section is aggregated, built and sent to the browser
+        selected_section = st.radio("Section", options=list(DASHBOARD_SECTIONS), horizontal=True,
+                                    label_visibility="collapsed", key="dashboard_section")
+        with profile_stage(f'section:{selected_section}'):
+            DASHBOARD_SECTIONS[selected_section](view, signature, overview)
+    else:
+        tabs = st.tabs(list(DASHBOARD_SECTIONS))
+        for (label, render_section), tab in zip(DASHBOARD_SECTIONS.items(), tabs):
+            with tab, profile_stage(f'section:{label}'):
+                render_section(view, signature, overview)
+    
+    if show_memory_report:
+        st.markdown("""
+        <div class="section-header">
+            <h3 class="section-title">🧠 MEMORY REPORT</h3>
+            <p class="section-subtitle">Compact catalog layout vs plain object/float64 columns</p>
+        </div>
+        """, unsafe_allow_html=True)
+        report = catalog_memory_report(catalog)
+        legacy_total = report['Object Layout (KB)'].sum()
+        compact_total = report['Compact (KB)'].sum()
+        st.info(f"**{compact_total / 1024:,.1f} MB** in memory vs **{legacy_total / 1024:,.1f} MB** "
+                f"with the object layout ({(1 - compact_total / legacy_total) * 100:.0f}% saved)")
+        st.dataframe(report, use_container_width=True, hide_index=True)
+    
+    # Diagnostics only exist while profiling is switched on
+    rerun_profile = finish_rerun_profile()
+    if rerun_profile is not None:
+        total_ms, stages = rerun_profile
+        with st.expander(f"⏱️ Rerun diagnostics · {total_ms:,.0f} ms", expanded=False):
+            timings = pd.DataFrame(stages).reindex(columns=['stage', 'rows', 'cached', 'offset_ms', 'ms'])
+            st.dataframe(timings.round({'offset_ms': 1, 'ms': 1}), use_container_width=True, hide_index=True)
     
     # Footer
     st.markdown("""
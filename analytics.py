@@ -0,0 +1,1522 @@
+"""
+Streamlit-free analytics core of the Netflix dashboard.
+
+Cleaning, scoring, the integer-coded list columns, the filter index, the
+OLAP cube and every chart aggregation live here so they can be benchmarked,
+run in worker processes or called from batch jobs without importing
+Streamlit or Plotly. A CatalogQuery describes one sidebar filter set.
+"""
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import unicodedata
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+try:
+    import pyarrow as pa  # also needed by pandas for Parquet
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+try:
+    from scipy import sparse  # similar-titles recommender
+    SPARSE_AVAILABLE = True
+except ImportError:
+    SPARSE_AVAILABLE = False
+
+# ----------------------------
+# Content Scoring Rules
+# ----------------------------
+# Bands are (low, high, points) with inclusive bounds; the first matching band wins
+SCORING_PROFILES = {
+    'Netflix Standard': {
+        'age': {'base': 100, 'decay': 1.5, 'weight': 0.35},
+        'duration': {
+            'Movie': {'column': 'movie_minutes', 'default': 20,
+                      'bands': [(90, 120, 40), (75, 90, 30), (120, 150, 30)]},
+            'TV Show': {'column': 'tv_seasons', 'default': 20,
+                        'bands': [(2, 4, 40), (1, 1, 30), (5, 6, 30)]}
+        },
+        'ratings': {'TV-MA': 35, 'TV-14': 30, 'R': 30,
+                    'TV-PG': 25, 'PG-13': 25, 'PG': 20},
+        'rating_default': 15
+    },
+    'Fresh Releases': {
+        'age': {'base': 100, 'decay': 3.0, 'weight': 0.5},
+        'duration': {
+            'Movie': {'column': 'movie_minutes', 'default': 15,
+                      'bands': [(90, 120, 30), (75, 90, 25), (120, 150, 25)]},
+            'TV Show': {'column': 'tv_seasons', 'default': 15,
+                        'bands': [(1, 3, 30), (4, 6, 25)]}
+        },
+        'ratings': {'TV-MA': 25, 'TV-14': 25, 'R': 25,
+                    'TV-PG': 20, 'PG-13': 20, 'PG': 20},
+        'rating_default': 15
+    },
+    'Family Friendly': {
+        'age': {'base': 100, 'decay': 1.0, 'weight': 0.3},
+        'duration': {
+            'Movie': {'column': 'movie_minutes', 'default': 20,
+                      'bands': [(75, 110, 40), (60, 75, 30), (110, 130, 30)]},
+            'TV Show': {'column': 'tv_seasons', 'default': 20,
+                        'bands': [(2, 5, 40), (1, 1, 30), (6, 8, 30)]}
+        },
+        'ratings': {'TV-Y': 35, 'TV-Y7': 35, 'TV-G': 35, 'G': 35,
+                    'TV-PG': 30, 'PG': 30, 'PG-13': 20, 'TV-14': 20},
+        'rating_default': 10
+    }
+}
+
+DEFAULT_SCORING_PROFILE = 'Netflix Standard'
+
+# ----------------------------
+# Catalog Source & Processed Cache
+# ----------------------------
+# DASHBOARD_CATALOG points the app at another CSV, e.g. one from synthetic_catalog.py
+CATALOG_PATH = os.environ.get('DASHBOARD_CATALOG', "netflix_cleaned.csv")
+CACHE_DIR = ".catalog_cache"
+
+# 'arrow' writes the processed catalog as an Arrow IPC file that every worker
+# process on the host memory-maps, so the page cache holds a single copy
+CACHE_FORMAT = os.environ.get('DASHBOARD_CACHE_FORMAT', 'parquet')
+
+# Rows per chunk when ingest streams the CSV into the processed cache, so peak
+# memory follows the chunk size rather than the file; 0 reads it in one go
+INGEST_CHUNK_ROWS = int(os.environ.get('DASHBOARD_INGEST_CHUNK_ROWS', '0'))
+
+# Bump whenever process_catalog changes the derived columns
+PIPELINE_VERSION = 2
+
+# Source column aliases, first match wins
+COLUMN_MAPPING = {
+    'type': ['type', 'content_type', 'show_type'],
+    'title': ['title', 'name', 'show_title'],
+    'release_year': ['release_year', 'year', 'release_date'],
+    'rating': ['rating', 'content_rating', 'age_rating'],
+    'duration': ['duration', 'run_time', 'length'],
+    'country': ['country', 'countries', 'country_of_origin'],
+    'listed_in': ['listed_in', 'genres', 'genre', 'category'],
+    'date_added': ['date_added', 'added_date', 'netflix_added_date'],
+    'director': ['director', 'directors']
+}
+
+# Columns created empty when the source lacks them
+EXPECTED_COLUMNS = ['type', 'title', 'release_year', 'rating', 'duration', 'country', 'listed_in']
+
+TYPE_NAMES = {
+    'Movie': 'Movie',
+    'movie': 'Movie',
+    'MOVIE': 'Movie',
+    'TV Show': 'TV Show',
+    'TV show': 'TV Show',
+    'TV SHOW': 'TV Show',
+    'Tv Show': 'TV Show',
+    'Series': 'TV Show',
+    'TV Series': 'TV Show'
+}
+
+# Compact dtypes applied once all derived columns exist
+DTYPE_PLAN = {
+    'type': 'category',
+    'rating': 'category',
+    'duration': 'category',
+    'country': 'category',
+    'listed_in': 'category',
+    'release_year': 'Int16',
+    'year_added': 'Int16',
+    'month_added': 'Int8',
+    'quarter_added': 'Int8',
+    'decade': 'Int16',
+    'content_age': 'Int16',
+    'tv_seasons': 'Int8',
+    'duration_num': 'float32',
+    'movie_minutes': 'float32',
+    'content_score': 'int8'
+}
+
+# Multi-valued columns kept as integer-coded lists outside the frame
+LIST_ENCODINGS = {'genres': 'listed_in', 'countries': 'country'}
+
+# Columns indexed for the sidebar filters; range dimensions are queried with (low, high)
+FILTER_DIMENSIONS = ['type', 'rating', 'release_year', 'content_score']
+RANGE_DIMENSIONS = {'release_year', 'content_score'}
+
+# Columns of the processed frame the DuckDB and Polars backends copy into their engines
+TITLE_COLUMNS = ['type', 'rating', 'release_year', 'content_score', 'year_added', 'month_added',
+                 'quarter_added', 'decade', 'tv_seasons', 'movie_minutes']
+
+# Free-text search runs over the words of these columns, case- and accent-folded
+SEARCH_FIELDS = ['title', 'director']
+WORD_PATTERN = re.compile(r'\w+')
+
+# Query words at least this long also match words one (then two) typos away
+FUZZY_MIN_LENGTHS = (5, 9)
+
+QUALITY_TIERS = {
+    'Ultra (85-100)': (85, 100),
+    'Premium (70-85)': (70, 85),
+    'Standard (40-70)': (40, 70),
+    'Basic (0-40)': (0, 40)
+}
+
+# Pre-aggregated cube behind the Trends & Growth and Quality & Ratings tabs
+CUBE_DIMENSIONS = ['year_added', 'month_added', 'quarter_added', 'release_year', 'type', 'rating', 'score_band']
+
+# Score bands split at every inclusive tier boundary, so tier filters and
+# quality_category can both be rebuilt exactly from band counts
+SCORE_BAND_EDGES = [0, 1, 40, 41, 70, 71, 85, 86, 101]
+SCORE_BAND_QUALITY = [None, 'Basic', 'Basic', 'Standard', 'Standard', 'Premium', 'Premium', 'Ultra']
+
+# Engine behind ingest, make_view and the chart aggregations: 'pandas', 'duckdb' or 'polars'
+QUERY_BACKEND = os.environ.get('DASHBOARD_BACKEND', 'pandas')
+
+# Distribution charts are binned server-side into about this many round-width bins
+HISTOGRAM_BINS = 20
+
+# Feature groups of the similar-titles recommender and each group's weight in its cosine similarity
+SIMILARITY_WEIGHTS = {'genres': 3.0, 'director': 2.0, 'countries': 1.5, 'rating': 1.0, 'type': 1.0,
+                      'duration_band': 1.0}
+
+# Lower edges of the movie-minute and season-count duration bands
+DURATION_BANDS = {'movie_minutes': [0, 60, 90, 120, 150], 'tv_seasons': [1, 2, 3, 5]}
+
+# Placeholders the cleaned catalog uses for missing values; sharing one makes no titles similar
+PLACEHOLDER_VALUES = ['Not Given', 'Unknown']
+
+SIMILAR_TITLES = 10
+
+# Scores held at once while precomputing the neighbour table (block rows x titles)
+SIMILARITY_BLOCK_CELLS = 1 << 24
+
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+
+# ----------------------------
+# Duration Parsing & Content Scoring
+# ----------------------------
+def parse_durations(duration):
+    """Parse duration strings into number, movie minutes and TV seasons"""
+    # Only the distinct strings are parsed, results are broadcast back by code
+    codes, uniques = pd.factorize(duration)
+    text = pd.Series(uniques, dtype=object).astype(str).str.lower()
+    number = pd.to_numeric(text.str.extract(r"(\d+\.?\d*)", expand=False),
+                           errors='coerce').to_numpy(dtype=float)
+    minutes = np.where(text.str.contains('min', regex=False).to_numpy(dtype=bool), number, np.nan)
+    seasons = np.where(text.str.contains('season', regex=False).to_numpy(dtype=bool), number, np.nan)
+    
+    # Missing durations get code -1, which picks the trailing NaN slot
+    def broadcast(values):
+        return np.append(values, np.nan)[codes]
+    
+    return pd.DataFrame({
+        'duration_num': broadcast(number),
+        'movie_minutes': broadcast(minutes),
+        'tv_seasons': broadcast(seasons)
+    }, index=duration.index)
+
+def calculate_content_score(df, profile=DEFAULT_SCORING_PROFILE):
+    """Calculate Netflix-style content quality score for every title at once"""
+    rules = SCORING_PROFILES[profile]
+    score = np.zeros(len(df))
+    
+    age = rules['age']
+    content_age = df['content_age'].to_numpy(dtype=float, na_value=np.nan)
+    age_score = np.maximum(0, age['base'] - content_age * age['decay']) * age['weight']
+    score += np.where(np.isnan(content_age), 0, age_score)
+    
+    content_type = df['type'].to_numpy()
+    for type_name, band_rules in rules['duration'].items():
+        values = df[band_rules['column']].to_numpy(dtype=float, na_value=np.nan)
+        applies = (content_type == type_name) & ~np.isnan(values)
+        conditions = [(values >= low) & (values <= high) for low, high, _ in band_rules['bands']]
+        points = [p for _, _, p in band_rules['bands']]
+        band_score = np.select(conditions, points, default=band_rules['default'])
+        score += np.where(applies, band_score, 0)
+    
+    ratings = pd.Categorical(df['rating'])
+    rating_points = [rules['ratings'].get(str(r), rules['rating_default']) for r in ratings.categories]
+    score += np.append(np.array(rating_points, dtype=float), rules['rating_default'])[ratings.codes]
+    
+    return pd.Series(np.clip(np.trunc(score), 0, 100).astype(np.int8), index=df.index)
+
+def categorize_quality(scores):
+    """Bucket content scores into quality tiers"""
+    return pd.cut(scores,
+                  bins=[0, 40, 70, 85, 100],
+                  labels=['Basic', 'Standard', 'Premium', 'Ultra'])
+
+def rescore_catalog(df, profile):
+    """Return the catalog scored with another scoring profile"""
+    if profile == DEFAULT_SCORING_PROFILE:
+        return df
+    scores = calculate_content_score(df, profile)
+    return df.assign(content_score=scores, quality_category=categorize_quality(scores))
+
+# ----------------------------
+# Processed Catalog Cache
+# ----------------------------
+def catalog_fingerprint(path):
+    """Hash the source file together with the pipeline version, scoring rules and current year"""
+    digest = hashlib.sha256()
+    digest.update(f"v{PIPELINE_VERSION}|{datetime.now().year}|{SCORING_PROFILES[DEFAULT_SCORING_PROFILE]!r}".encode())
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+def catalog_cache_path(path, fingerprint):
+    """Location of the processed Parquet or Arrow file for a source catalog"""
+    name = os.path.splitext(os.path.basename(path))[0]
+    extension = 'arrow' if CACHE_FORMAT == 'arrow' else 'parquet'
+    return os.path.join(CACHE_DIR, f"{name}-{fingerprint}.{extension}")
+
+def replace_cache_file(cache_path, write):
+    """Atomically write a cache file and drop stale versions of it"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # Stale versions differ only in the fingerprint; other catalogs sharing a name prefix are kept
+    prefix = os.path.basename(cache_path).rsplit('-', 1)[0]
+    extension = os.path.splitext(cache_path)[1]
+    stale_pattern = re.compile(f"{re.escape(prefix)}-[0-9a-f]{{16}}{re.escape(extension)}")
+    # Concurrent writers each use their own temporary file; the last rename wins
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, cache_path)
+    for entry in os.listdir(CACHE_DIR):
+        stale = os.path.join(CACHE_DIR, entry)
+        if stale_pattern.fullmatch(entry) and stale != cache_path:
+            os.remove(stale)
+
+def read_processed_cache(cache_path):
+    """Load a processed catalog written by write_processed_cache or stream_catalog"""
+    metadata = pq.read_schema(cache_path).metadata or {}
+    if STREAM_CATEGORIES_KEY not in metadata:
+        return pd.read_parquet(cache_path)
+    # Categorical columns come back as dictionaries, never as one string per title
+    table = pq.read_table(cache_path)
+    return restore_stream_dtypes(table.to_pandas(self_destruct=True),
+                                 json.loads(metadata[STREAM_CATEGORIES_KEY]))
+
+def write_processed_cache(df, cache_path):
+    """Persist the processed catalog and drop stale versions of it"""
+    replace_cache_file(cache_path, lambda tmp_path: df.to_parquet(tmp_path, index=False))
+
+def write_arrow_catalog(catalog, cache_path):
+    """Persist the processed frame and its genre/country encodings as one Arrow IPC file"""
+    table = pa.Table.from_pandas(catalog['df'], preserve_index=False)
+    labels = {}
+    for name in LIST_ENCODINGS:
+        # The offsets/codes encoding is exactly Arrow's large_list layout
+        encoding = catalog[name]
+        table = table.append_column(f'__{name}', pa.LargeListArray.from_arrays(encoding['offsets'], encoding['codes']))
+        labels[name] = encoding['labels'].tolist()
+    table = table.replace_schema_metadata({**table.schema.metadata, b'list_labels': json.dumps(labels).encode()})
+    
+    def write(tmp_path):
+        with pa.OSFile(tmp_path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    
+    replace_cache_file(cache_path, write)
+
+def read_arrow_catalog(cache_path, fingerprint):
+    """Memory-map a catalog written by write_arrow_catalog"""
+    # String, non-null numeric and list columns stay backed by the mapped pages
+    table = pa.ipc.open_file(pa.memory_map(cache_path)).read_all()
+    labels = json.loads(table.schema.metadata[b'list_labels'])
+    encodings = {}
+    for name in LIST_ENCODINGS:
+        column = table.column(f'__{name}')
+        lists = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+        encodings[name] = {'labels': np.array(labels[name], dtype=object),
+                           'codes': lists.values.to_numpy(),
+                           'offsets': lists.offsets.to_numpy()}
+        table = table.drop_columns([f'__{name}'])
+    return build_catalog(table.to_pandas(), fingerprint, encodings)
+
+# ----------------------------
+# Catalog Loading
+# ----------------------------
+def load_catalog(path=CATALOG_PATH, backend=None):
+    """Read, process and index a catalog CSV, reusing the processed cache when present"""
+    fingerprint = catalog_fingerprint(path)
+    cache_path = catalog_cache_path(path, fingerprint) if PARQUET_AVAILABLE else None
+    if cache_path and os.path.exists(cache_path):
+        if CACHE_FORMAT == 'arrow':
+            catalog = read_arrow_catalog(cache_path, fingerprint)
+        else:
+            catalog = build_catalog(read_processed_cache(cache_path), fingerprint)
+        catalog['from_cache'] = True
+        return catalog
+    
+    totals = None
+    if cache_path and INGEST_CHUNK_ROWS > 0:
+        # The streamed Parquet store is the cache itself, or the staging file of an Arrow cache
+        store_path = os.path.splitext(cache_path)[0] + '.parquet'
+        try:
+            totals = stream_catalog(path, store_path, INGEST_CHUNK_ROWS)
+        except OSError:
+            pass  # A read-only disk falls back to reading the whole file
+    if totals:
+        df = read_processed_cache(store_path)
+    else:
+        df = (backend or get_backend())['read_catalog'](path)
+    catalog = build_catalog(df, fingerprint)
+    
+    if cache_path:
+        try:
+            if CACHE_FORMAT == 'arrow':
+                write_arrow_catalog(catalog, cache_path)
+                # Map the file straight away so this worker shares pages with later ones
+                catalog = read_arrow_catalog(cache_path, fingerprint)
+                if totals:
+                    os.remove(store_path)
+            elif not totals:
+                write_processed_cache(df, cache_path)
+        except Exception:
+            pass  # The cache is an optimization; a read-only disk must not break loading
+    
+    catalog['from_cache'] = False
+    catalog['ingest'] = totals
+    return catalog
+
+def freeze_catalog(catalog):
+    """Mark every array of a catalog read-only so it can be shared and only read through views"""
+    for value in catalog.values():
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+        elif isinstance(value, dict):
+            freeze_catalog(value)
+    return catalog
+
+def build_catalog(df, fingerprint, encodings=None):
+    """Bundle the processed frame with its integer-coded genre and country lists"""
+    catalog = {'df': df, 'fingerprint': fingerprint}
+    for name, column in LIST_ENCODINGS.items():
+        catalog[name] = encodings[name] if encodings else encode_list_column(df[column])
+        catalog[f'{name}_bridge'] = build_bridge(catalog[name])
+    catalog['index'] = build_filter_index(catalog)
+    catalog['cube'] = build_cube(df)
+    return catalog
+
+def normalize_column_names(columns):
+    """Lower-case, underscore and alias-map source column names"""
+    names = [c.strip().lower().replace(' ', '_') for c in columns]
+    for standard_name, possible_names in COLUMN_MAPPING.items():
+        for possible in possible_names:
+            if possible in names:
+                names = [standard_name if name == possible else name for name in names]
+                break
+    return names
+
+def read_catalog(path):
+    """Read and process a catalog CSV with pandas"""
+    return process_catalog(pd.read_csv(path))
+
+def process_catalog(df, date_format=None):
+    """Normalize columns and derive every analysis field from a raw catalog"""
+    df.columns = normalize_column_names(df.columns)
+    
+    for col in EXPECTED_COLUMNS:
+        if col not in df.columns:
+            df[col] = np.nan
+    
+    df['type'] = df['type'].fillna("Unknown").astype(str).str.strip()
+    df['title'] = df['title'].fillna("").astype(str).str.strip()
+    
+    df['type'] = df['type'].replace(TYPE_NAMES)
+    
+    # Chunked ingest passes the format inferred from the first chunk so every chunk parses alike
+    df['date_added'] = pd.to_datetime(df['date_added'], errors='coerce', dayfirst=False, format=date_format)
+    df['release_year'] = pd.to_numeric(df['release_year'], errors='coerce')
+    durations = parse_durations(df['duration'])
+    df['duration_num'] = durations['duration_num']
+    df['movie_minutes'] = durations['movie_minutes']
+    df['tv_seasons'] = durations['tv_seasons']
+    
+    df['year_added'] = df['date_added'].dt.year
+    df['month_added'] = df['date_added'].dt.month
+    df['quarter_added'] = df['date_added'].dt.quarter
+    df['content_age'] = datetime.now().year - df['release_year']
+    df['decade'] = (df['release_year'] // 10) * 10
+    
+    df['content_score'] = calculate_content_score(df)
+    df['quality_category'] = categorize_quality(df['content_score'])
+    
+    month_codes = df['month_added'].to_numpy(dtype=float, na_value=np.nan)
+    month_codes = np.where((month_codes >= 1) & (month_codes <= 12), month_codes - 1, 12)
+    df['month_name'] = pd.Categorical.from_codes(month_codes.astype(np.int8),
+                                                 categories=MONTH_NAMES + ['Unknown'])
+    
+    return compact_dtypes(df).reset_index(drop=True)
+
+def compact_dtypes(df):
+    """Downcast columns according to DTYPE_PLAN"""
+    for col, dtype in DTYPE_PLAN.items():
+        if col not in df.columns:
+            continue
+        if dtype.startswith('Int'):
+            values = pd.to_numeric(df[col], errors='coerce')
+            # Non-integral values (e.g. "1.5 Seasons") keep a float representation
+            if (values.dropna() % 1 != 0).any():
+                dtype = 'float32'
+            df[col] = values.astype(dtype)
+        elif dtype == 'category':
+            df[col] = df[col].astype('category')
+        else:
+            df[col] = df[col].astype(dtype)
+    return df
+
+# ----------------------------
+# Streaming Ingest
+# ----------------------------
+# Parquet metadata key holding the fixed categories of a streamed store
+STREAM_CATEGORIES_KEY = b'stream_categories'
+
+# Running totals kept per dimension while streaming: value -> titles (list items for the encodings)
+INGEST_DIMENSIONS = {'types': 'type', 'ratings': 'rating', **LIST_ENCODINGS}
+
+def first_date_format(dates):
+    """Format pandas infers for a date column from its first value"""
+    first = dates.first_valid_index()
+    return guess_datetime_format(dates[first], dayfirst=False) if first is not None else None
+
+def stream_frame(df):
+    """A processed chunk whose nullable integers hold the same dtype in every chunk"""
+    for col, dtype in DTYPE_PLAN.items():
+        if dtype.startswith('Int') and col in df.columns:
+            # float32 holds every planned integer exactly and keeps non-integral values
+            df[col] = df[col].astype('float32')
+    return df
+
+def stream_schema(df):
+    """Arrow schema of a streamed store, with one dictionary type for every categorical column"""
+    schema = pa.Table.from_pandas(stream_frame(df.head(0)), preserve_index=False).schema
+    fields = [pa.field(field.name, pa.dictionary(pa.int32(), pa.large_string(), field.type.ordered))
+              if pa.types.is_dictionary(field.type) else field for field in schema]
+    # Categories process_catalog fixes itself (month names, quality tiers) are the same in every chunk
+    categories = {col: [df[col].cat.categories.tolist(), bool(df[col].cat.ordered)] for col in df.columns
+                  if isinstance(df[col].dtype, pd.CategoricalDtype) and col not in DTYPE_PLAN}
+    return pa.schema(fields, metadata={STREAM_CATEGORIES_KEY: json.dumps(categories).encode()})
+
+def restore_stream_dtypes(df, categories):
+    """Apply process_catalog's dtypes to a streamed store, deciding them over the whole catalog"""
+    for col, (labels, ordered) in categories.items():
+        df[col] = df[col].cat.set_categories(labels, ordered=ordered)
+    for col, dtype in DTYPE_PLAN.items():
+        if dtype == 'category' and col in df.columns:
+            # Dictionaries list values in order of appearance; astype('category') sorts them
+            df[col] = df[col].cat.reorder_categories(df[col].cat.categories.sort_values())
+    return compact_dtypes(df)
+
+def update_ingest_totals(totals, df):
+    """Fold one processed chunk into the running counts, dimension dictionaries and score sum"""
+    totals['rows'] += len(df)
+    totals['chunks'] += 1
+    totals['score_sum'] += int(df['content_score'].to_numpy().sum(dtype=np.int64))
+    for name, column in INGEST_DIMENSIONS.items():
+        if name in LIST_ENCODINGS:
+            encoding = encode_list_column(df[column])
+            counts = zip(encoding['labels'], np.bincount(encoding['codes'], minlength=len(encoding['labels'])))
+        else:
+            counts = df[column].value_counts().items()
+        dictionary = totals['dimensions'][name]
+        for value, count in counts:
+            if count:
+                dictionary[value] = dictionary.get(value, 0) + int(count)
+
+def stream_catalog(path, store_path, chunk_rows=INGEST_CHUNK_ROWS):
+    """Read, process and write a catalog CSV chunk by chunk into a Parquet store
+
+    Only one chunk's raw and processed frames are held at once. Returns the
+    totals accumulated on the way: titles, chunks, the content score sum and
+    a value -> titles dictionary per INGEST_DIMENSIONS entry.
+    """
+    totals = {'rows': 0, 'chunks': 0, 'score_sum': 0, 'dimensions': {name: {} for name in INGEST_DIMENSIONS}}
+
+    def write(tmp_path):
+        writer = None
+        date_format = None
+        try:
+            # Every column is read as text, like the Polars backend, so chunk dtypes cannot drift
+            for chunk in pd.read_csv(path, dtype=str, chunksize=chunk_rows):
+                chunk.columns = normalize_column_names(chunk.columns)
+                if date_format is None and 'date_added' in chunk.columns:
+                    date_format = first_date_format(chunk['date_added'])
+                df = process_catalog(chunk, date_format)
+                update_ingest_totals(totals, df)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_path, stream_schema(df))
+                writer.write_table(pa.Table.from_pandas(stream_frame(df), schema=writer.schema, preserve_index=False))
+        finally:
+            if writer is not None:
+                writer.close()
+
+    replace_cache_file(store_path, write)
+    return totals
+
+def ingest_overview(totals):
+    """Catalog overview of the whole catalog from streaming totals, like aggregate_catalog_overview"""
+    types = totals['dimensions']['types']
+    return {
+        'total_titles': totals['rows'],
+        'movies': types.get('Movie', 0),
+        'tv_shows': types.get('TV Show', 0),
+        'unique_countries': len(totals['dimensions']['countries']),
+        'avg_score': totals['score_sum'] / totals['rows'] if totals['rows'] else np.nan
+    }
+
+# ----------------------------
+# Integer-coded List Columns
+# ----------------------------
+def encode_list_column(values):
+    """Integer-code a comma-separated column as flat item codes plus per-row offsets"""
+    categories = pd.Categorical(values)
+    
+    # Split only the distinct strings, then broadcast by category code
+    split = [[v.strip() for v in str(text).split(",") if v.strip()] for text in categories.categories]
+    labels = np.array(sorted({v for items in split for v in items}), dtype=object)
+    lookup = {label: code for code, label in enumerate(labels)}
+    code_dtype = np.int16 if len(labels) <= np.iinfo(np.int16).max else np.int32
+    
+    category_codes = np.array([lookup[v] for items in split for v in items], dtype=code_dtype)
+    category_lengths = np.array([len(items) for items in split] + [0], dtype=np.int64)
+    category_starts = np.concatenate([[0], np.cumsum(category_lengths)])[:-1]
+    
+    # Missing values have code -1, which picks the trailing zero-length slot
+    row_categories = categories.codes
+    lengths = category_lengths[row_categories]
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    gather = np.repeat(category_starts[row_categories] - offsets[:-1], lengths) + np.arange(offsets[-1])
+    
+    return {'labels': labels, 'codes': category_codes[gather], 'offsets': offsets}
+
+def build_bridge(encoding):
+    """Long-form title -> item table with one (row_id, code) pair per list item"""
+    lengths = np.diff(encoding['offsets'])
+    return pd.DataFrame({
+        'row_id': np.repeat(np.arange(len(lengths), dtype=np.int32), lengths),
+        'code': encoding['codes']
+    })
+
+def slice_bridge(bridge, rows, size):
+    """Bridge pairs belonging to the given row positions"""
+    bitmap = np.zeros(size, dtype=bool)
+    bitmap[rows] = True
+    return bridge[bitmap[bridge['row_id'].to_numpy()]]
+
+def ranked_codes(bridge, size):
+    """Codes present in a bridge table, most frequent first, ties in order of first appearance"""
+    present, first_seen, counts = np.unique(bridge['code'].to_numpy(), return_index=True, return_counts=True)
+    order = np.lexsort((first_seen, -counts))
+    ranked_counts = np.zeros(size, dtype=np.int64)
+    ranked_counts[present] = counts
+    return present[order], ranked_counts
+
+def positioned_bridge(bridge):
+    """Bridge table with a pos column, for query engines ranking codes like ranked_codes"""
+    # Ordering ties by their smallest pos is ranked_codes' first-appearance order
+    return bridge.assign(pos=np.arange(len(bridge), dtype=np.int64))
+
+def list_codes(encoding, wanted):
+    """Codes of the wanted labels in a list encoding; labels it does not have are dropped"""
+    labels = encoding['labels']
+    positions = np.searchsorted(labels, np.array(list(wanted), dtype=object))
+    return [int(p) for p, label in zip(positions, wanted) if p < len(labels) and labels[p] == label]
+
+def list_value_counts(bridge, labels):
+    """Item counts of a bridge table ordered like Series.value_counts"""
+    codes, counts = ranked_codes(bridge, len(labels))
+    return pd.Series(counts[codes], index=labels[codes])
+
+def decode_list_column(encoding):
+    """Expand a list encoding back into one Python list per row"""
+    items = encoding['labels'][encoding['codes']]
+    return [chunk.tolist() for chunk in np.split(items, encoding['offsets'][1:-1])]
+
+def catalog_memory_report(catalog):
+    """Compare the compact catalog footprint against the plain object/float64 layout"""
+    df = catalog['df']
+    report = []
+    for col in df.columns:
+        compact = df[col].memory_usage(deep=True, index=False)
+        planned = DTYPE_PLAN.get(col) or ('category' if col == 'month_name' else None)
+        if planned == 'category':
+            legacy = df[col].astype(object).memory_usage(deep=True, index=False)
+        elif planned:
+            legacy = len(df) * 8
+        else:
+            legacy = compact
+        report.append((col, str(df[col].dtype), legacy, compact))
+    
+    for name, column in (('genres', 'genre_list'), ('countries', 'country_list')):
+        encoding = catalog[name]
+        compact = (encoding['codes'].nbytes + encoding['offsets'].nbytes
+                   + sum(sys.getsizeof(label) for label in encoding['labels']))
+        legacy = len(df) * 8 + sum(sys.getsizeof(items) + sum(sys.getsizeof(v) for v in items)
+                                   for items in decode_list_column(encoding))
+        report.append((column, f"{encoding['codes'].dtype} codes + offsets", legacy, compact))
+        bridge = catalog[f'{name}_bridge']
+        report.append((f'{name}_bridge', 'row_id / code table', 0, bridge.memory_usage(index=False).sum()))
+    
+    search = catalog['index']['search']
+    compact = (sum(search[key].nbytes for key in ('offsets', 'rows', 'row_offsets', 'row_words'))
+               + sum(sys.getsizeof(word) for word in search['words'])
+               + sum(postings.nbytes for postings in search['trigrams'].values()))
+    report.append(('search_index', 'word / row postings + trigrams', 0, compact))
+    
+    report = pd.DataFrame(report, columns=['Column', 'Layout', 'Object Layout (KB)', 'Compact (KB)'])
+    report[['Object Layout (KB)', 'Compact (KB)']] = report[['Object Layout (KB)', 'Compact (KB)']] / 1024
+    report['Saved %'] = (1 - report['Compact (KB)'] / report['Object Layout (KB)'].replace(0, np.nan)) * 100
+    return report.round(1)
+
+# ----------------------------
+# Filter Index
+# ----------------------------
+def build_postings(values):
+    """Map every distinct value to the sorted row positions holding it"""
+    codes, uniques = pd.factorize(values)
+    order = np.argsort(codes, kind='stable').astype(np.int32)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    postings = np.split(order[(codes < 0).sum():], np.cumsum(counts)[:-1])
+    return dict(zip(uniques.tolist(), postings))
+
+def build_list_postings(bridge, labels):
+    """Map every list item to the sorted, de-duplicated rows containing it"""
+    codes = bridge['code'].to_numpy()
+    order = np.argsort(codes, kind='stable')
+    row_ids, codes = bridge['row_id'].to_numpy()[order], codes[order]
+    # Rows listing the same item twice appear as adjacent duplicates
+    keep = np.ones(len(codes), dtype=bool)
+    keep[1:] = (codes[1:] != codes[:-1]) | (row_ids[1:] != row_ids[:-1])
+    row_ids, codes = row_ids[keep], codes[keep]
+    counts = np.bincount(codes, minlength=len(labels))
+    return dict(zip(labels.tolist(), np.split(row_ids, np.cumsum(counts)[:-1])))
+
+def build_filter_index(catalog):
+    """Inverted index from every filterable value to its row positions"""
+    df = catalog['df']
+    index = {'size': len(df)}
+    for col in FILTER_DIMENSIONS:
+        index[col] = build_postings(df[col])
+    for name in LIST_ENCODINGS:
+        index[name] = build_list_postings(catalog[f'{name}_bridge'], catalog[name]['labels'])
+    index['search'] = build_search_index(df)
+    return index
+
+def union_rows(postings, size):
+    """Sorted union of several posting lists"""
+    if len(postings) == 1:
+        return postings[0]
+    bitmap = np.zeros(size, dtype=bool)
+    for rows in postings:
+        bitmap[rows] = True
+    return np.flatnonzero(bitmap)
+
+def query_filter_index(index, filters):
+    """Sorted row positions matching every filter (any value within a filter)"""
+    size = index['size']
+    selections = []
+    for dimension, wanted in filters.items():
+        if dimension == 'search':
+            selections.append(search_rows(index['search'], wanted))
+            continue
+        postings = index[dimension]
+        if dimension in RANGE_DIMENSIONS:
+            low, high = wanted
+            wanted = [value for value in postings if low <= value <= high]
+        matched = [postings[value] for value in wanted if value in postings]
+        if not matched:
+            return np.array([], dtype=np.int64)
+        selections.append(union_rows(matched, size))
+    
+    if not selections:
+        return np.arange(size)
+    
+    # Intersect from the most selective filter outwards
+    selections.sort(key=len)
+    rows = selections[0]
+    for other in selections[1:]:
+        bitmap = np.zeros(size, dtype=bool)
+        bitmap[other] = True
+        rows = rows[bitmap[rows]]
+    return rows
+
+# ----------------------------
+# Title Search
+# ----------------------------
+def fold_text(text):
+    """Lower-cased text with accents stripped, so 'Amélie' and 'AMELIE' compare equal"""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+def search_words(text):
+    """Folded words of a title, director or search box entry"""
+    return WORD_PATTERN.findall(fold_text(text))
+
+def distinct_keys(keys):
+    """Sorted distinct values of an integer array; sorting beats np.unique's hashing at this size"""
+    keys = np.sort(keys)
+    keep = np.ones(len(keys), dtype=bool)
+    keep[1:] = keys[1:] != keys[:-1]
+    return keys[keep]
+
+def field_word_pairs(values):
+    """Row positions and word codes of every word in a text column, plus the words coded"""
+    codes, uniques = pd.factorize(values)
+    # One regex pass over all distinct values, folded once each; a separator token closes each value's words
+    folded = ''.join(fold_text(str(value)).replace('\x1f', ' ') + '\x1f' for value in uniques.tolist())
+    tokens = np.array(re.findall(WORD_PATTERN.pattern + '|\x1f', folded), dtype=object)
+    markers = tokens == '\x1f'
+    counts = np.diff(np.flatnonzero(markers), prepend=-1) - 1
+    starts = np.concatenate(([0], np.cumsum(counts)))
+    word_codes, vocabulary = pd.factorize(tokens[~markers])
+    
+    rows = np.flatnonzero(codes >= 0)
+    per_row = counts[codes[rows]]
+    # Position of each row's n-th word within the words of all distinct values
+    first = np.repeat(starts[codes[rows]] - np.cumsum(per_row) + per_row, per_row)
+    return np.repeat(rows, per_row), word_codes[first + np.arange(per_row.sum())], np.asarray(vocabulary, dtype=object)
+
+def build_trigrams(words):
+    """Map every trigram of the space-padded words to the sorted word positions containing it"""
+    padded = '  ' + pd.Series(words, dtype=object) + ' '
+    lengths = padded.str.len().to_numpy()
+    grams, owners = [], []
+    for start in range(int(lengths.max(initial=0)) - 2):
+        owner = np.flatnonzero(lengths >= start + 3)
+        grams.append(padded.iloc[owner].str.slice(start, start + 3))
+        owners.append(owner)
+    if not grams:
+        return {}
+    gram_codes, labels = pd.factorize(pd.concat(grams, ignore_index=True))
+    # One key per (trigram, word) pair also drops words repeating a trigram
+    keys = distinct_keys(gram_codes.astype(np.int64) * len(words) + np.concatenate(owners))
+    gram_codes, owners = np.divmod(keys, len(words))
+    counts = np.bincount(gram_codes, minlength=len(labels))
+    return dict(zip(labels.tolist(), np.split(owners.astype(np.int32), np.cumsum(counts)[:-1])))
+
+def build_search_index(df):
+    """Sorted word vocabulary of SEARCH_FIELDS with rows per word, words per row and a trigram index"""
+    size = len(df)
+    fields = [field_word_pairs(df[field]) for field in SEARCH_FIELDS if field in df.columns]
+    rows = np.concatenate([np.array([], dtype=np.int64)] + [field[0] for field in fields])
+    
+    # Merge the fields' vocabularies into one sorted word list
+    bases = np.cumsum([0] + [len(field[2]) for field in fields])
+    codes, labels = pd.factorize(np.concatenate([np.array([], dtype=object)] + [field[2] for field in fields]))
+    labels = np.asarray(labels, dtype=object)
+    order = np.argsort(labels)
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    words = labels[order]
+    word_codes = np.concatenate([np.array([], dtype=np.int64)] +
+                                [rank[codes[base + field[1]]] for base, field in zip(bases, fields)])
+    
+    # Word-major pairs give each word's rows; row-major pairs give each row's words
+    by_word = distinct_keys(word_codes * max(size, 1) + rows)
+    word_codes, rows = np.divmod(by_word, max(size, 1))
+    by_row = np.sort(rows * max(len(words), 1) + word_codes)
+    return {
+        'size': size,
+        'words': words,
+        'offsets': np.concatenate(([0], np.cumsum(np.bincount(word_codes, minlength=len(words))))),
+        'rows': rows.astype(np.int32),
+        'row_offsets': np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=size)))),
+        'row_words': (by_row % max(len(words), 1)).astype(np.int32),
+        'trigrams': build_trigrams(words)
+    }
+
+def prefix_edit_distances(query, words, limit):
+    """Fewest edits turning query into some prefix of each word, one DP column per word character"""
+    # Prefixes more than limit characters longer than query are further than limit
+    width = len(query) + limit
+    lengths = np.array([len(word) for word in words], dtype=np.int64)
+    chars = np.frombuffer(''.join(word[:width].ljust(width, '\x00') for word in words).encode('utf-32-le'),
+                          dtype=np.uint32).reshape(len(words), width)
+    query_chars = np.frombuffer(query.encode('utf-32-le'), dtype=np.uint32)
+    previous = np.tile(np.arange(len(query) + 1, dtype=np.int32), (len(words), 1))
+    best = previous[:, -1].copy()
+    for column in range(width):
+        current = np.empty_like(previous)
+        current[:, 0] = column + 1
+        mismatch = chars[:, column, None] != query_chars
+        for row in range(1, len(query) + 1):
+            current[:, row] = np.minimum(np.minimum(previous[:, row], current[:, row - 1]) + 1,
+                                         previous[:, row - 1] + mismatch[:, row - 1])
+        np.minimum(best, np.where(lengths > column, current[:, -1], best), out=best)
+        previous = current
+    return best
+
+def fuzzy_words(search, word):
+    """Sorted vocabulary positions of the words starting within FUZZY_MIN_LENGTHS typos of word"""
+    max_edits = sum(len(word) >= length for length in FUZZY_MIN_LENGTHS)
+    padded = '  ' + word
+    grams = {padded[start:start + 3] for start in range(len(word))}
+    postings = [search['trigrams'][gram] for gram in grams if gram in search['trigrams']]
+    if not max_edits or not postings:
+        return np.array([], dtype=np.int64)
+    # Each edit destroys at most three trigrams, so close words share the rest
+    shared = np.bincount(np.concatenate(postings), minlength=len(search['words']))
+    candidates = np.flatnonzero(shared >= max(len(grams) - 3 * max_edits, 1))
+    # The trigram bound only prunes; every remaining candidate gets an exact distance
+    distances = prefix_edit_distances(word, search['words'][candidates], max_edits)
+    return candidates[distances <= max_edits].astype(np.int64)
+
+def word_matches(search, word):
+    """Sorted vocabulary positions of the words starting with word or, when none does, close to it"""
+    start, stop = np.searchsorted(search['words'], [word, word + '\U0010ffff'])
+    return np.arange(start, stop) if start < stop else fuzzy_words(search, word)
+
+def distinct_rows(rows, size):
+    """Sorted, de-duplicated rows, through a bitmap once they cover a sizable share of the catalog"""
+    if len(rows) * 32 < size:
+        return distinct_keys(rows)
+    bitmap = np.zeros(size, dtype=bool)
+    bitmap[rows] = True
+    return np.flatnonzero(bitmap)
+
+def posting_rows(search, positions):
+    """Sorted rows holding any of the words at sorted vocabulary positions"""
+    offsets = search['offsets']
+    if positions[-1] - positions[0] == len(positions) - 1:
+        # Prefix matches are one contiguous run of words and so one slice of rows
+        rows = search['rows'][offsets[positions[0]]:offsets[positions[-1] + 1]]
+    else:
+        rows = np.concatenate([search['rows'][offsets[position]:offsets[position + 1]] for position in positions])
+    return rows if len(positions) == 1 else distinct_rows(rows, search['size'])
+
+def rows_with_words(search, rows, positions):
+    """The rows, out of sorted rows, whose own words include one at sorted vocabulary positions"""
+    starts = search['row_offsets'][rows]
+    lengths = search['row_offsets'][rows + 1] - starts
+    firsts = np.cumsum(lengths) - lengths
+    words = search['row_words'][np.repeat(starts - firsts, lengths) + np.arange(lengths.sum())]
+    if positions[-1] - positions[0] == len(positions) - 1:
+        hits = (words >= positions[0]) & (words <= positions[-1])
+    else:
+        hits = np.isin(words, positions)
+    return rows[np.add.reduceat(hits, firsts) > 0]
+
+def search_rows(search, text):
+    """Sorted rows with, for every query word, a title or director word starting with it
+    or, when no word does, starting within a typo or two of it"""
+    matches = [word_matches(search, word) for word in search_words(text)]
+    if not matches:
+        return np.arange(search['size'])
+    if not all(len(positions) for positions in matches):
+        return np.array([], dtype=np.int64)
+    
+    # Read the rarest word's rows and check the other words against each row's own words
+    offsets = search['offsets']
+    matches.sort(key=lambda positions: (offsets[positions + 1] - offsets[positions]).sum())
+    rows = posting_rows(search, matches[0])
+    for positions in matches[1:]:
+        if not len(rows):
+            break
+        rows = rows_with_words(search, rows, positions)
+    return rows
+
+# ----------------------------
+# OLAP Cube
+# ----------------------------
+def build_cube(df):
+    """Title counts and content score measures over CUBE_DIMENSIONS"""
+    scores = df['content_score'].to_numpy()
+    bands = np.searchsorted(SCORE_BAND_EDGES, scores, side='right') - 1
+    facts = df[CUBE_DIMENSIONS[:-1]].assign(score_band=bands.astype(np.int8), content_score=scores)
+    cube = facts.groupby(CUBE_DIMENSIONS, dropna=False, observed=True)['content_score'].agg(
+        count='size', score_sum='sum', score_min='min', score_max='max')
+    return cube.reset_index()
+
+def score_bands_within(low, high):
+    """Score bands making up an inclusive score range exactly, or None when it splits a band"""
+    bands = []
+    for band in range(len(SCORE_BAND_EDGES) - 1):
+        first, last = SCORE_BAND_EDGES[band], SCORE_BAND_EDGES[band + 1] - 1
+        if last < low or first > high:
+            continue
+        if first < low or last > high:
+            return None
+        bands.append(band)
+    return bands
+
+def slice_cube(cube, filters):
+    """Cube cells matching the filters, or None when the cube cannot answer them exactly"""
+    if not set(filters) <= {'type', 'rating', 'release_year', 'content_score'}:
+        return None
+    # A score range splitting a band needs the rows; the band counts would only bound it
+    bands = score_bands_within(*filters['content_score']) if 'content_score' in filters else None
+    if 'content_score' in filters and bands is None:
+        return None
+    mask = np.ones(len(cube), dtype=bool)
+    for dimension, wanted in filters.items():
+        if dimension == 'release_year':
+            years = cube['release_year']
+            mask &= ((years >= wanted[0]) & (years <= wanted[1])).to_numpy(dtype=bool, na_value=False)
+        elif dimension == 'content_score':
+            mask &= cube['score_band'].isin(bands).to_numpy()
+        else:
+            mask &= cube[dimension].isin(wanted).to_numpy()
+    return cube[mask]
+
+def cube_counts(cube, dimension):
+    """Title counts per value of one cube dimension, missing values dropped"""
+    return cube.groupby(dimension, observed=True)['count'].sum()
+
+# ----------------------------
+# Catalog Queries
+# ----------------------------
+@dataclass(frozen=True)
+class CatalogQuery:
+    """One sidebar filter set; empty selections and None ranges leave a dimension unfiltered"""
+    release_years: tuple[int, int] | None = None
+    types: tuple[str, ...] = ()
+    ratings: tuple[str, ...] = ()
+    genres: tuple[str, ...] = ()
+    countries: tuple[str, ...] = ()
+    content_score: tuple[int, int] | None = None
+    search: str = ''
+    profile: str = DEFAULT_SCORING_PROFILE
+    
+    def __post_init__(self):
+        # Selections are stored sorted so equal filter sets compare and hash equal
+        for name in ('types', 'ratings', 'genres', 'countries'):
+            object.__setattr__(self, name, tuple(sorted(getattr(self, name))))
+        for name in ('release_years', 'content_score'):
+            if getattr(self, name) is not None:
+                object.__setattr__(self, name, tuple(int(bound) for bound in getattr(self, name)))
+        # Searches differing only in case, accents or punctuation match the same rows
+        object.__setattr__(self, 'search', ' '.join(search_words(self.search)))
+    
+    def filters(self) -> dict:
+        """Filter index dimensions and the values or (low, high) range wanted for each"""
+        filters = {
+            'release_year': self.release_years,
+            'type': self.types,
+            'content_score': self.content_score,
+            'rating': self.ratings,
+            'genres': self.genres,
+            'countries': self.countries,
+            'search': self.search
+        }
+        return {dimension: wanted for dimension, wanted in filters.items() if wanted}
+    
+    def signature(self, fingerprint: str) -> tuple:
+        """Hashable cache key for this query against one catalog"""
+        return (fingerprint, self)
+
+def default_query(df):
+    """The filter set the sidebar opens with"""
+    types = sorted(df['type'].dropna().unique().tolist())
+    years = df['release_year'].dropna()
+    min_year = int(years.min()) if len(years) else 1900
+    max_year = int(years.max()) if len(years) else datetime.now().year
+    return CatalogQuery(
+        release_years=(max(min_year, 2000), max_year),
+        types=['Movie', 'TV Show'] if 'Movie' in types and 'TV Show' in types else types[:2]
+    )
+
+# ----------------------------
+# Filtered Views & Chart Aggregations
+# ----------------------------
+def scored_catalog(catalog, profile):
+    """Frame, filter index and cube for a scoring profile"""
+    if profile == DEFAULT_SCORING_PROFILE:
+        return {'df': catalog['df'], 'index': catalog['index'], 'cube': catalog['cube']}
+    df = rescore_catalog(catalog['df'], profile)
+    return {
+        'df': df,
+        'index': dict(catalog['index'], content_score=build_postings(df['content_score'])),
+        'cube': build_cube(df)
+    }
+
+def make_view(catalog, scored, query):
+    """Lazy filtered view; the rows, bridges and cube slice are computed on first use"""
+    return {'catalog': catalog, 'df': scored['df'], 'index': scored['index'],
+            'cube': scored['cube'], 'filters': query.filters()}
+
+def view_frame(view):
+    """Filtered rows of the view"""
+    if 'frame' not in view:
+        view['frame'] = view['df'].iloc[query_filter_index(view['index'], view['filters'])]
+    return view['frame']
+
+def view_bridge(view, name):
+    """Genre or country bridge pairs of the filtered rows"""
+    key = f'{name}_bridge'
+    if key not in view:
+        view[key] = slice_bridge(view['catalog'][key], view_frame(view).index, len(view['df']))
+    return view[key]
+
+def view_cube(view):
+    """Cube cells of the filtered rows"""
+    # Genre and country filters are not cube dimensions; aggregate the filtered rows instead
+    if 'cube_slice' not in view:
+        cube = slice_cube(view['cube'], view['filters'])
+        view['cube_slice'] = build_cube(view_frame(view)) if cube is None else cube
+    return view['cube_slice']
+
+def histogram_edges(low, high, nbins=HISTOGRAM_BINS, min_width=1.0):
+    """Start and width of about nbins bins covering [low, high], with a 1/2/2.5/5 x 10^k width"""
+    raw_width = (high - low) / nbins
+    width = min_width
+    if raw_width > min_width:
+        magnitude = 10 ** np.floor(np.log10(raw_width))
+        width = next(step * magnitude for step in (1, 2, 2.5, 5, 10) if step * magnitude >= raw_width)
+    return float(np.floor(low / width) * width), float(width)
+
+def histogram_frame(start, width, bins, counts):
+    """Every bin from the first to the last occupied one with its [bin_start, bin_end) count"""
+    size = int(bins.max()) + 1 if len(bins) else 0
+    full = np.zeros(size, dtype=np.int64)
+    full[bins] = counts
+    edges = start + np.arange(size + 1) * width
+    return pd.DataFrame({'bin_start': edges[:-1], 'bin_end': edges[1:], 'count': full})
+
+def histogram(values):
+    """Pre-binned counts of float values; the chart payload no longer grows with the rows"""
+    if not len(values):
+        return histogram_frame(0.0, 1.0, np.array([], dtype=np.int64), np.array([], dtype=np.int64))
+    start, width = histogram_edges(values.min(), values.max())
+    bins, counts = np.unique(np.floor((values - start) / width).astype(np.int64), return_counts=True)
+    return histogram_frame(start, width, bins, counts)
+
+def aggregate_catalog_overview(view):
+    df = view['df']
+    country_labels = view['catalog']['countries']['labels']
+    return {
+        'total_titles': len(df),
+        'movies': int((df['type'] == 'Movie').sum()),
+        'tv_shows': int((df['type'] == 'TV Show').sum()),
+        'unique_countries': len(list_value_counts(view['catalog']['countries_bridge'], country_labels)),
+        'avg_score': df['content_score'].mean()
+    }
+
+def aggregate_overview(view):
+    frame = view_frame(view)
+    country_labels = view['catalog']['countries']['labels']
+    return {
+        'total_titles': len(frame),
+        'movies': int((frame['type'] == 'Movie').sum()),
+        'tv_shows': int((frame['type'] == 'TV Show').sum()),
+        'unique_countries': len(list_value_counts(view_bridge(view, 'countries'), country_labels)),
+        'avg_score': frame['content_score'].mean()
+    }
+
+def aggregate_tv_metrics(view):
+    seasons = view_frame(view).loc[lambda f: f['type'] == 'TV Show', 'tv_seasons']
+    has_seasons = seasons.notna().any()
+    return {
+        'total_tv_shows': len(seasons),
+        'avg_seasons': seasons.mean() if has_seasons else 0,
+        'max_seasons': seasons.max() if has_seasons else 0
+    }
+
+def aggregate_quality_metrics(view):
+    cube = view_cube(view)
+    scored_titles = cube['count'].sum()
+    return {
+        'avg_quality': cube['score_sum'].sum() / scored_titles if scored_titles > 0 else np.nan,
+        'min_quality': float(cube['score_min'].min()),
+        'max_quality': float(cube['score_max'].max())
+    }
+
+def aggregate_yearly_additions(view):
+    return cube_counts(view_cube(view), 'year_added').reset_index(name='count').sort_values('year_added')
+
+def aggregate_monthly_counts(view):
+    return cube_counts(view_cube(view), 'month_added')
+
+def aggregate_decade_counts(view):
+    cube = view_cube(view)
+    return cube_counts(cube.assign(decade=cube['release_year'] // 10 * 10), 'decade')
+
+def aggregate_quarterly_counts(view):
+    return cube_counts(view_cube(view), 'quarter_added').reset_index(name='count')
+
+def aggregate_type_year_growth(view):
+    return cube_counts(view_cube(view), ['year_added', 'type']).reset_index(name='count')
+
+def aggregate_genre_counts(view):
+    return list_value_counts(view_bridge(view, 'genres'), view['catalog']['genres']['labels']).head(15)
+
+def aggregate_movie_minutes_histogram(view):
+    frame = view_frame(view)
+    return histogram(frame.loc[frame['type'] == 'Movie', 'movie_minutes'].dropna().to_numpy(dtype=float))
+
+def aggregate_season_counts(view):
+    frame = view_frame(view)
+    seasons = frame.loc[frame['type'] == 'TV Show', 'tv_seasons'].dropna()
+    season_counts = seasons.value_counts().reset_index()
+    season_counts.columns = ['seasons', 'count']
+    return season_counts.sort_values('seasons')
+
+def aggregate_country_counts(view):
+    return list_value_counts(view_bridge(view, 'countries'), view['catalog']['countries']['labels']).head(20)
+
+def aggregate_country_type_counts(view):
+    bridge = view_bridge(view, 'countries')
+    labels = view['catalog']['countries']['labels']
+    top_10_codes, _ = ranked_codes(bridge, len(labels))
+    bridge = bridge[np.isin(bridge['code'].to_numpy(), top_10_codes[:10])]
+    return pd.DataFrame({
+        'country_list': labels[bridge['code'].to_numpy()],
+        'type': view['df']['type'].to_numpy()[bridge['row_id'].to_numpy()]
+    }).groupby(['country_list', 'type']).size().reset_index(name='count')
+
+def aggregate_quality_by_country(view):
+    bridge = view_bridge(view, 'countries')
+    labels = view['catalog']['countries']['labels']
+    codes = bridge['code'].to_numpy()
+    scores = view['df']['content_score'].to_numpy(dtype=float)[bridge['row_id'].to_numpy()]
+    top_codes, country_counts = ranked_codes(bridge, len(labels))
+    top_codes = top_codes[:15]
+    country_scores = np.bincount(codes, weights=scores, minlength=len(labels))
+    quality_by_country = pd.DataFrame({
+        'country_list': labels[top_codes],
+        'content_score': country_scores[top_codes] / country_counts[top_codes]
+    })
+    return quality_by_country.sort_values('content_score', ascending=False).head(10)
+
+def coproduction_counts(rows, codes, size, countries):
+    """Country pairs sharing titles, as the upper triangle of the incidence matrix's Gram matrix"""
+    incidence = sparse.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, codes)), shape=(size, countries))
+    # A country listed twice on one title still co-produces it once
+    incidence.sum_duplicates()
+    incidence.data[:] = 1
+    pairs = sparse.triu(incidence.T @ incidence, k=1).tocoo()
+    return pairs.row, pairs.col, pairs.data
+
+def coproduction_frame(labels, first, second, titles):
+    """Co-production edge list without placeholder countries, strongest pairs first"""
+    pairs = pd.DataFrame({'country_a': labels[first], 'country_b': labels[second],
+                          'titles': np.asarray(titles, dtype=np.int64)})
+    pairs = pairs[~pairs['country_a'].isin(PLACEHOLDER_VALUES) & ~pairs['country_b'].isin(PLACEHOLDER_VALUES)]
+    return pairs.sort_values(['titles', 'country_a', 'country_b'], ascending=[False, True, True],
+                             ignore_index=True)
+
+def aggregate_coproduction_pairs(view):
+    bridge = view_bridge(view, 'countries')
+    labels = view['catalog']['countries']['labels']
+    return coproduction_frame(labels, *coproduction_counts(bridge['row_id'].to_numpy(), bridge['code'].to_numpy(),
+                                                           len(view['df']), len(labels)))
+
+def aggregate_rating_counts(view):
+    rating_counts = cube_counts(view_cube(view), 'rating').sort_values(ascending=False, kind='stable')
+    return rating_counts[rating_counts > 0].head(10)
+
+def aggregate_content_score_histogram(view):
+    return histogram(view_frame(view)['content_score'].to_numpy(dtype=float))
+
+def aggregate_quality_tiers(view):
+    cube = view_cube(view)
+    band_quality = np.array(SCORE_BAND_QUALITY, dtype=object)[cube['score_band'].to_numpy()]
+    quality_tiers = cube.groupby(band_quality)['count'].sum()
+    quality_tiers = quality_tiers.reindex(view['df']['quality_category'].cat.categories, fill_value=0)
+    return quality_tiers.sort_values(ascending=False, kind='stable')
+
+def aggregate_type_counts(view):
+    type_counts = cube_counts(view_cube(view), 'type').sort_values(ascending=False, kind='stable')
+    return type_counts[type_counts > 0]
+
+CHART_AGGREGATIONS = {
+    'overview': aggregate_overview,
+    'tv_metrics': aggregate_tv_metrics,
+    'quality_metrics': aggregate_quality_metrics,
+    'yearly_additions': aggregate_yearly_additions,
+    'monthly_counts': aggregate_monthly_counts,
+    'decade_counts': aggregate_decade_counts,
+    'quarterly_counts': aggregate_quarterly_counts,
+    'type_year_growth': aggregate_type_year_growth,
+    'genre_counts': aggregate_genre_counts,
+    'movie_minutes_histogram': aggregate_movie_minutes_histogram,
+    'season_counts': aggregate_season_counts,
+    'country_counts': aggregate_country_counts,
+    'country_type_counts': aggregate_country_type_counts,
+    'quality_by_country': aggregate_quality_by_country,
+    'rating_counts': aggregate_rating_counts,
+    'content_score_histogram': aggregate_content_score_histogram,
+    'quality_tiers': aggregate_quality_tiers,
+    'type_counts': aggregate_type_counts
+}
+
+# The co-production network is a sparse matrix product and needs scipy
+if SPARSE_AVAILABLE:
+    CHART_AGGREGATIONS['coproduction_pairs'] = aggregate_coproduction_pairs
+
+def view_rows(view):
+    """Rows an aggregation read: filtered rows, or cube cells when it stayed on the cube"""
+    if 'frame' in view:
+        return len(view['frame'])
+    return len(view['cube_slice']) if 'cube_slice' in view else None
+
+def query_catalog(catalog, query, chart_ids=None, backend=None):
+    """Run chart aggregations for one query without any caching"""
+    backend = backend or get_backend()
+    view = backend['make_view'](catalog, scored_catalog(catalog, query.profile), query)
+    aggregations = backend['aggregations']
+    return {chart_id: aggregations[chart_id](view) for chart_id in chart_ids or aggregations}
+
+# ----------------------------
+# Query Backends
+# ----------------------------
+def get_backend(name=QUERY_BACKEND):
+    """Catalog reader, view factory and chart aggregations of a backend; optional engines import lazily"""
+    if name == 'duckdb':
+        import analytics_duckdb
+        return analytics_duckdb.BACKEND
+    if name == 'polars':
+        import analytics_polars
+        return analytics_polars.BACKEND
+    return {'read_catalog': read_catalog, 'make_view': make_view, 'aggregations': CHART_AGGREGATIONS}
+
+def results_match(expected, actual):
+    """Whether two chart results agree in values, labels and order"""
+    if isinstance(expected, dict):
+        return expected.keys() == actual.keys() and all(results_match(expected[k], actual[k]) for k in expected)
+    try:
+        if isinstance(expected, pd.DataFrame):
+            # Row labels are not shown by the charts and differ between engines
+            pd.testing.assert_frame_equal(expected.reset_index(drop=True), actual.reset_index(drop=True),
+                                          check_dtype=False, check_categorical=False, rtol=1e-9)
+        elif isinstance(expected, pd.Series):
+            pd.testing.assert_series_equal(expected, actual, check_dtype=False, check_index_type=False,
+                                           check_categorical=False, rtol=1e-9)
+        else:
+            return bool(np.isclose(float(expected), float(actual), rtol=1e-9, equal_nan=True))
+    except AssertionError:
+        return False
+    return True
+
+def backend_mismatches(catalog, backend, queries):
+    """(chart_id, query) pairs where a backend disagrees with the pandas aggregations"""
+    reference = get_backend('pandas')
+    mismatches = []
+    for query in queries:
+        expected = query_catalog(catalog, query, backend=reference)
+        actual = query_catalog(catalog, query, backend=backend)
+        mismatches += [(chart_id, query) for chart_id in expected
+                       if not results_match(expected[chart_id], actual[chart_id])]
+    return mismatches
+
+# ----------------------------
+# Startup Warm-up
+# ----------------------------
+# Changes to the default view warmed at startup, as CatalogQuery fields;
+# DASHBOARD_WARMUP_PRESETS may name a JSON file with a list of these instead
+WARMUP_PRESETS = [
+    {'types': ['Movie']},
+    {'types': ['TV Show']},
+    {'content_score': QUALITY_TIERS['Ultra (85-100)']},
+    {'content_score': QUALITY_TIERS['Premium (70-85)']},
+    {'profile': 'Fresh Releases'},
+    {'profile': 'Family Friendly'}
+]
+
+# Countries the sidebar offers, most frequent first
+WARMUP_TOP_COUNTRIES = 20
+
+# Catalog, backend and scored catalogs of a warm-up worker process
+_warmup_worker = {}
+
+def load_warmup_presets(path=None):
+    """Warm-up presets from a JSON file, or the built-in list"""
+    path = path or os.environ.get('DASHBOARD_WARMUP_PRESETS')
+    if not path:
+        return WARMUP_PRESETS
+    with open(path) as f:
+        return json.load(f)
+
+def warmup_queries(catalog, presets=WARMUP_PRESETS):
+    """Default view, each preset applied to it, and every single genre and top-country selection"""
+    base = default_query(catalog['df'])
+    queries = [base] + [replace(base, **preset) for preset in presets]
+    queries += [replace(base, genres=(genre,)) for genre in catalog['genres']['labels']]
+    countries = list_value_counts(catalog['countries_bridge'], catalog['countries']['labels'])
+    queries += [replace(base, countries=(country,)) for country in countries.head(WARMUP_TOP_COUNTRIES).index]
+    return list(dict.fromkeys(queries))
+
+def init_warmup_worker(path):
+    _warmup_worker['catalog'] = load_catalog(path)
+    _warmup_worker['backend'] = get_backend()
+    _warmup_worker['scored'] = {}
+
+def warm_query(query):
+    """Every chart aggregation for one query inside a warm-up worker"""
+    started = time.perf_counter()
+    catalog, backend, scored = _warmup_worker['catalog'], _warmup_worker['backend'], _warmup_worker['scored']
+    if query.profile not in scored:
+        scored[query.profile] = scored_catalog(catalog, query.profile)
+    view = backend['make_view'](catalog, scored[query.profile], query)
+    results = {chart_id: aggregate(view) for chart_id, aggregate in backend['aggregations'].items()}
+    return query, results, time.perf_counter() - started
+
+def precompute_queries(path, queries, workers=None):
+    """Yield (query, chart results, seconds) as worker processes finish each query"""
+    workers = max(1, min(workers or os.cpu_count() or 1, len(queries)))
+    # Spawned workers import only this module, never the threaded Streamlit server;
+    # each loads the catalog from the processed cache the server has just written
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=init_warmup_worker,
+                             initargs=(path,)) as pool:
+        for future in as_completed([pool.submit(warm_query, query) for query in queries]):
+            yield future.result()
+
+# ----------------------------
+# Similar Titles
+# ----------------------------
+def categorical_encoding(values):
+    """Single-valued column in the offsets/codes layout of encode_list_column"""
+    categories = pd.Categorical(values)
+    present = categories.codes >= 0
+    return {'labels': np.asarray(categories.categories, dtype=object), 'codes': categories.codes[present],
+            'offsets': np.concatenate(([0], np.cumsum(present)))}
+
+def duration_band_encoding(df):
+    """Movie-minute or season-count band of every title in the offsets/codes layout"""
+    codes = np.full(len(df), -1, dtype=np.int64)
+    labels = []
+    for column, edges in DURATION_BANDS.items():
+        values = df[column].to_numpy(dtype=float, na_value=np.nan)
+        bands = np.searchsorted(edges, values, side='right') - 1
+        valid = ~np.isnan(values) & (bands >= 0)
+        codes[valid] = bands[valid] + len(labels)
+        labels += [f'{column} >= {edge}' for edge in edges]
+    present = codes >= 0
+    return {'labels': np.array(labels, dtype=object), 'codes': codes[present],
+            'offsets': np.concatenate(([0], np.cumsum(present)))}
+
+def build_similarity_features(catalog):
+    """Sparse title x feature matrix whose row dot products are weighted cosine similarities"""
+    df = catalog['df']
+    encodings = {
+        'genres': catalog['genres'],
+        'countries': catalog['countries'],
+        'director': encode_list_column(df['director']) if 'director' in df.columns else None,
+        'rating': categorical_encoding(df['rating']),
+        'type': categorical_encoding(df['type']),
+        'duration_band': duration_band_encoding(df)
+    }
+    rows, columns, values, width = [], [], [], 0
+    for name, weight in SIMILARITY_WEIGHTS.items():
+        encoding = encodings[name]
+        if encoding is None:
+            continue
+        group_rows = np.repeat(np.arange(len(df)), np.diff(encoding['offsets']))
+        keep = ~np.isin(encoding['labels'], PLACEHOLDER_VALUES)[encoding['codes']]
+        group_rows, group_codes = group_rows[keep], encoding['codes'][keep].astype(np.int64)
+        # Spread the weight over a title's items, so listing more genres does not count for more
+        items = np.bincount(group_rows, minlength=len(df))
+        rows.append(group_rows)
+        columns.append(group_codes + width)
+        values.append(weight / np.sqrt(items[group_rows]))
+        width += len(encoding['labels'])
+    
+    features = sparse.csr_matrix(
+        (np.concatenate(values).astype(np.float32), (np.concatenate(rows), np.concatenate(columns))),
+        shape=(len(df), width))
+    norms = np.sqrt(np.asarray(features.multiply(features).sum(axis=1)).ravel())
+    scale = np.divide(1, norms, out=np.zeros_like(norms), where=norms > 0)
+    return sparse.csr_matrix(sparse.diags(scale.astype(np.float32)) @ features)
+
+def top_k(scores, k):
+    """Column positions and values of the k largest scores in each row, best first"""
+    k = min(k, scores.shape[1])
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.lexsort((top, -top_scores), axis=1)
+    return np.take_along_axis(top, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+
+def similar_titles(features, row, k=SIMILAR_TITLES):
+    """Positions and similarities of the k titles most similar to one row, best first"""
+    scores = features @ features[row].toarray().ravel()
+    scores[row] = -np.inf
+    neighbors, scores = top_k(scores[np.newaxis], k)
+    return neighbors[0], scores[0]
+
+def build_neighbor_table(features, k=SIMILAR_TITLES, start=0, stop=None):
+    """Top-k neighbours of the titles in rows [start, stop), scored in blocks against the whole catalog"""
+    size = features.shape[0]
+    stop = size if stop is None else stop
+    block_rows = max(1, SIMILARITY_BLOCK_CELLS // max(size, 1))
+    neighbors = np.empty((stop - start, min(k, size)), dtype=np.int32)
+    scores = np.empty((stop - start, min(k, size)), dtype=np.float32)
+    for first in range(start, stop, block_rows):
+        last = min(first + block_rows, stop)
+        # Sparse catalog times the block's dense feature columns: one pass over the matrix per block
+        block = np.ascontiguousarray((features @ features[first:last].T.toarray()).T)
+        block[np.arange(last - first), np.arange(first, last)] = -np.inf
+        neighbors[first - start:last - start], scores[first - start:last - start] = top_k(block, k)
+    return {'neighbors': neighbors, 'scores': scores}
+
+_neighbor_worker = {}
+
+def init_neighbor_worker(path):
+    _neighbor_worker['features'] = build_similarity_features(load_catalog(path))
+
+def neighbor_rows(start, stop, k):
+    """Neighbour table rows [start, stop) inside a worker process"""
+    return build_neighbor_table(_neighbor_worker['features'], k, start, stop)
+
+def precompute_neighbor_table(path, k=SIMILAR_TITLES, workers=None):
+    """Neighbour table of a catalog, its row ranges split over spawned worker processes"""
+    size = len(load_catalog(path)['df'])
+    workers = max(1, min(workers or os.cpu_count() or 1, size))
+    # A few ranges per worker keeps every core busy until the end
+    bounds = np.linspace(0, size, workers * 4 + 1).astype(int).tolist()
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=init_neighbor_worker,
+                             initargs=(path,)) as pool:
+        parts = list(pool.map(neighbor_rows, bounds[:-1], bounds[1:], [k] * (len(bounds) - 1)))
+    return {key: np.concatenate([part[key] for part in parts]) for key in ('neighbors', 'scores')}
+
+def neighbor_table_path(path, fingerprint):
+    """Location of the precomputed neighbour table of a source catalog"""
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(CACHE_DIR, f"{name}-neighbors-{fingerprint}.npz")
+
+def write_neighbor_table(table, table_path):
+    """Persist a neighbour table, recording the feature weights it was scored with"""
+    def write(tmp_path):
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, weights=json.dumps(SIMILARITY_WEIGHTS), **table)
+    
+    replace_cache_file(table_path, write)
+
+def read_neighbor_table(table_path):
+    """Load a neighbour table, or None when it is missing or was scored with other weights"""
+    if not os.path.exists(table_path):
+        return None
+    with np.load(table_path) as stored:
+        if json.loads(str(stored['weights'])) != SIMILARITY_WEIGHTS:
+            return None
+        return {'neighbors': stored['neighbors'], 'scores': stored['scores']}
+
+def load_similarity(catalog, path=None):
+    """Similarity features of a catalog and, when one was written for it, its neighbour table"""
+    table = read_neighbor_table(neighbor_table_path(path, catalog['fingerprint'])) if path else None
+    return {'features': build_similarity_features(catalog), 'table': table}
+
+def lookup_similar(similarity, row, k=SIMILAR_TITLES):
+    """Similar titles from the neighbour table when it holds k of them, otherwise scored live"""
+    table = similarity['table']
+    if table is not None and table['neighbors'].shape[1] >= k:
+        neighbors, scores = table['neighbors'][row, :k], table['scores'][row, :k]
+    else:
+        neighbors, scores = similar_titles(similarity['features'], row, k)
+    # Titles sharing no feature at all are not similar, however few others there are
+    keep = scores > 0
+    return neighbors[keep], scores[keep]
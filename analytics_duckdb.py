@@ -0,0 +1,327 @@
+"""
+DuckDB query backend for the analytics core.
+
+The processed catalog and its genre/country bridge tables are copied once into
+an embedded DuckDB database; each view turns a CatalogQuery into a WHERE clause
+and every chart aggregation runs as SQL on DuckDB's vectorized, multi-threaded
+engine. Results match the pandas aggregations in analytics.py exactly: the SQL
+does the scans and grouping, and only the handful of result rows are reshaped
+in pandas so tie ordering and dtypes line up.
+
+Select it with DASHBOARD_BACKEND=duckdb.
+"""
+import threading
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+from analytics import (
+    DEFAULT_SCORING_PROFILE, LIST_ENCODINGS, RANGE_DIMENSIONS, QUALITY_TIERS, SPARSE_AVAILABLE, TITLE_COLUMNS,
+    coproduction_counts, coproduction_frame, histogram_edges, histogram_frame, list_codes, make_view,
+    positioned_bridge, read_catalog, search_rows
+)
+
+_databases = {}
+_databases_lock = threading.Lock()
+
+
+def catalog_database(catalog):
+    """Embedded database holding one catalog, created on first use and shared process-wide"""
+    with _databases_lock:
+        if catalog['fingerprint'] not in _databases:
+            con = duckdb.connect()
+            df = catalog['df']
+            titles = df[TITLE_COLUMNS].assign(row_id=np.arange(len(df), dtype=np.int32))
+            con.register('titles_frame', titles)
+            con.execute('CREATE TABLE titles AS SELECT * FROM titles_frame')
+            con.unregister('titles_frame')
+            for name in LIST_ENCODINGS:
+                con.register('bridge_frame', positioned_bridge(catalog[f'{name}_bridge']))
+                con.execute(f'CREATE TABLE {name}_bridge AS SELECT * FROM bridge_frame')
+                con.unregister('bridge_frame')
+            _databases[catalog['fingerprint']] = {'con': con, 'profiles': {DEFAULT_SCORING_PROFILE: 'titles'},
+                                                  'lock': threading.Lock()}
+        return _databases[catalog['fingerprint']]
+
+
+def profile_relation(database, profile, scored_df):
+    """Titles relation carrying the content scores of a scoring profile"""
+    with database['lock']:
+        if profile not in database['profiles']:
+            table = f"scores_{len(database['profiles'])}"
+            scores = pd.DataFrame({'row_id': np.arange(len(scored_df), dtype=np.int32),
+                                   'content_score': scored_df['content_score'].to_numpy()})
+            database['con'].register('scores_frame', scores)
+            database['con'].execute(f'CREATE TABLE {table} AS SELECT * FROM scores_frame')
+            database['con'].unregister('scores_frame')
+            database['profiles'][profile] = (
+                f'(SELECT t.* REPLACE (s.content_score AS content_score) FROM titles t JOIN {table} s USING (row_id))')
+        return database['profiles'][profile]
+
+
+def filter_clause(catalog, filters):
+    """SQL predicate and parameters equivalent to query_filter_index"""
+    clauses, params = [], []
+    for dimension, wanted in filters.items():
+        if dimension == 'search':
+            # The word index is not in the database; its matches go in as one list parameter
+            clauses.append('row_id IN (SELECT UNNEST(?::INTEGER[]))')
+            params.append(search_rows(catalog['index']['search'], wanted).tolist())
+            continue
+        if dimension in RANGE_DIMENSIONS:
+            clauses.append(f'{dimension} BETWEEN ? AND ?')
+            params += [int(wanted[0]), int(wanted[1])]
+            continue
+        if dimension in LIST_ENCODINGS:
+            codes = list_codes(catalog[dimension], wanted)
+            column, source = 'row_id', f'(SELECT row_id FROM {dimension}_bridge WHERE code IN ({{}}))'
+        else:
+            codes = [str(value) for value in wanted]
+            column, source = f'CAST({dimension} AS VARCHAR)', '({})'
+        if not codes:
+            return 'FALSE', []
+        clauses.append(f"{column} IN {source.format(', '.join('?' * len(codes)))}")
+        params += codes
+    return ' AND '.join(clauses) or 'TRUE', params
+
+
+def make_duckdb_view(catalog, scored, query):
+    """View whose aggregations run as SQL against the catalog's DuckDB database"""
+    view = make_view(catalog, scored, query)
+    view['database'] = catalog_database(catalog)
+    view['relation'] = profile_relation(view['database'], query.profile, scored['df'])
+    return view
+
+
+def view_filter(view):
+    """WITH clause defining the filtered relation f, and its parameters, built on first use"""
+    # Charts served from the result cache never run SQL, so a title search only runs on a miss
+    if 'cte' not in view:
+        where, params = filter_clause(view['catalog'], view['filters'])
+        view['cte'] = f"WITH f AS (SELECT * FROM {view['relation']} WHERE {where})"
+        view['params'] = params
+    return view['cte'], view['params']
+
+
+def run_sql(view, sql):
+    """Run a query over the filtered relation f and return the result as a DataFrame"""
+    cte, params = view_filter(view)
+    # A cursor per call lets concurrent sessions share the database safely
+    with view['database']['con'].cursor() as cursor:
+        return cursor.execute(f"{cte} {sql}", params).df()
+
+
+def counts_series(result, index):
+    return pd.Series(result['count'].to_numpy(dtype=np.int64), index=index, name='count')
+
+
+def categorical_counts(view, column):
+    """Counts per category from a SQL GROUP BY, reindexed to category order like cube_counts"""
+    categories = view['df'][column].cat.categories
+    result = run_sql(view, f'SELECT CAST({column} AS VARCHAR) AS {column}, COUNT(*) AS count FROM f '
+                           f'WHERE {column} IS NOT NULL GROUP BY 1')
+    result = result.set_index(column).reindex(categories).dropna()
+    index = pd.CategoricalIndex(result.index, categories=categories, name=column)
+    return counts_series(result, index)
+
+
+def numeric_counts(view, expression, column):
+    result = run_sql(view, f'SELECT {expression} AS {column}, COUNT(*) AS count FROM f '
+                           f'WHERE {column} IS NOT NULL GROUP BY 1 ORDER BY 1')
+    return result.astype({'count': np.int64})
+
+
+def ranked_list_counts(view, name, limit=None):
+    """Codes and counts of a list column among filtered rows, ranked by the SQL ORDER BY"""
+    result = run_sql(view, f'SELECT b.code, COUNT(*) AS count, MIN(b.pos) AS first_seen FROM {name}_bridge b '
+                           f'WHERE b.row_id IN (SELECT row_id FROM f) GROUP BY b.code '
+                           f"ORDER BY count DESC, first_seen{f' LIMIT {int(limit)}' if limit else ''}")
+    return result['code'].to_numpy(dtype=np.int64), result['count'].to_numpy(dtype=np.int64)
+
+
+def histogram_counts(view, column, where):
+    """Round-width bin counts of a column, binned in SQL with the pandas bin edges"""
+    bounds = run_sql(view, f'SELECT MIN({column}) AS low, MAX({column}) AS high FROM f WHERE {where}').iloc[0]
+    if pd.isna(bounds['low']):
+        return histogram_frame(0.0, 1.0, np.array([], dtype=np.int64), np.array([], dtype=np.int64))
+    start, width = histogram_edges(float(bounds['low']), float(bounds['high']))
+    result = run_sql(view, f'SELECT CAST(FLOOR((CAST({column} AS DOUBLE) - {start!r}) / {width!r}) AS BIGINT) AS bin, '
+                           f'COUNT(*) AS count FROM f WHERE {where} GROUP BY 1')
+    return histogram_frame(start, width, result['bin'].to_numpy(dtype=np.int64), result['count'].to_numpy(dtype=np.int64))
+
+
+def nan_if_null(value):
+    return np.nan if value is None or pd.isna(value) else value
+
+
+def aggregate_overview(view):
+    row = run_sql(view, "SELECT COUNT(*) AS total, COUNT(*) FILTER (type = 'Movie') AS movies, "
+                        "COUNT(*) FILTER (type = 'TV Show') AS tv_shows, AVG(content_score) AS avg_score, "
+                        "(SELECT COUNT(DISTINCT code) FROM countries_bridge "
+                        " WHERE row_id IN (SELECT row_id FROM f)) AS countries FROM f").iloc[0]
+    return {
+        'total_titles': int(row['total']),
+        'movies': int(row['movies']),
+        'tv_shows': int(row['tv_shows']),
+        'unique_countries': int(row['countries']),
+        'avg_score': nan_if_null(row['avg_score'])
+    }
+
+
+def aggregate_tv_metrics(view):
+    row = run_sql(view, "SELECT COUNT(*) AS total, COUNT(tv_seasons) AS with_seasons, "
+                        "AVG(tv_seasons) AS avg_seasons, MAX(tv_seasons) AS max_seasons "
+                        "FROM f WHERE type = 'TV Show'").iloc[0]
+    has_seasons = row['with_seasons'] > 0
+    return {
+        'total_tv_shows': int(row['total']),
+        'avg_seasons': row['avg_seasons'] if has_seasons else 0,
+        'max_seasons': row['max_seasons'] if has_seasons else 0
+    }
+
+
+def aggregate_quality_metrics(view):
+    row = run_sql(view, 'SELECT COUNT(*) AS titles, SUM(content_score) AS score_sum, '
+                        'MIN(content_score) AS score_min, MAX(content_score) AS score_max FROM f').iloc[0]
+    return {
+        'avg_quality': row['score_sum'] / row['titles'] if row['titles'] > 0 else np.nan,
+        'min_quality': float(nan_if_null(row['score_min'])),
+        'max_quality': float(nan_if_null(row['score_max']))
+    }
+
+
+def aggregate_yearly_additions(view):
+    return numeric_counts(view, 'year_added', 'year_added')
+
+
+def aggregate_monthly_counts(view):
+    result = numeric_counts(view, 'month_added', 'month_added')
+    return counts_series(result, pd.Index(result['month_added'], name='month_added'))
+
+
+def aggregate_decade_counts(view):
+    result = numeric_counts(view, 'release_year // 10 * 10', 'decade')
+    return counts_series(result, pd.Index(result['decade'], name='decade'))
+
+
+def aggregate_quarterly_counts(view):
+    return numeric_counts(view, 'quarter_added', 'quarter_added')
+
+
+def aggregate_type_year_growth(view):
+    result = run_sql(view, 'SELECT year_added, type, COUNT(*) AS count FROM f '
+                           'WHERE year_added IS NOT NULL AND type IS NOT NULL GROUP BY 1, 2 ORDER BY 1, 2')
+    result['type'] = pd.Categorical(result['type'].astype(object), categories=view['df']['type'].cat.categories)
+    return result.astype({'count': np.int64})
+
+
+def list_counts(view, name, limit):
+    codes, counts = ranked_list_counts(view, name, limit)
+    return pd.Series(counts, index=view['catalog'][name]['labels'][codes])
+
+
+def aggregate_genre_counts(view):
+    return list_counts(view, 'genres', 15)
+
+
+def aggregate_movie_minutes_histogram(view):
+    return histogram_counts(view, 'movie_minutes', "type = 'Movie' AND movie_minutes IS NOT NULL")
+
+
+def aggregate_season_counts(view):
+    result = run_sql(view, "SELECT tv_seasons AS seasons, COUNT(*) AS count FROM f "
+                           "WHERE type = 'TV Show' AND tv_seasons IS NOT NULL GROUP BY 1 ORDER BY 1")
+    return result.astype({'count': np.int64})
+
+
+def aggregate_country_counts(view):
+    return list_counts(view, 'countries', 20)
+
+
+def aggregate_country_type_counts(view):
+    labels = view['catalog']['countries']['labels']
+    top_10_codes, _ = ranked_list_counts(view, 'countries', 10)
+    if not len(top_10_codes):
+        return pd.DataFrame({'country_list': [], 'type': [], 'count': []}).astype({'count': np.int64})
+    result = run_sql(view, f"SELECT b.code, CAST(f.type AS VARCHAR) AS type, COUNT(*) AS count "
+                           f"FROM countries_bridge b JOIN f USING (row_id) "
+                           f"WHERE b.code IN ({', '.join(str(code) for code in top_10_codes)}) GROUP BY 1, 2")
+    result = pd.DataFrame({'country_list': labels[result['code'].to_numpy()], 'type': result['type'].astype(object),
+                           'count': result['count'].to_numpy(dtype=np.int64)})
+    return result.sort_values(['country_list', 'type']).reset_index(drop=True)
+
+
+def aggregate_quality_by_country(view):
+    labels = view['catalog']['countries']['labels']
+    top_codes, country_counts = ranked_list_counts(view, 'countries', 15)
+    sums = run_sql(view, 'SELECT b.code, SUM(f.content_score) AS score_sum '
+                         'FROM countries_bridge b JOIN f USING (row_id) GROUP BY 1')
+    score_sums = pd.Series(sums['score_sum'].to_numpy(dtype=float), index=sums['code'].to_numpy())
+    quality_by_country = pd.DataFrame({
+        'country_list': labels[top_codes],
+        'content_score': score_sums.reindex(top_codes).to_numpy() / country_counts
+    })
+    return quality_by_country.sort_values('content_score', ascending=False).head(10)
+
+
+def aggregate_coproduction_pairs(view):
+    labels = view['catalog']['countries']['labels']
+    pairs = run_sql(view, 'SELECT b.row_id, b.code FROM countries_bridge b JOIN f USING (row_id)')
+    return coproduction_frame(labels, *coproduction_counts(pairs['row_id'].to_numpy(), pairs['code'].to_numpy(),
+                                                           len(view['df']), len(labels)))
+
+
+def aggregate_rating_counts(view):
+    rating_counts = categorical_counts(view, 'rating').sort_values(ascending=False, kind='stable')
+    return rating_counts[rating_counts > 0].head(10)
+
+
+def aggregate_content_score_histogram(view):
+    return histogram_counts(view, 'content_score', 'content_score IS NOT NULL')
+
+
+def aggregate_quality_tiers(view):
+    # Tier bounds follow categorize_quality: (0, 40], (40, 70], (70, 85], (85, 100]
+    tiers = sorted(QUALITY_TIERS.values())
+    cases = ' '.join(f"WHEN content_score > {low} AND content_score <= {high} THEN {i}"
+                     for i, (low, high) in enumerate(tiers))
+    result = run_sql(view, f'SELECT CASE {cases} END AS tier, COUNT(*) AS count FROM f GROUP BY 1')
+    categories = view['df']['quality_category'].cat.categories
+    counts = dict(zip(result['tier'], result['count']))
+    quality_tiers = pd.Series([int(counts.get(i, 0)) for i in range(len(categories))],
+                              index=categories, name='count', dtype=np.int64)
+    return quality_tiers.sort_values(ascending=False, kind='stable')
+
+
+def aggregate_type_counts(view):
+    type_counts = categorical_counts(view, 'type').sort_values(ascending=False, kind='stable')
+    return type_counts[type_counts > 0]
+
+
+DUCKDB_AGGREGATIONS = {
+    'overview': aggregate_overview,
+    'tv_metrics': aggregate_tv_metrics,
+    'quality_metrics': aggregate_quality_metrics,
+    'yearly_additions': aggregate_yearly_additions,
+    'monthly_counts': aggregate_monthly_counts,
+    'decade_counts': aggregate_decade_counts,
+    'quarterly_counts': aggregate_quarterly_counts,
+    'type_year_growth': aggregate_type_year_growth,
+    'genre_counts': aggregate_genre_counts,
+    'movie_minutes_histogram': aggregate_movie_minutes_histogram,
+    'season_counts': aggregate_season_counts,
+    'country_counts': aggregate_country_counts,
+    'country_type_counts': aggregate_country_type_counts,
+    'quality_by_country': aggregate_quality_by_country,
+    'rating_counts': aggregate_rating_counts,
+    'content_score_histogram': aggregate_content_score_histogram,
+    'quality_tiers': aggregate_quality_tiers,
+    'type_counts': aggregate_type_counts
+}
+
+if SPARSE_AVAILABLE:
+    DUCKDB_AGGREGATIONS['coproduction_pairs'] = aggregate_coproduction_pairs
+
+# Ingest stays on pandas; DuckDB only serves the queries
+BACKEND = {'read_catalog': read_catalog, 'make_view': make_duckdb_view, 'aggregations': DUCKDB_AGGREGATIONS}
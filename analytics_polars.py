@@ -0,0 +1,419 @@
+"""
+Polars backend for the analytics core.
+
+Ingest runs as one lazy Polars plan: the CSV scan, column normalization and
+the duration, score and list-free derivations are optimized together and
+executed on every core before the result is handed to pandas. Views wrap the
+filtered titles in a LazyFrame, so each chart aggregation is a separate plan
+that only reads the columns it needs. Plans collect at most a few rows per
+chart, which are converted to the index and dtypes the pandas aggregations in
+analytics.py return.
+
+Select it with DASHBOARD_BACKEND=polars.
+"""
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import polars as pl
+from pandas.tseries.api import guess_datetime_format
+
+from analytics import (
+    DEFAULT_SCORING_PROFILE, EXPECTED_COLUMNS, LIST_ENCODINGS, MONTH_NAMES, QUALITY_TIERS, RANGE_DIMENSIONS,
+    SCORING_PROFILES, SPARSE_AVAILABLE, TITLE_COLUMNS, TYPE_NAMES, compact_dtypes, coproduction_counts,
+    coproduction_frame, histogram_edges, histogram_frame, list_codes, make_view, normalize_column_names,
+    positioned_bridge, search_rows
+)
+
+# Strings pandas.read_csv reads as missing by default
+NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+             '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+
+_frames = {}
+_frames_lock = threading.Lock()
+
+
+# ----------------------------
+# Ingest
+# ----------------------------
+def scan_catalog(path):
+    """Lazy scan of a catalog CSV with normalized column names"""
+    # Every column is read as text and parsed explicitly, like the coercing pandas parsers
+    lf = pl.scan_csv(path, infer_schema=False, null_values=NA_VALUES)
+    names = lf.collect_schema().names()
+    lf = lf.rename(dict(zip(names, normalize_column_names(names))))
+    missing = [col for col in EXPECTED_COLUMNS if col not in lf.collect_schema().names()]
+    return lf.with_columns(pl.lit(None, dtype=pl.String).alias(col) for col in missing)
+
+
+def date_expression(lf):
+    """date_added parsed with the format pandas infers from the first value"""
+    # Projection and slice pushdown read just enough of one column to find it
+    first = lf.select(pl.col('date_added').drop_nulls().first()).collect().item()
+    date_format = guess_datetime_format(first, dayfirst=False) if first is not None else None
+    if date_format is None:
+        return pl.col('date_added').map_batches(
+            lambda dates: pl.from_pandas(pd.to_datetime(dates.to_pandas(), errors='coerce')),
+            return_dtype=pl.Datetime('us'))
+    return pl.col('date_added').str.strptime(pl.Datetime('us'), date_format, strict=False)
+
+
+def content_score_expression(profile=DEFAULT_SCORING_PROFILE):
+    """calculate_content_score as a Polars expression, adding the parts in the same order"""
+    rules = SCORING_PROFILES[profile]
+    age = rules['age']
+    score = ((age['base'] - pl.col('content_age') * age['decay']).clip(lower_bound=0) * age['weight']).fill_null(0)
+
+    for type_name, band_rules in rules['duration'].items():
+        values = pl.col(band_rules['column'])
+        band_score = pl.lit(float(band_rules['default']))
+        for low, high, points in reversed(band_rules['bands']):
+            band_score = pl.when(values.is_between(low, high)).then(float(points)).otherwise(band_score)
+        applies = (pl.col('type') == type_name) & values.is_not_null()
+        score = score + pl.when(applies).then(band_score).otherwise(0.0)
+
+    score = score + pl.col('rating').replace_strict(
+        rules['ratings'], default=rules['rating_default'], return_dtype=pl.Float64
+    ).fill_null(rules['rating_default'])
+    truncated = pl.when(score < 0).then(score.ceil()).otherwise(score.floor())
+    return truncated.clip(0, 100).cast(pl.Int8)
+
+
+def quality_expression():
+    """categorize_quality: right-closed tiers, zero scores stay uncategorized"""
+    labels = ['Basic', 'Standard', 'Premium', 'Ultra']
+    quality = pl.lit(None, dtype=pl.String)
+    for label, (low, high) in zip(reversed(labels), sorted(QUALITY_TIERS.values(), reverse=True)):
+        quality = pl.when((pl.col('content_score') > low) & (pl.col('content_score') <= high)).then(
+            pl.lit(label)).otherwise(quality)
+    return quality.cast(pl.Enum(labels))
+
+
+def read_catalog(path):
+    """Read and process a catalog CSV as one lazy Polars plan"""
+    lf = scan_catalog(path)
+    text = pl.col('duration').str.to_lowercase()
+    number = text.str.extract(r"(\d+\.?\d*)", 1).cast(pl.Float64, strict=False)
+    months = MONTH_NAMES + ['Unknown']
+
+    df = lf.with_columns(
+        pl.col('type').fill_null("Unknown").str.strip_chars().replace(TYPE_NAMES),
+        pl.col('title').fill_null("").str.strip_chars(),
+        date_expression(lf).alias('date_added'),
+        pl.col('release_year').str.strip_chars().cast(pl.Float64, strict=False)
+    ).with_columns(
+        number.alias('duration_num'),
+        pl.when(text.str.contains('min', literal=True)).then(number).alias('movie_minutes'),
+        pl.when(text.str.contains('season', literal=True)).then(number).alias('tv_seasons'),
+        pl.col('date_added').dt.year().alias('year_added'),
+        pl.col('date_added').dt.month().alias('month_added'),
+        pl.col('date_added').dt.quarter().alias('quarter_added'),
+        (datetime.now().year - pl.col('release_year')).alias('content_age'),
+        ((pl.col('release_year') // 10) * 10).alias('decade')
+    ).with_columns(
+        content_score_expression().alias('content_score')
+    ).with_columns(
+        quality_expression().alias('quality_category'),
+        pl.col('month_added').replace_strict(dict(enumerate(MONTH_NAMES, 1)), default='Unknown',
+                                             return_dtype=pl.String).fill_null('Unknown')
+        .cast(pl.Enum(months)).alias('month_name')
+    ).collect().to_pandas()
+
+    # Enums arrive ordered; process_catalog builds month_name unordered
+    df['month_name'] = df['month_name'].cat.as_unordered()
+    return compact_dtypes(df).reset_index(drop=True)
+
+
+# ----------------------------
+# Views
+# ----------------------------
+def catalog_frames(catalog):
+    """Polars copies of the titles and bridge tables, created on first use and shared process-wide"""
+    with _frames_lock:
+        if catalog['fingerprint'] not in _frames:
+            df = catalog['df']
+            titles = pl.from_pandas(df[TITLE_COLUMNS]).with_columns(
+                pl.col('type', 'rating').cast(pl.String),
+                pl.Series('row_id', np.arange(len(df), dtype=np.int32))
+            )
+            frames = {'profiles': {DEFAULT_SCORING_PROFILE: titles}, 'lock': threading.Lock()}
+            for name in LIST_ENCODINGS:
+                frames[name] = pl.from_pandas(positioned_bridge(catalog[f'{name}_bridge']))
+            _frames[catalog['fingerprint']] = frames
+        return _frames[catalog['fingerprint']]
+
+
+def profile_titles(frames, profile, scored_df):
+    """Titles frame carrying the content scores of a scoring profile"""
+    with frames['lock']:
+        if profile not in frames['profiles']:
+            frames['profiles'][profile] = frames['profiles'][DEFAULT_SCORING_PROFILE].with_columns(
+                pl.Series('content_score', scored_df['content_score'].to_numpy()))
+        return frames['profiles'][profile]
+
+
+def filter_titles(catalog, frames, titles, filters):
+    """Lazy filtered titles equivalent to query_filter_index"""
+    lf = titles.lazy()
+    for dimension, wanted in filters.items():
+        if dimension == 'search':
+            # search_rows returns sorted positions, which are the row_id values of the titles frame
+            rows = search_rows(catalog['index']['search'], wanted)
+            lf = lf.filter(pl.col('row_id').is_in(pl.Series(rows, dtype=pl.Int32)))
+        elif dimension in RANGE_DIMENSIONS:
+            lf = lf.filter(pl.col(dimension).is_between(int(wanted[0]), int(wanted[1])))
+        elif dimension in LIST_ENCODINGS:
+            codes = list_codes(catalog[dimension], wanted)
+            rows = frames[dimension].lazy().filter(pl.col('code').is_in(codes)).select('row_id')
+            lf = lf.join(rows, on='row_id', how='semi')
+        else:
+            lf = lf.filter(pl.col(dimension).is_in([str(value) for value in wanted]))
+    return lf
+
+
+def make_polars_view(catalog, scored, query):
+    """View whose aggregations run as lazy Polars plans over the filtered titles"""
+    view = make_view(catalog, scored, query)
+    frames = catalog_frames(catalog)
+    titles = profile_titles(frames, query.profile, scored['df'])
+    view['frames'] = frames
+    view['titles'] = titles
+    return view
+
+
+def view_titles(view):
+    """Lazy filtered titles of the view, planned on first use"""
+    # Charts served from the result cache never collect a plan, so a title search only runs on a miss
+    if 'lazy' not in view:
+        view['lazy'] = filter_titles(view['catalog'], view['frames'], view['titles'], view['filters'])
+    return view['lazy']
+
+
+def filtered_bridge(view, name):
+    return view['frames'][name].lazy().join(view_titles(view).select('row_id'), on='row_id', how='semi')
+
+
+def counts_series(result, index):
+    return pd.Series(result['count'].to_numpy().astype(np.int64), index=index, name='count')
+
+
+def categorical_counts(view, column):
+    """Counts per category from a lazy group_by, reindexed to category order like cube_counts"""
+    categories = view['df'][column].cat.categories
+    result = view_titles(view).filter(pl.col(column).is_not_null()).group_by(column).len('count').collect().to_pandas()
+    result = result.set_index(column).reindex(categories).dropna()
+    index = pd.CategoricalIndex(result.index, categories=categories, name=column)
+    return counts_series(result, index)
+
+
+def numeric_counts(view, expression, column):
+    result = (view_titles(view).filter(pl.col(column).is_not_null()).group_by(expression.alias(column))
+              .len('count').sort(column).collect().to_pandas())
+    return result.astype({'count': np.int64})
+
+
+def ranked_list_counts(view, name, limit=None):
+    """Codes and counts of a list column among filtered rows, sorted by count then first pos"""
+    ranked = (filtered_bridge(view, name).group_by('code')
+              .agg(pl.len().alias('count'), pl.col('pos').min().alias('first_seen'))
+              .sort(['count', 'first_seen'], descending=[True, False]))
+    result = (ranked.head(limit) if limit else ranked).collect()
+    return result['code'].to_numpy().astype(np.int64), result['count'].to_numpy().astype(np.int64)
+
+
+def histogram_counts(view, column, predicate):
+    """Round-width bin counts of a column, binned in Polars with the pandas bin edges"""
+    values = view_titles(view).filter(predicate).select(pl.col(column).cast(pl.Float64))
+    low, high = values.select(pl.col(column).min().alias('low'), pl.col(column).max().alias('high')).collect().row(0)
+    if low is None:
+        return histogram_frame(0.0, 1.0, np.array([], dtype=np.int64), np.array([], dtype=np.int64))
+    start, width = histogram_edges(low, high)
+    result = (values.group_by(((pl.col(column) - start) / width).floor().cast(pl.Int64).alias('bin'))
+              .len('count').collect())
+    return histogram_frame(start, width, result['bin'].to_numpy(), result['count'].to_numpy().astype(np.int64))
+
+
+def nan_if_null(value):
+    return np.nan if value is None else value
+
+
+# ----------------------------
+# Chart Aggregations
+# ----------------------------
+def aggregate_overview(view):
+    row = view_titles(view).select(
+        pl.len().alias('total'),
+        (pl.col('type') == 'Movie').sum().alias('movies'),
+        (pl.col('type') == 'TV Show').sum().alias('tv_shows'),
+        pl.col('content_score').mean().alias('avg_score')
+    ).collect().row(0, named=True)
+    countries = filtered_bridge(view, 'countries').select(pl.col('code').n_unique()).collect().item()
+    return {
+        'total_titles': int(row['total']),
+        'movies': int(row['movies']),
+        'tv_shows': int(row['tv_shows']),
+        'unique_countries': int(countries),
+        'avg_score': nan_if_null(row['avg_score'])
+    }
+
+
+def aggregate_tv_metrics(view):
+    row = view_titles(view).filter(pl.col('type') == 'TV Show').select(
+        pl.len().alias('total'),
+        pl.col('tv_seasons').count().alias('with_seasons'),
+        pl.col('tv_seasons').mean().alias('avg_seasons'),
+        pl.col('tv_seasons').max().alias('max_seasons')
+    ).collect().row(0, named=True)
+    has_seasons = row['with_seasons'] > 0
+    return {
+        'total_tv_shows': int(row['total']),
+        'avg_seasons': row['avg_seasons'] if has_seasons else 0,
+        'max_seasons': row['max_seasons'] if has_seasons else 0
+    }
+
+
+def aggregate_quality_metrics(view):
+    row = view_titles(view).select(
+        pl.len().alias('titles'),
+        pl.col('content_score').cast(pl.Int64).sum().alias('score_sum'),
+        pl.col('content_score').min().alias('score_min'),
+        pl.col('content_score').max().alias('score_max')
+    ).collect().row(0, named=True)
+    return {
+        'avg_quality': row['score_sum'] / row['titles'] if row['titles'] > 0 else np.nan,
+        'min_quality': float(nan_if_null(row['score_min'])),
+        'max_quality': float(nan_if_null(row['score_max']))
+    }
+
+
+def aggregate_yearly_additions(view):
+    return numeric_counts(view, pl.col('year_added'), 'year_added')
+
+
+def aggregate_monthly_counts(view):
+    result = numeric_counts(view, pl.col('month_added'), 'month_added')
+    return counts_series(result, pd.Index(result['month_added'], name='month_added'))
+
+
+def aggregate_decade_counts(view):
+    result = numeric_counts(view, pl.col('release_year') // 10 * 10, 'decade')
+    return counts_series(result, pd.Index(result['decade'], name='decade'))
+
+
+def aggregate_quarterly_counts(view):
+    return numeric_counts(view, pl.col('quarter_added'), 'quarter_added')
+
+
+def aggregate_type_year_growth(view):
+    result = (view_titles(view).filter(pl.col('year_added').is_not_null() & pl.col('type').is_not_null())
+              .group_by('year_added', 'type').len('count').sort('year_added', 'type').collect().to_pandas())
+    result['type'] = pd.Categorical(result['type'].astype(object), categories=view['df']['type'].cat.categories)
+    return result.astype({'count': np.int64})
+
+
+def list_counts(view, name, limit):
+    codes, counts = ranked_list_counts(view, name, limit)
+    return pd.Series(counts, index=view['catalog'][name]['labels'][codes])
+
+
+def aggregate_genre_counts(view):
+    return list_counts(view, 'genres', 15)
+
+
+def aggregate_movie_minutes_histogram(view):
+    return histogram_counts(view, 'movie_minutes', (pl.col('type') == 'Movie') & pl.col('movie_minutes').is_not_null())
+
+
+def aggregate_season_counts(view):
+    result = (view_titles(view).filter((pl.col('type') == 'TV Show') & pl.col('tv_seasons').is_not_null())
+              .group_by(pl.col('tv_seasons').alias('seasons')).len('count').sort('seasons').collect().to_pandas())
+    return result.astype({'count': np.int64})
+
+
+def aggregate_country_counts(view):
+    return list_counts(view, 'countries', 20)
+
+
+def aggregate_country_type_counts(view):
+    labels = view['catalog']['countries']['labels']
+    top_10_codes, _ = ranked_list_counts(view, 'countries', 10)
+    result = (view['frames']['countries'].lazy().filter(pl.col('code').is_in(top_10_codes.tolist()))
+              .join(view_titles(view).select('row_id', 'type'), on='row_id')
+              .group_by('code', 'type').len('count').collect())
+    result = pd.DataFrame({'country_list': labels[result['code'].to_numpy()],
+                           'type': result['type'].to_numpy().astype(object),
+                           'count': result['count'].to_numpy().astype(np.int64)})
+    return result.sort_values(['country_list', 'type']).reset_index(drop=True)
+
+
+def aggregate_quality_by_country(view):
+    labels = view['catalog']['countries']['labels']
+    top_codes, country_counts = ranked_list_counts(view, 'countries', 15)
+    sums = (view['frames']['countries'].lazy().filter(pl.col('code').is_in(top_codes.tolist()))
+            .join(view_titles(view).select('row_id', 'content_score'), on='row_id')
+            .group_by('code').agg(pl.col('content_score').cast(pl.Float64).sum().alias('score_sum')).collect())
+    score_sums = pd.Series(sums['score_sum'].to_numpy(), index=sums['code'].to_numpy())
+    quality_by_country = pd.DataFrame({
+        'country_list': labels[top_codes],
+        'content_score': score_sums.reindex(top_codes).to_numpy() / country_counts
+    })
+    return quality_by_country.sort_values('content_score', ascending=False).head(10)
+
+
+def aggregate_coproduction_pairs(view):
+    labels = view['catalog']['countries']['labels']
+    pairs = filtered_bridge(view, 'countries').select('row_id', 'code').collect()
+    return coproduction_frame(labels, *coproduction_counts(pairs['row_id'].to_numpy(), pairs['code'].to_numpy(),
+                                                           len(view['df']), len(labels)))
+
+
+def aggregate_rating_counts(view):
+    rating_counts = categorical_counts(view, 'rating').sort_values(ascending=False, kind='stable')
+    return rating_counts[rating_counts > 0].head(10)
+
+
+def aggregate_content_score_histogram(view):
+    return histogram_counts(view, 'content_score', pl.col('content_score').is_not_null())
+
+
+def aggregate_quality_tiers(view):
+    categories = view['df']['quality_category'].cat.categories
+    result = (view_titles(view).select(quality_expression().cast(pl.String).alias('tier'))
+              .group_by('tier').len('count').collect())
+    counts = dict(zip(result['tier'].to_list(), result['count'].to_list()))
+    quality_tiers = pd.Series([int(counts.get(tier, 0)) for tier in categories],
+                              index=categories, name='count', dtype=np.int64)
+    return quality_tiers.sort_values(ascending=False, kind='stable')
+
+
+def aggregate_type_counts(view):
+    type_counts = categorical_counts(view, 'type').sort_values(ascending=False, kind='stable')
+    return type_counts[type_counts > 0]
+
+
+POLARS_AGGREGATIONS = {
+    'overview': aggregate_overview,
+    'tv_metrics': aggregate_tv_metrics,
+    'quality_metrics': aggregate_quality_metrics,
+    'yearly_additions': aggregate_yearly_additions,
+    'monthly_counts': aggregate_monthly_counts,
+    'decade_counts': aggregate_decade_counts,
+    'quarterly_counts': aggregate_quarterly_counts,
+    'type_year_growth': aggregate_type_year_growth,
+    'genre_counts': aggregate_genre_counts,
+    'movie_minutes_histogram': aggregate_movie_minutes_histogram,
+    'season_counts': aggregate_season_counts,
+    'country_counts': aggregate_country_counts,
+    'country_type_counts': aggregate_country_type_counts,
+    'quality_by_country': aggregate_quality_by_country,
+    'rating_counts': aggregate_rating_counts,
+    'content_score_histogram': aggregate_content_score_histogram,
+    'quality_tiers': aggregate_quality_tiers,
+    'type_counts': aggregate_type_counts
+}
+
+if SPARSE_AVAILABLE:
+    POLARS_AGGREGATIONS['coproduction_pairs'] = aggregate_coproduction_pairs
+
+BACKEND = {'read_catalog': read_catalog, 'make_view': make_polars_view, 'aggregations': POLARS_AGGREGATIONS}
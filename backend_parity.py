@@ -0,0 +1,107 @@
+"""
+Check that a query backend returns the same chart results as the pandas path.
+
+Checks that the backend's catalog reader produces the same processed frame,
+then runs every chart aggregation for random sidebar filter sets on both
+engines and reports each chart/query pair that differs. With --chunk-rows it
+also checks that streaming ingest reproduces the pandas frame and overview.
+
+    python backend_parity.py duckdb --cases 200
+    python backend_parity.py polars --catalog synthetic.csv
+    python backend_parity.py pandas --chunk-rows 1000
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import tempfile
+
+import pandas as pd
+
+import analytics
+
+
+def random_queries(catalog, cases, seed=0):
+    """Filter sets spanning every sidebar control, title searches, scoring profile and empty selections"""
+    rng = random.Random(seed)
+    df = catalog['df']
+    ratings = sorted(df['rating'].dropna().unique().tolist())
+    genres = catalog['genres']['labels'].tolist()
+    countries = catalog['countries']['labels'].tolist()
+    titles = df['title'].dropna().tolist()
+    years = df['release_year'].dropna()
+    low, high = (int(years.min()), int(years.max())) if len(years) else (2000, 2021)
+    queries = [analytics.CatalogQuery(release_years=(max(low, 2000), high)), analytics.CatalogQuery()]
+    for _ in range(cases):
+        queries.append(analytics.CatalogQuery(
+            release_years=tuple(sorted(rng.sample(range(low, high + 1), 2))),
+            types=rng.sample(['Movie', 'TV Show'], rng.randint(0, 2)),
+            content_score=rng.choice([None, *analytics.QUALITY_TIERS.values()]),
+            ratings=rng.sample(ratings, rng.choice([0, 0, 1, 3])),
+            genres=rng.sample(genres, rng.choice([0, 0, 1, 2])),
+            countries=rng.sample(countries, rng.choice([0, 0, 1, 3])),
+            search=rng.choice(['', '', '', rng.choice(titles)[:rng.randint(1, 8)]]) if titles else '',
+            profile=rng.choice(list(analytics.SCORING_PROFILES))
+        ))
+    return queries
+
+
+def ingest_matches(path, backend):
+    """Whether a backend reads and processes the catalog into exactly the pandas frame"""
+    if backend['read_catalog'] is analytics.read_catalog:
+        return True
+    try:
+        pd.testing.assert_frame_equal(analytics.read_catalog(path), backend['read_catalog'](path))
+    except AssertionError as error:
+        print(f"INGEST MISMATCH: {error}")
+        return False
+    return True
+
+
+def stream_matches(path, chunk_rows):
+    """Whether streaming ingest stores exactly the pandas frame and totals matching its overview"""
+    expected = analytics.read_catalog(path)
+    with tempfile.TemporaryDirectory() as workdir:
+        store_path = os.path.join(workdir, 'catalog.parquet')
+        totals = analytics.stream_catalog(path, store_path, chunk_rows)
+        try:
+            pd.testing.assert_frame_equal(expected, analytics.read_processed_cache(store_path))
+        except AssertionError as error:
+            print(f"STREAM MISMATCH: {error}")
+            return False
+    catalog = analytics.build_catalog(expected, 'parity')
+    overview = analytics.aggregate_catalog_overview({'df': expected, 'catalog': catalog})
+    streamed = analytics.ingest_overview(totals)
+    differing = [key for key in overview if not math.isclose(overview[key], streamed[key]) and
+                 not (math.isnan(overview[key]) and math.isnan(streamed[key]))]
+    for key in differing:
+        print(f"STREAM TOTALS MISMATCH {key}: {overview[key]} != {streamed[key]}")
+    return not differing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('backend', help="backend to compare against pandas, e.g. 'duckdb'")
+    parser.add_argument('--catalog', default=analytics.CATALOG_PATH)
+    parser.add_argument('--cases', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-rows', type=int, default=0, help='also check streaming ingest with this chunk size')
+    args = parser.parse_args(argv)
+
+    backend = analytics.get_backend(args.backend)
+    ingest_ok = ingest_matches(args.catalog, backend)
+    if args.chunk_rows:
+        ingest_ok = stream_matches(args.catalog, args.chunk_rows) and ingest_ok
+    catalog = analytics.load_catalog(args.catalog)
+    queries = random_queries(catalog, args.cases, args.seed)
+    mismatches = analytics.backend_mismatches(catalog, backend, queries)
+    for chart_id, query in mismatches:
+        print(f"MISMATCH {chart_id}: {query}")
+    print(f"{args.backend}: {len(mismatches)} mismatches over {len(queries)} queries "
+          f"x {len(analytics.CHART_AGGREGATIONS)} charts")
+    return 0 if ingest_ok and not mismatches else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Headless benchmark for the dashboard's data pipeline.
+
+Runs the load stages, the sidebar filter path and every chart aggregation
+of the analytics core against synthetic catalogs of increasing size (see
+synthetic_catalog.py). Reports wall time per stage as JSON, together with
+how far the stage raised peak resident memory. Memory comes from the Linux
+VmHWM high-water mark, reset before every stage. It therefore includes
+Arrow, Polars and DuckDB allocations that tracemalloc cannot see. A stage
+that reuses pages an earlier stage freed can show little growth. On other
+systems only wall times are recorded.
+
+    python benchmark.py --sizes 10000 100000 --output bench.json
+    python benchmark.py --compare bench.json      # flag regressions vs a previous run
+    python benchmark.py --backend polars          # time another query backend's ingest and charts
+    python benchmark.py --chunk-rows 50000        # chunk size of the streaming ingest stages (0 skips them)
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+import analytics
+import synthetic_catalog
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+
+# Filter sets exercised by the filter and aggregation stages
+FILTER_PRESETS = {
+    'default': analytics.CatalogQuery(release_years=(2000, 2021), types=('Movie', 'TV Show')),
+    'cube_only': analytics.CatalogQuery(release_years=(2010, 2021), types=('Movie',), ratings=('TV-MA', 'R')),
+    'genre_country': analytics.CatalogQuery(release_years=(2000, 2021), genres=('Dramas', 'Comedies'),
+                                            countries=('United States', 'India')),
+    'quality_tier': analytics.CatalogQuery(release_years=(1990, 2021),
+                                           content_score=analytics.QUALITY_TIERS['Premium (70-85)'])
+}
+
+
+def rss_bytes(field='VmRSS'):
+    """Current (VmRSS) or peak (VmHWM) resident set size of this process"""
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(f'{field}:'):
+                return int(line.split()[1]) * 1024
+
+
+def reset_peak_rss():
+    """Restart the VmHWM high-water mark at the current resident set size; False if the kernel refuses"""
+    # clear_refs can exist but be unwritable, e.g. in containers or under a restricted ptrace policy
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        return False
+    return True
+
+
+PEAK_RSS_AVAILABLE = os.path.exists('/proc/self/clear_refs')
+
+
+def measure(results, size, stage, func):
+    """Run one stage, recording wall time and how far it raised peak resident memory"""
+    track_peak = PEAK_RSS_AVAILABLE and reset_peak_rss()
+    start_rss = rss_bytes() if track_peak else None
+    start = time.perf_counter()
+    value = func()
+    seconds = time.perf_counter() - start
+    peak_mb = round(max(rss_bytes('VmHWM') - start_rss, 0) / 1024 / 1024, 3) if track_peak else None
+    results.append({
+        'rows': size,
+        'stage': stage,
+        'seconds': round(seconds, 6),
+        'peak_mb': peak_mb
+    })
+    memory = f"{peak_mb:>9.1f} MB" if peak_mb is not None else ''
+    print(f"{size:>12,}  {stage:<40} {seconds * 1000:>10.1f} ms  {memory}", file=sys.stderr)
+    return value
+
+
+def benchmark_size(model, size, workdir, results, backend_name='pandas', chunk_rows=0):
+    """Benchmark every pipeline stage on one catalog size"""
+    source_path = os.path.join(workdir, f'catalog_{size}.csv')
+    for i, chunk in enumerate(synthetic_catalog.generate_catalog(model, size)):
+        chunk.to_csv(source_path, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+
+    backend = analytics.get_backend(backend_name)
+    if backend['read_catalog'] is not analytics.read_catalog:
+        measure(results, size, f'read_catalog[{backend_name}]', lambda: backend['read_catalog'](source_path))
+    if chunk_rows:
+        store_path = os.path.join(workdir, f'catalog_{size}.parquet')
+        measure(results, size, 'stream_catalog', lambda: analytics.stream_catalog(source_path, store_path, chunk_rows))
+        measure(results, size, 'read_streamed_store', lambda: analytics.read_processed_cache(store_path))
+    raw = measure(results, size, 'read_csv', lambda: pd.read_csv(source_path))
+    df = measure(results, size, 'process_catalog', lambda: analytics.process_catalog(raw))
+    raw = None  # release the raw frame before the larger stages
+
+    catalog = {'df': df, 'fingerprint': f'benchmark-{size}'}
+    for name, column in analytics.LIST_ENCODINGS.items():
+        catalog[name] = measure(results, size, f'encode_list_column[{name}]',
+                                lambda: analytics.encode_list_column(df[column]))
+        catalog[f'{name}_bridge'] = measure(results, size, f'build_bridge[{name}]',
+                                            lambda: analytics.build_bridge(catalog[name]))
+    catalog['index'] = measure(results, size, 'build_filter_index', lambda: analytics.build_filter_index(catalog))
+    catalog['cube'] = measure(results, size, 'build_cube', lambda: analytics.build_cube(df))
+
+    scored = analytics.scored_catalog(catalog, analytics.DEFAULT_SCORING_PROFILE)
+    measure(results, size, 'rescore_catalog', lambda: analytics.rescore_catalog(df, 'Fresh Releases'))
+
+    for preset, query in FILTER_PRESETS.items():
+        measure(results, size, f'filter[{preset}]',
+                lambda: analytics.query_filter_index(catalog['index'], query.filters()))
+        for chart_id, aggregate in backend['aggregations'].items():
+            # A fresh view per chart so each one pays for the filtering it needs
+            view = backend['make_view'](catalog, scored, query)
+            measure(results, size, f'aggregate[{preset}][{chart_id}]', lambda: aggregate(view))
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return None
+
+
+def compare(current, baseline_path, threshold):
+    """Print stages that got slower than the baseline run by more than the threshold"""
+    with open(baseline_path) as f:
+        baseline = {(r['rows'], r['stage']): r for r in json.load(f)['results']}
+    regressions = []
+    for result in current['results']:
+        previous = baseline.get((result['rows'], result['stage']))
+        # Ignore sub-millisecond stages, their timings are mostly noise
+        if previous and previous['seconds'] > 1e-3 and result['seconds'] > previous['seconds'] * (1 + threshold):
+            regressions.append((result, previous))
+    for result, previous in regressions:
+        print(f"REGRESSION {result['rows']:>12,}  {result['stage']:<40} "
+              f"{previous['seconds'] * 1000:.1f} ms -> {result['seconds'] * 1000:.1f} ms", file=sys.stderr)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--source', default=synthetic_catalog.SOURCE_PATH, help='real catalog the synthetic rows are modelled on')
+    parser.add_argument('--output', help='write JSON results here instead of stdout')
+    parser.add_argument('--compare', help='previous JSON results to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed slowdown before a regression')
+    parser.add_argument('--backend', default='pandas', help="query backend: 'pandas', 'duckdb' or 'polars'")
+    parser.add_argument('--chunk-rows', type=int, default=100_000, help='rows per chunk of the streaming ingest stages')
+    args = parser.parse_args(argv)
+
+    model = synthetic_catalog.fit_catalog_model(pd.read_csv(args.source))
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            benchmark_size(model, size, workdir, results, args.backend,
+                           args.chunk_rows if analytics.PARQUET_AVAILABLE else 0)
+
+    report = {
+        'revision': git_revision(),
+        'backend': args.backend,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+    if args.compare and compare(report, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
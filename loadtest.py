@@ -0,0 +1,187 @@
+"""
+Headless multi-session load test for the dashboard.
+
+Drives Dashboard.py through Streamlit's AppTest API from many concurrent
+sessions in one process, the way a single server worker shares its caches,
+and reports rerun latency percentiles, throughput and memory growth.
+
+    python loadtest.py --sessions 24 --actions 20 --output loadtest.json
+    python loadtest.py --catalog synthetic.csv    # e.g. from synthetic_catalog.py
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import resource
+import sys
+import threading
+import time
+
+os.environ.setdefault('STREAMLIT_LOGGER_LEVEL', 'error')
+logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Dashboard.py')
+
+
+def current_rss_mb():
+    """Resident memory of this process; falls back to the peak where /proc is missing"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def widget(at, kind, label):
+    return next(w for w in getattr(at, kind) if w.label == label)
+
+
+def random_subset(rng, options, low, high):
+    return rng.sample(list(options), rng.randint(low, min(high, len(options))))
+
+
+# Each action changes one sidebar control (or the section) the way a user would
+def change_type(at, rng):
+    control = widget(at, 'multiselect', 'Content Type')
+    control.set_value(random_subset(rng, control.options, 1, 2))
+
+
+def change_years(at, rng):
+    control = widget(at, 'slider', 'Release Year Range')
+    low, high = sorted(rng.sample(range(int(control.min), int(control.max) + 1), 2))
+    control.set_value((low, high))
+
+
+def change_quality(at, rng):
+    control = widget(at, 'selectbox', 'Quality Tier')
+    control.set_value(rng.choice(control.options))
+
+
+def change_ratings(at, rng):
+    control = widget(at, 'multiselect', 'Content Rating')
+    control.set_value(random_subset(rng, control.options, 0, 3))
+
+
+def change_genres(at, rng):
+    control = widget(at, 'multiselect', 'Genres')
+    control.set_value(random_subset(rng, control.options, 0, 3))
+
+
+def change_countries(at, rng):
+    control = widget(at, 'multiselect', 'Countries')
+    control.set_value(random_subset(rng, control.options, 0, 2))
+
+
+def change_section(at, rng):
+    sections = [r for r in at.radio if r.key == 'dashboard_section']
+    if sections:
+        sections[0].set_value(rng.choice(sections[0].options))
+
+
+ACTIONS = {
+    'type': change_type,
+    'years': change_years,
+    'quality': change_quality,
+    'ratings': change_ratings,
+    'genres': change_genres,
+    'countries': change_countries,
+    'section': change_section
+}
+
+
+def run_session(session_id, args, samples, errors, barrier):
+    """One simulated user: load the app, then apply random filter changes"""
+    rng = random.Random(args.seed + session_id)
+    at = AppTest.from_file(APP_PATH, default_timeout=args.timeout)
+    barrier.wait()
+    action = 'initial'
+    for step in range(args.actions + 1):
+        if step:
+            action = rng.choice(list(ACTIONS))
+            try:
+                ACTIONS[action](at, rng)
+            except StopIteration:
+                continue  # the control is not on screen for this catalog
+            except Exception as error:
+                errors.append({'session': session_id, 'action': action, 'error': repr(error)})
+                continue
+        start = time.perf_counter()
+        try:
+            at.run()
+        except Exception as error:  # a timed-out or crashed rerun counts as an error
+            errors.append({'session': session_id, 'action': action, 'error': repr(error)})
+            return
+        samples.append({'session': session_id, 'action': action, 'seconds': time.perf_counter() - start})
+        if at.exception:
+            errors.append({'session': session_id, 'action': action, 'error': at.exception[0].value})
+        if args.think_time:
+            time.sleep(rng.expovariate(1 / args.think_time))
+
+
+def percentiles(seconds):
+    if not seconds:
+        return {}
+    p50, p95, p99 = np.percentile(seconds, [50, 95, 99])
+    return {'count': len(seconds), 'p50_ms': round(p50 * 1000, 1), 'p95_ms': round(p95 * 1000, 1),
+            'p99_ms': round(p99 * 1000, 1), 'max_ms': round(max(seconds) * 1000, 1)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=24, help='concurrent simulated users')
+    parser.add_argument('--actions', type=int, default=20, help='filter changes per session')
+    parser.add_argument('--think-time', type=float, default=0.0, help='mean pause between actions, seconds')
+    parser.add_argument('--timeout', type=float, default=300, help='seconds before a rerun counts as failed')
+    parser.add_argument('--catalog', help='CSV to serve instead of netflix_cleaned.csv')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write JSON results here as well')
+    args = parser.parse_args(argv)
+    if args.catalog:
+        os.environ['DASHBOARD_CATALOG'] = os.path.abspath(args.catalog)
+
+    samples, errors = [], []
+    rss_start = current_rss_mb()
+    barrier = threading.Barrier(args.sessions + 1)
+    threads = [threading.Thread(target=run_session, args=(i, args, samples, errors, barrier), daemon=True)
+               for i in range(args.sessions)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    rss_end = current_rss_mb()
+
+    # The first rerun of each session pays for loading; report it apart from steady-state changes
+    initial = [s['seconds'] for s in samples if s['action'] == 'initial']
+    changes = [s['seconds'] for s in samples if s['action'] != 'initial']
+    report = {
+        'sessions': args.sessions,
+        'actions_per_session': args.actions,
+        'elapsed_seconds': round(elapsed, 3),
+        'reruns': len(samples),
+        'throughput_reruns_per_second': round(len(samples) / elapsed, 2) if elapsed else None,
+        'initial_load': percentiles(initial),
+        'filter_changes': percentiles(changes),
+        'by_action': {action: percentiles([s['seconds'] for s in samples if s['action'] == action])
+                      for action in ACTIONS},
+        'memory_mb': {'start': round(rss_start, 1), 'end': round(rss_end, 1),
+                      'growth': round(rss_end - rss_start, 1)},
+        'errors': errors
+    }
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
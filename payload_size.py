@@ -0,0 +1,81 @@
+"""
+Chart payload size of the distribution histograms.
+
+Compares the figure JSON Streamlit sends for the Movie Duration and Content
+Quality Score charts when every value is shipped to the browser for binning
+(px.histogram) against the server-side bins the dashboard now sends, on the
+real catalog and synthetic catalogs of increasing size.
+
+    python payload_size.py --sizes 100000 1000000
+"""
+import argparse
+import json
+import sys
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+import analytics
+import synthetic_catalog
+
+HISTOGRAMS = {
+    'movie_minutes_histogram': 'movie_minutes',
+    'content_score_histogram': 'content_score'
+}
+
+
+def binned_figure(bins):
+    return go.Figure(go.Bar(x=(bins['bin_start'] + bins['bin_end']) / 2, y=bins['count'],
+                            width=bins['bin_end'] - bins['bin_start'],
+                            customdata=bins[['bin_start', 'bin_end']]))
+
+
+def payload_bytes(fig):
+    return len(fig.to_json().encode())
+
+
+def measure_catalog(df, label):
+    """Raw and pre-binned payload of both histograms for the default view of one catalog"""
+    catalog = analytics.build_catalog(df, label)
+    query = analytics.default_query(df)
+    view = analytics.make_view(catalog, analytics.scored_catalog(catalog, query.profile), query)
+    frame = analytics.view_frame(view)
+    raw_values = {'movie_minutes': frame.loc[frame['type'] == 'Movie', ['movie_minutes']].dropna(),
+                  'content_score': frame[['content_score']]}
+    rows = []
+    for chart_id, column in HISTOGRAMS.items():
+        raw = payload_bytes(px.histogram(raw_values[column], x=column, nbins=analytics.HISTOGRAM_BINS))
+        bins = analytics.CHART_AGGREGATIONS[chart_id](view)
+        binned = payload_bytes(binned_figure(bins))
+        rows.append({'catalog': label, 'rows': len(df), 'chart': chart_id, 'values': len(raw_values[column]),
+                     'bins': len(bins), 'raw_bytes': raw, 'binned_bytes': binned,
+                     'reduction': round(raw / binned, 1)})
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--catalog', default=analytics.CATALOG_PATH)
+    parser.add_argument('--sizes', type=int, nargs='*', default=[100_000], help='synthetic catalog sizes')
+    parser.add_argument('--output', help='write JSON results here as well')
+    args = parser.parse_args(argv)
+
+    source = pd.read_csv(args.catalog)
+    results = measure_catalog(analytics.process_catalog(source.copy()), args.catalog)
+    model = synthetic_catalog.fit_catalog_model(source)
+    for size in args.sizes:
+        raw = pd.concat(synthetic_catalog.generate_catalog(model, size), ignore_index=True)
+        results += measure_catalog(analytics.process_catalog(raw), f'synthetic-{size}')
+
+    for r in results:
+        print(f"{r['rows']:>12,}  {r['chart']:<26} {r['values']:>10,} values  {r['raw_bytes']:>12,} B -> "
+              f"{r['binned_bytes']:>7,} B ({r['bins']} bins, {r['reduction']}x smaller)")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
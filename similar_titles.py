@@ -0,0 +1,60 @@
+"""
+Look up similar titles from the command line and precompute the neighbour table.
+
+Without --precompute, prints the most similar titles for each title given,
+with the lookup time, using the neighbour table when one exists for the
+catalog. With --precompute, scores every title against the whole catalog in
+worker processes and writes the table to the catalog cache directory, where
+the dashboard's Similar Titles section picks it up for instant lookups.
+
+    python similar_titles.py "Stranger Things" "Jaws" --k 5
+    python similar_titles.py --precompute --workers 8
+"""
+import argparse
+import sys
+import time
+
+import analytics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('titles', nargs='*', help='titles to find similar titles for')
+    parser.add_argument('--catalog', default=analytics.CATALOG_PATH)
+    parser.add_argument('--k', type=int, default=analytics.SIMILAR_TITLES)
+    parser.add_argument('--precompute', action='store_true', help='write the neighbour table for the catalog')
+    parser.add_argument('--workers', type=int, help='worker processes for --precompute (default: one per core)')
+    args = parser.parse_args(argv)
+    if not analytics.SPARSE_AVAILABLE:
+        print("similar titles need scipy: pip install scipy")
+        return 1
+
+    catalog = analytics.load_catalog(args.catalog)
+    if args.precompute:
+        started = time.perf_counter()
+        table = analytics.precompute_neighbor_table(args.catalog, args.k, args.workers)
+        table_path = analytics.neighbor_table_path(args.catalog, catalog['fingerprint'])
+        analytics.write_neighbor_table(table, table_path)
+        print(f"{len(table['neighbors']):,} titles x {table['neighbors'].shape[1]} neighbours in "
+              f"{time.perf_counter() - started:.1f}s -> {table_path}")
+
+    similarity = analytics.load_similarity(catalog, args.catalog)
+    df = catalog['df']
+    table = similarity['table']
+    source = 'table' if table is not None and table['neighbors'].shape[1] >= args.k else 'live'
+    for title in args.titles:
+        rows = (df['title'] == title).to_numpy().nonzero()[0]
+        if not len(rows):
+            print(f"{title}: not in the catalog")
+            continue
+        started = time.perf_counter()
+        neighbors, scores = analytics.lookup_similar(similarity, rows[0], args.k)
+        print(f"{title} ({(time.perf_counter() - started) * 1000:.2f} ms, {source}):")
+        for neighbor, score in zip(neighbors, scores):
+            print(f"  {score:6.3f}  {df['title'].iloc[neighbor]} ({df['type'].iloc[neighbor]}, "
+                  f"{df['director'].iloc[neighbor] if 'director' in df.columns else ''})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+Synthetic Netflix-shaped catalogs for load testing.
+
+Learns the empirical joint shape of netflix_cleaned.csv and streams any number
+of rows in the same CSV layout, so the output loads in the dashboard unchanged:
+
+    python synthetic_catalog.py 1000000 synthetic.csv
+    DASHBOARD_CATALOG=synthetic.csv streamlit run Dashboard.py
+"""
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+import analytics
+
+SOURCE_PATH = 'netflix_cleaned.csv'
+CHUNK_ROWS = 500_000
+
+# Each field is drawn from its empirical distribution given the fields it depends on.
+# Multi-valued listed_in/country strings are sampled whole, which keeps their
+# co-occurrence patterns and the number of distinct combinations realistic.
+CONDITIONALS = [
+    ('rating', ['type']),
+    ('release_year', ['type']),
+    ('year_added', ['type', 'release_year']),
+    ('month_added', ['year_added']),
+    ('day_added', ['month_added']),
+    ('duration', ['type']),
+    ('listed_in', ['type']),
+    ('country', ['type']),
+    ('director', ['type'])
+]
+
+
+def distribution(values):
+    """Distinct values and their probabilities, missing values included"""
+    counts = values.value_counts(sort=False, dropna=False)
+    return counts.index.to_numpy(), (counts / counts.sum()).to_numpy()
+
+
+def condition_key(key):
+    """Group key with missing values as None, so NaN conditions look up the same entry"""
+    if isinstance(key, tuple):
+        return tuple(condition_key(k) for k in key)
+    return None if pd.isna(key) else key
+
+
+def fit_catalog_model(df):
+    """Learn the distributions the generator samples from"""
+    df = df.copy()
+    dates = df['date_added'].astype('str').str.strip()
+    added = pd.to_datetime(dates, errors='coerce', format=analytics.first_date_format(dates))
+    df['year_added'] = added.dt.year
+    df['month_added'] = added.dt.month
+    df['day_added'] = added.dt.day
+    words = df['title'].astype(str).str.split()
+
+    model = {
+        'columns': [c for c in df.columns if c not in ('year_added', 'month_added', 'day_added')],
+        'type': distribution(df['type']),
+        'title_length': distribution(words.str.len()),
+        'title_word': distribution(words.explode())
+    }
+    for column, given in CONDITIONALS:
+        model[column] = {condition_key(key): distribution(group[column])
+                         for key, group in df.groupby(given if len(given) > 1 else given[0], dropna=False)}
+    return model
+
+
+def sample(rng, dist, size):
+    values, probabilities = dist
+    return values[rng.choice(len(values), size=size, p=probabilities)]
+
+
+def sample_conditional(rng, table, conditions):
+    """Draw one value per row from the distribution matching that row's conditions"""
+    given = list(conditions.columns)
+    out = None
+    groups = conditions.groupby(given if len(given) > 1 else given[0], sort=False, dropna=False)
+    for key, positions in groups.indices.items():
+        drawn = sample(rng, table[condition_key(key)], len(positions))
+        if out is None:
+            out = np.empty(len(conditions), dtype=drawn.dtype)
+        out[positions] = drawn
+    return out
+
+
+def sample_titles(rng, model, size):
+    lengths = sample(rng, model['title_length'], size)
+    titles = pd.Series(sample(rng, model['title_word'], size), dtype=object)
+    for position in range(1, lengths.max()):
+        longer = np.flatnonzero(lengths > position)
+        titles.iloc[longer] = titles.iloc[longer] + ' ' + sample(rng, model['title_word'], len(longer))
+    return titles.to_numpy()
+
+
+def generate_chunk(rng, model, size, start):
+    """One chunk of synthetic rows in the source CSV layout"""
+    fields = pd.DataFrame({'type': sample(rng, model['type'], size)})
+    for column, given in CONDITIONALS:
+        fields[column] = sample_conditional(rng, model[column], fields[given])
+
+    # Day 29 of February learned from a leap year only exists in leap years
+    year, month, day = (fields[c].to_numpy() for c in ('year_added', 'month_added', 'day_added'))
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    day = np.where((month == 2) & (day == 29) & ~leap, 28, day)
+    # Titles drawn without a date keep an empty date_added, like the source
+    parts = [pd.Series(part).astype('Int64').astype(str) for part in (month, day, year)]
+    date_added = (parts[0] + '/' + parts[1] + '/' + parts[2]).where(pd.notna(year) & pd.notna(month) & pd.notna(day))
+
+    chunk = pd.DataFrame({
+        'show_id': 's' + pd.Series(np.arange(start + 1, start + size + 1)).astype(str),
+        'type': fields['type'],
+        'title': sample_titles(rng, model, size),
+        'director': fields['director'],
+        'country': fields['country'],
+        'date_added': date_added,
+        'release_year': fields['release_year'],
+        'rating': fields['rating'],
+        'duration': fields['duration'],
+        'listed_in': fields['listed_in']
+    })
+    return chunk[model['columns']]
+
+
+def generate_catalog(model, rows, chunk_rows=CHUNK_ROWS, seed=0):
+    """Yield synthetic catalog chunks totalling the requested number of rows"""
+    rng = np.random.default_rng(seed)
+    for start in range(0, rows, chunk_rows):
+        yield generate_chunk(rng, model, min(chunk_rows, rows - start), start)
+
+
+def write_catalog(path, rows, source=SOURCE_PATH, chunk_rows=CHUNK_ROWS, seed=0):
+    """Stream a synthetic catalog to a CSV file without holding it in memory"""
+    model = fit_catalog_model(pd.read_csv(source))
+    for i, chunk in enumerate(generate_catalog(model, rows, chunk_rows, seed)):
+        chunk.to_csv(path, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('rows', type=int)
+    parser.add_argument('output')
+    parser.add_argument('--source', default=SOURCE_PATH, help='real catalog to learn the distributions from')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    write_catalog(args.output, args.rows, args.source, args.chunk_rows, args.seed)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""Cube-backed chart aggregations against the same aggregations over the filtered rows."""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import analytics
+
+CATALOG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'netflix_cleaned.csv')
+
+# Tier-aligned ranges are answered from the cube; the others split a score band
+SCORE_RANGES = [(0, 100), (41, 69), (86, 100), (-5, 40), (50, 60), (40, 75), (40.5, 84.5), (95, 99)]
+CUBE_DIMENSIONS = ['type', 'rating', 'year_added', 'month_added', 'quarter_added']
+
+
+@pytest.fixture(scope='module')
+def catalog():
+    df = analytics.read_catalog(CATALOG)
+    return analytics.build_catalog(df, 'test')
+
+
+def make_view(catalog, **fields):
+    query = analytics.CatalogQuery(**fields)
+    return analytics.make_view(catalog, analytics.scored_catalog(catalog, query.profile), query)
+
+
+@pytest.mark.parametrize('score_range', SCORE_RANGES)
+def test_score_ranges_match_row_aggregation(catalog, score_range):
+    view = make_view(catalog, content_score=score_range)
+    rows = analytics.view_frame(view)
+    low, high = score_range
+    assert rows['content_score'].between(low, high).all()
+    expected = analytics.build_cube(rows)
+    cube = analytics.view_cube(view)
+    for dimension in CUBE_DIMENSIONS:
+        pd.testing.assert_series_equal(analytics.cube_counts(cube, dimension),
+                                       analytics.cube_counts(expected, dimension), check_dtype=False)
+    assert int(cube['count'].sum()) == len(rows)
+    assert np.isclose(cube['score_sum'].sum(), rows['content_score'].sum())
+
+
+def test_split_band_falls_back_to_rows(catalog):
+    assert analytics.score_bands_within(50, 60) is None
+    assert analytics.slice_cube(catalog['cube'], {'content_score': (50, 60)}) is None
+    results = analytics.query_catalog(catalog, analytics.CatalogQuery(content_score=(50, 60)),
+                                      ['overview', 'type_counts', 'quality_metrics'])
+    assert results['type_counts'].sum() == results['overview']['total_titles'] > 0
+    assert results['quality_metrics']['min_quality'] >= 50
+    assert results['quality_metrics']['max_quality'] <= 60
+
+
+def test_tier_ranges_stay_on_the_cube(catalog):
+    for low, high in analytics.QUALITY_TIERS.values():
+        assert analytics.slice_cube(catalog['cube'], {'content_score': (low, high)}) is not None
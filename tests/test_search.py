@@ -0,0 +1,75 @@
+"""Typo-tolerant title search against a brute-force edit-distance scan of the vocabulary."""
+import os
+import random
+
+import pytest
+
+import analytics
+
+CATALOG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'netflix_cleaned.csv')
+
+
+@pytest.fixture(scope='module')
+def search():
+    return analytics.build_search_index(analytics.read_catalog(CATALOG))
+
+
+def brute_prefix_distance(query, word, limit):
+    """Plain Levenshtein DP of query against every prefix of word, stopping once all cells exceed limit"""
+    previous = list(range(len(query) + 1))
+    best = previous[-1]
+    for char in word:
+        current = [previous[0] + 1]
+        for row, query_char in enumerate(query, 1):
+            current.append(min(previous[row] + 1, current[row - 1] + 1, previous[row - 1] + (query_char != char)))
+        best = min(best, current[-1])
+        if min(current) > limit:
+            break
+        previous = current
+    return best
+
+
+def brute_fuzzy_words(search, word):
+    max_edits = sum(len(word) >= length for length in analytics.FUZZY_MIN_LENGTHS)
+    if not max_edits:
+        return []
+    return [position for position, candidate in enumerate(search['words'])
+            if brute_prefix_distance(word, candidate, max_edits) <= max_edits]
+
+
+def typo(rng, word):
+    position = rng.randrange(len(word))
+    letter = rng.choice('abcdefghijklmnopqrstuvwxyz')
+    edit = rng.choice(['substitute', 'insert', 'delete'])
+    if edit == 'substitute':
+        return word[:position] + letter + word[position + 1:]
+    if edit == 'insert':
+        return word[:position] + letter + word[position:]
+    return word[:position] + word[position + 1:]
+
+
+def random_queries(search, count, seed=0):
+    rng = random.Random(seed)
+    words = [word for word in search['words'].tolist() if len(word) >= 6 and word.isalpha()]
+    queries = []
+    for word in rng.sample(words, count):
+        query = typo(rng, word)
+        queries.append(typo(rng, query) if len(query) >= analytics.FUZZY_MIN_LENGTHS[1] else query)
+    return queries
+
+
+@pytest.mark.parametrize('word', ['farry', 'pegry', 'brman'])
+def test_fuzzy_words_keep_every_close_word(search, word):
+    assert analytics.fuzzy_words(search, word).tolist() == brute_fuzzy_words(search, word)
+
+
+def test_fuzzy_words_match_brute_force_on_random_typos(search):
+    for word in random_queries(search, 60):
+        assert analytics.fuzzy_words(search, word).tolist() == brute_fuzzy_words(search, word), word
+
+
+def test_prefix_edit_distances_match_brute_force(search):
+    words = search['words'][::97]
+    for query in ['farry', 'stranger', 'wonderlnd', 'ab']:
+        expected = [min(brute_prefix_distance(query, word, 2), 3) for word in words]
+        assert [min(int(d), 3) for d in analytics.prefix_edit_distances(query, words, 2)] == expected